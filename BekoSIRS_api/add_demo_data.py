@@ -8,6 +8,7 @@ os.environ.setdefault("DJANGO_SETTINGS_MODULE", "bekosirs_backend.settings")
 django.setup()
 
 from products.models import Product, ProductAssignment, CustomUser
+from products.services.sales_aggregates import rebuild_sales_aggregates
 
 def create_demo_data():
     ProductAssignment.objects.all().delete()
@@ -36,6 +37,7 @@ def create_demo_data():
                 product=prod,
                 customer=user,
                 quantity=1,
+                unit_price=prod.price,
                 status='DELIVERED',
                 assigned_by=user,
                 assigned_at=now - timedelta(days=days_ago)
@@ -86,6 +88,7 @@ def create_demo_data():
                 product=p,
                 customer=user,
                 quantity=monthly_sales,
+                unit_price=p.price,
                 status='DELIVERED',
                 assigned_by=user,
                 assigned_at=target_date
@@ -101,6 +104,9 @@ def create_demo_data():
     finally:
         field.auto_now_add = old_auto_now_add
 
+    # bulk_create sinyal tetiklemez; aylık satış özetini yeniden hesapla
+    rebuild_sales_aggregates()
+
     print("Demo data setup complete!")
 
 if __name__ == '__main__':
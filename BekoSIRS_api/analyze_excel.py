@@ -1,62 +1,124 @@
+import gc
+import hashlib
 import pandas as pd
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 
-# Try importing xlrd, if implies dependency issue, we might need to install it
+# python-calamine (Rust) reads both legacy .xls (BIFF) and .xlsx, so xlrd is not needed.
 try:
-    import xlrd
+    from python_calamine import CalamineWorkbook
 except ImportError:
-    print("xlrd not found. Please install it.")
-    # In this environment I cannot install easily? 
-    # I will rely on run_command to output error and then I might suggest user to install or I try pip install
-    pass
+    print("python-calamine not found. Please install it: pip install python-calamine")
+    sys.exit(1)
 
 file_path = '/Users/remzi/Desktop/BekoSIRS/BekoSIRS_api/bekoproducts.xls'
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
 
-try:
+
+def file_digest(path):
+    """sha1 of the workbook bytes + mtime, used as the parsed-sheet cache key."""
+    h = hashlib.sha1()
+    with open(path, 'rb') as fh:
+        for block in iter(lambda: fh.read(1 << 20), b''):
+            h.update(block)
+    h.update(str(os.path.getmtime(path)).encode())
+    return h.hexdigest()
+
+
+def load_sheet(path, sheet, digest):
+    """Return the parsed sheet, reusing a pickled copy when the workbook is unchanged."""
+    safe_name = hashlib.sha1(sheet.encode('utf-8')).hexdigest()[:12]
+    cache_path = os.path.join(CACHE_DIR, f"{digest}-{safe_name}.pkl")
+    if os.path.exists(cache_path):
+        return pd.read_pickle(cache_path)
+    df = pd.read_excel(path, sheet_name=sheet, engine="calamine")
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df.to_pickle(cache_path)
+    return df
+
+
+def profile_sheet(path, digest, sheet):
+    """Parse and profile one sheet, returning its formatted report block."""
+    parts = [f"\n{'='*50}\nSHEET: {sheet}\n{'='*50}\n"]
+    df = load_sheet(path, sheet, digest)
+
+    parts.append(f"Shape: {df.shape} (Rows, Columns)\n")
+    parts.append(f"Columns: {list(df.columns)}\n\n")
+
+    parts.append("--- Data Types ---\n")
+    parts.append(df.dtypes.to_string())
+    parts.append("\n\n")
+
+    parts.append("--- Missing Values ---\n")
+    parts.append(df.isnull().sum().to_string())
+    parts.append("\n\n")
+
+    parts.append("--- Sample Data (First 5) ---\n")
+    parts.append(df.head().to_string())
+    parts.append("\n\n")
+
+    if len(df.columns):
+        # unique/top/freq for every column in one frame-level call.
+        parts.append("--- Summary ---\n")
+        parts.append(df.describe(include='all').to_string())
+        parts.append("\n\n")
+
+    # Basic profiling
+    parts.append("--- Column Profiling ---\n")
+    # One vectorized pass for all counts; unique() only for low-cardinality columns,
+    # run on the backing ndarrays so pd.unique skips Series construction.
+    nuniques = df.nunique()
+    small_values = {
+        col: pd.unique(df[col].to_numpy()).tolist()
+        for col in nuniques.index[nuniques < 10]
+    }
+    for col, unique_count in nuniques.items():
+        parts.append(f"{col}: {unique_count} unique values\n")
+        if col in small_values:
+            parts.append(f"   Values: {small_values[col]}\n")
+    parts.append("\n")
+
+    del df, small_values
+    gc.collect()
+    return "".join(parts)
+
+
+def main():
     if not os.path.exists(file_path):
         print(f"File NOT found at {file_path}")
         sys.exit(1)
-        
+
     print(f"Reading {file_path}...")
-    xls = pd.ExcelFile(file_path)
-    sheet_names = xls.sheet_names
+    # Only the sheet names are needed up front; each sheet is parsed on its own
+    # so resident memory per worker peaks at one sheet rather than the whole workbook.
+    wb = CalamineWorkbook.from_path(file_path)
+    sheet_names = wb.sheet_names
+    del wb
+    digest = file_digest(file_path)
     print(f"Sheets found: {sheet_names}")
 
-    with open('excel_analysis_output.txt', 'w') as f:
-        f.write(f"File: {file_path}\n")
-        f.write(f"Sheets: {sheet_names}\n")
-        
-        for sheet in sheet_names:
-            f.write(f"\n{'='*50}\nSHEET: {sheet}\n{'='*50}\n")
-            df = pd.read_excel(xls, sheet_name=sheet)
-            
-            f.write(f"Shape: {df.shape} (Rows, Columns)\n")
-            f.write(f"Columns: {list(df.columns)}\n\n")
-            
-            f.write("--- Data Types ---\n")
-            f.write(df.dtypes.to_string())
-            f.write("\n\n")
-            
-            f.write("--- Missing Values ---\n")
-            f.write(df.isnull().sum().to_string())
-            f.write("\n\n")
-            
-            f.write("--- Sample Data (First 5) ---\n")
-            f.write(df.head().to_string())
-            f.write("\n\n")
-            
-            # Basic profiling
-            f.write("--- Column Profiling ---\n")
-            for col in df.columns:
-                unique_count = df[col].nunique()
-                f.write(f"{col}: {unique_count} unique values\n")
-                if unique_count < 10:
-                    f.write(f"   Values: {list(df[col].unique())}\n")
-            f.write("\n")
+    parts = [f"File: {file_path}\n", f"Sheets: {sheet_names}\n"]
+
+    # Sheets are independent, so profile them concurrently; map() keeps sheet order.
+    if len(sheet_names) > 1:
+        with ProcessPoolExecutor(max_workers=min(len(sheet_names), os.cpu_count() or 1)) as ex:
+            parts.extend(ex.map(partial(profile_sheet, file_path, digest), sheet_names))
+    else:
+        parts.extend(profile_sheet(file_path, digest, sheet) for sheet in sheet_names)
+
+    # Build the report in memory and emit it with a single buffered write.
+    report = "".join(parts)
+    with open('excel_analysis_output.txt', 'w', buffering=1 << 20) as f:
+        f.write(report)
 
     print("Analysis complete. Check excel_analysis_output.txt")
-    print(open('excel_analysis_output.txt').read())
+    print(report)
+
 
-except Exception as e:
-    print(f"Error: {e}")
+if __name__ == '__main__':
+    try:
+        main()
+    except Exception as e:
+        print(f"Error: {e}")
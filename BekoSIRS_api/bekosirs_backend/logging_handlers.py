@@ -0,0 +1,90 @@
+"""
+Non-blocking log handlers.
+
+Request threads only push records onto an in-memory queue; a background
+QueueListener thread does the actual file writes and size-based rotation, so
+disk I/O and the rotation stall stay off the request path.
+
+The handler deliberately subclasses logging.Handler rather than
+logging.handlers.QueueHandler: from Python 3.12 dictConfig treats QueueHandler
+subclasses specially (expects 'queue'/'listener' keys) and rejects this one.
+"""
+
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueListener, RotatingFileHandler
+
+
+class QueuedRotatingFileHandler(logging.Handler):
+    """
+    Drop-in replacement for RotatingFileHandler in the LOGGING dict.
+
+    Accepts the same arguments. The formatter and level configured on this
+    handler are applied before the record is queued. The listener thread is
+    started lazily per process, so it also survives pre-fork servers.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False):
+        super().__init__()
+        self.queue = queue.SimpleQueue()
+        self.target = RotatingFileHandler(
+            filename,
+            mode=mode,
+            maxBytes=maxBytes,
+            backupCount=backupCount,
+            encoding=encoding,
+            delay=delay,
+        )
+        self._listener = None
+        self._listener_pid = None
+        self._listener_lock = threading.Lock()
+
+    def _ensure_listener(self):
+        pid = os.getpid()
+        if self._listener_pid == pid:
+            return
+        with self._listener_lock:
+            if self._listener_pid == pid:
+                return
+            # After a fork the parent's listener thread does not exist in this
+            # process; start a fresh one on a fresh queue.
+            if self._listener_pid is not None:
+                self.queue = queue.SimpleQueue()
+            self._listener = QueueListener(self.queue, self.target)
+            self._listener.start()
+            self._listener_pid = pid
+            atexit.register(self._stop_listener)
+
+    def _stop_listener(self):
+        if self._listener is not None and self._listener_pid == os.getpid():
+            self._listener.stop()
+            self._listener = None
+            self._listener_pid = None
+
+    def prepare(self, record):
+        """Format here (as QueueHandler does) so the queued record is picklable and final."""
+        msg = self.format(record)
+        record = copy.copy(record)
+        record.message = msg
+        record.msg = msg
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        record.stack_info = None
+        return record
+
+    def emit(self, record):
+        try:
+            self._ensure_listener()
+            self.queue.put_nowait(self.prepare(record))
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        self._stop_listener()
+        self.target.close()
+        super().close()
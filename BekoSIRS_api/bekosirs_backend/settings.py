@@ -2,29 +2,39 @@
 import os
 from pathlib import Path
 from datetime import timedelta
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 
 # Load environment variables from .env file and prefer local values in development.
-load_dotenv(override=True)
+# Parsed once without ${VAR} interpolation; other modules still read os.environ.
+os.environ.update({k: v for k, v in dotenv_values(interpolate=False).items() if v is not None})
+
+
+def _env_bool(name, default):
+    """Parse a boolean flag from the environment ('true', '1', 'yes')."""
+    return os.getenv(name, default).lower() in ('true', '1', 'yes')
+
+
+def _env_list(name, default):
+    """Parse a comma-separated environment value into an immutable tuple."""
+    return tuple(item.strip() for item in os.getenv(name, default).split(',') if item.strip())
+
 
 # ------------------------------------------------------------
 # BASE CONFIG
 # ------------------------------------------------------------
-BASE_DIR = Path(__file__).resolve().parent.parent
+# __file__ is already absolute for imported modules; skipping resolve() avoids a stat at import.
+BASE_DIR = Path(__file__).parent.parent
 
 # Security: Load from environment variables
 # SECRET_KEY is REQUIRED - Django will not start without it
 SECRET_KEY = os.environ['SECRET_KEY']
 
 # DEBUG defaults to False for security (must explicitly enable in development)
-DEBUG = os.getenv('DEBUG', 'False').lower() in ('true', '1', 'yes')
+DEBUG = _env_bool('DEBUG', 'False')
 
-# ALLOWED_HOSTS: Parse from environment variable (comma-separated list)
-# Default to localhost only for security
-_allowed_hosts = os.getenv('ALLOWED_HOSTS', '*')
-ALLOWED_HOSTS = ['*']
-# Add local network IPs for mobile development access via .env
-# Example: ALLOWED_HOSTS=localhost,127.0.0.1,192.168.0.107
+# ALLOWED_HOSTS: currently open to every host so mobile devices on the local
+# network can reach the API. The ALLOWED_HOSTS env variable is not read here.
+ALLOWED_HOSTS = ('*',)
 
 
 # ------------------------------------------------------------
@@ -103,6 +113,8 @@ _db_user = os.getenv('DB_USER')
 _db_password = os.getenv('DB_PASSWORD')
 _db_host = os.getenv('DB_HOST')
 _db_port = os.getenv('DB_PORT')
+# Keep connections open across requests instead of reconnecting (TLS + auth) every time.
+_db_conn_max_age = int(os.getenv('DB_CONN_MAX_AGE', '60'))
 
 if all([_db_name, _db_user, _db_password, _db_host]):
     if _db_engine.lower() in ['postgresql', 'django.db.backends.postgresql', 'postgres']:
@@ -114,6 +126,8 @@ if all([_db_name, _db_user, _db_password, _db_host]):
                 'PASSWORD': _db_password,
                 'HOST': _db_host,
                 'PORT': _db_port or '5432',
+                'CONN_MAX_AGE': _db_conn_max_age,
+                'CONN_HEALTH_CHECKS': True,
             }
         }
     else:
@@ -125,6 +139,8 @@ if all([_db_name, _db_user, _db_password, _db_host]):
                 'PASSWORD': _db_password,
                 'HOST': _db_host,
                 'PORT': _db_port or '1433',
+                'CONN_MAX_AGE': _db_conn_max_age,
+                'CONN_HEALTH_CHECKS': True,
                 'OPTIONS': {
                     'driver': 'ODBC Driver 18 for SQL Server',
                     'extra_params': 'Encrypt=no;TrustServerCertificate=yes',
@@ -146,30 +162,35 @@ else:
 STATIC_URL = '/static/'
 
 MEDIA_URL = '/media/'
-MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+MEDIA_ROOT = BASE_DIR / 'media'
 
 # ------------------------------------------------------------
 # CORS CONFIGURATION
 # ------------------------------------------------------------
 # CORS_ALLOW_ALL_ORIGINS defaults to False for security
 # Set to True only in development via .env
-CORS_ALLOW_ALL_ORIGINS = os.getenv('CORS_ALLOW_ALL_ORIGINS', 'False').lower() in ('true', '1', 'yes')
+CORS_ALLOW_ALL_ORIGINS = _env_bool('CORS_ALLOW_ALL_ORIGINS', 'False')
 CORS_ALLOW_CREDENTIALS = True
 
 # Parse CORS origins from environment variable
-_cors_origins = os.getenv('CORS_ALLOWED_ORIGINS', 'http://localhost:5173,http://localhost:8081')
-CORS_ALLOWED_ORIGINS = [origin.strip() for origin in _cors_origins.split(',') if origin.strip()]
+# Kept as a tuple: parsed once per process and frozen against accidental mutation.
+CORS_ALLOWED_ORIGINS = _env_list('CORS_ALLOWED_ORIGINS', 'http://localhost:5173,http://localhost:8081')
 
 # ------------------------------------------------------------
 # REST FRAMEWORK + JWT
 # ------------------------------------------------------------
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': (
-        'rest_framework_simplejwt.authentication.JWTAuthentication',
+        'products.authentication.CachedJWTAuthentication',
     ),
     'DEFAULT_PERMISSION_CLASSES': (
         'rest_framework.permissions.IsAuthenticated',
     ),
+    # orjson-backed JSON output (same wire format as DRF's JSONRenderer)
+    'DEFAULT_RENDERER_CLASSES': (
+        'bekosirs_backend.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
     # Enable search, filtering, and ordering
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -195,6 +216,10 @@ REST_FRAMEWORK = {
 # ------------------------------------------------------------
 # API DOCUMENTATION (drf-spectacular)
 # ------------------------------------------------------------
+# Build-time schema artifact (`python manage.py spectacular --file schema.yml`).
+# When present, /api/v1/schema/ serves it instead of re-introspecting every view.
+SPECTACULAR_SCHEMA_FILE = BASE_DIR / 'schema.yml'
+
 SPECTACULAR_SETTINGS = {
     'TITLE': 'BekoSIRS API',
     'DESCRIPTION': 'Beko Smart Inventory and Recommendation System API',
@@ -219,11 +244,18 @@ SPECTACULAR_SETTINGS = {
 # ------------------------------------------------------------
 # Using LocMemCache for development (no external dependencies)
 # For production, switch to Redis by setting REDIS_URL env var
+# The Redis client uses the hiredis C parser automatically when it is installed, and
+# Django's RedisSerializer pickles with HIGHEST_PROTOCOL (5), so large payloads such
+# as recommendation lists are stored without extra buffer copies.
 if os.getenv('REDIS_URL'):
     CACHES = {
         'default': {
             'BACKEND': 'django.core.cache.backends.redis.RedisCache',
             'LOCATION': os.environ['REDIS_URL'],
+            'OPTIONS': {
+                # Passed to the per-process redis ConnectionPool
+                'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', '50')),
+            },
         }
     }
 else:
@@ -241,7 +273,7 @@ CACHE_TTL_LONG = 60 * 60 * 2  # 2 hours
 
 # ML Model Retraining Configuration
 ML_RETRAIN_INTERVAL_HOURS = int(os.getenv('ML_RETRAIN_INTERVAL_HOURS', '6'))
-ML_AUTO_RETRAIN = os.getenv('ML_AUTO_RETRAIN', 'True').lower() in ('true', '1', 'yes')
+ML_AUTO_RETRAIN = _env_bool('ML_AUTO_RETRAIN', 'True')
 
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(hours=12),
@@ -251,6 +283,12 @@ SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
 }
 
+# Seconds a JWT-authenticated user stays cached between requests (0 disables).
+# Only on by default with the shared Redis cache: with per-process LocMemCache the
+# invalidation signal clears just one gunicorn worker, so the others would keep
+# accepting deactivated users / stale roles until the entry expires.
+AUTH_USER_CACHE_TTL = int(os.getenv('AUTH_USER_CACHE_TTL', '60' if os.getenv('REDIS_URL') else '0'))
+
 # ------------------------------------------------------------
 # PASSWORD VALIDATION
 # ------------------------------------------------------------
@@ -289,14 +327,23 @@ if os.getenv('EMAIL_HOST'):
     EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
     EMAIL_HOST = os.environ['EMAIL_HOST']
     EMAIL_PORT = int(os.getenv('EMAIL_PORT', '587'))
-    EMAIL_USE_TLS = os.getenv('EMAIL_USE_TLS', 'True').lower() in ('true', '1', 'yes')
+    EMAIL_USE_TLS = _env_bool('EMAIL_USE_TLS', 'True')
     EMAIL_HOST_USER = os.getenv('EMAIL_HOST_USER', '')
     EMAIL_HOST_PASSWORD = os.getenv('EMAIL_HOST_PASSWORD', '')
+    # Bound connect/read waits so an unreachable relay fails fast instead of
+    # holding a send worker on the OS default socket timeout
+    EMAIL_TIMEOUT = int(os.getenv('EMAIL_TIMEOUT', '10'))
 else:
     # Development: print emails to console
     EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
 DEFAULT_FROM_EMAIL = os.getenv('DEFAULT_FROM_EMAIL', 'BekoSIRS <noreply@bekosirs.com>')
+
+# Hand SMTP delivery to a small background thread pool so requests do not
+# wait on the mail server (products.email_service.EmailService).
+EMAIL_SEND_ASYNC = _env_bool('EMAIL_SEND_ASYNC', 'True')
+# Background sends retry dropped/refused SMTP connections with backoff
+EMAIL_SEND_RETRIES = int(os.getenv('EMAIL_SEND_RETRIES', '3'))
 PASSWORD_RESET_TIMEOUT = 3600  # 1 hour in seconds
 
 # Frontend URL for password reset links (used in emails)
@@ -363,9 +410,11 @@ LOGGING = {
             'class': 'logging.StreamHandler',
             'formatter': 'simple',
         },
+        # File handlers enqueue records; a background QueueListener writes and rotates,
+        # so request threads never block on disk I/O (see logging_handlers.py).
         'file': {
             'level': 'INFO',
-            'class': 'logging.handlers.RotatingFileHandler',
+            'class': 'bekosirs_backend.logging_handlers.QueuedRotatingFileHandler',
             'filename': BASE_DIR / 'logs' / 'bekosirs.log',
             'maxBytes': 1024 * 1024 * 10,  # 10 MB
             'backupCount': 5,
@@ -373,7 +422,7 @@ LOGGING = {
         },
         'error_file': {
             'level': 'ERROR',
-            'class': 'logging.handlers.RotatingFileHandler',
+            'class': 'bekosirs_backend.logging_handlers.QueuedRotatingFileHandler',
             'filename': BASE_DIR / 'logs' / 'errors.log',
             'maxBytes': 1024 * 1024 * 10,  # 10 MB
             'backupCount': 5,
@@ -10,7 +10,7 @@ from pathlib import Path
 
 from .settings import *  # noqa: F401,F403 - test settings intentionally extend the main config.
 
-BASE_DIR = Path(__file__).resolve().parent.parent
+BASE_DIR = Path(__file__).parent.parent
 
 # Force an isolated SQLite database for pytest so every run uses the current
 # model schema instead of a stale external database.
@@ -30,3 +30,8 @@ PASSWORD_HASHERS = [
 ML_AUTO_RETRAIN = False
 ML_DISABLE_BACKGROUND_JOBS = True
 EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+EMAIL_SEND_ASYNC = False
+
+# Test cases reuse primary keys across rolled-back transactions, which never
+# fire the invalidation signals, so a cached user could leak between cases.
+AUTH_USER_CACHE_TTL = 0
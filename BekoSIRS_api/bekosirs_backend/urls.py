@@ -1,11 +1,17 @@
 import os
+from functools import lru_cache
+
+import yaml
 from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.http import JsonResponse
 from django.db import connection
+from django.views.decorators.cache import cache_page
+from drf_spectacular.utils import extend_schema
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
+from rest_framework.response import Response
 
 
 def health_check(request):
@@ -24,6 +30,31 @@ def health_check(request):
     }, status=status)
 
 
+@lru_cache(maxsize=1)
+def _load_prebuilt_schema():
+    """Schema written at build time by `manage.py spectacular --file`, or None."""
+    schema_file = settings.SPECTACULAR_SCHEMA_FILE
+    if not schema_file.exists():
+        return None
+    with open(schema_file, encoding='utf-8') as fh:
+        return yaml.safe_load(fh)
+
+
+class PrebuiltSchemaView(SpectacularAPIView):
+    """
+    Serves the build-time schema artifact instead of introspecting every view
+    per request; in DEBUG or when the file is missing it generates the schema live
+    so a stale local schema.yml is never served during development.
+    """
+
+    @extend_schema(exclude=True)
+    def get(self, request, *args, **kwargs):
+        schema = None if settings.DEBUG else _load_prebuilt_schema()
+        if schema is None:
+            return super().get(request, *args, **kwargs)
+        return Response(schema)
+
+
 urlpatterns = [
     # Security: Admin URL changed from predictable '/admin/' to secure path
     path(os.getenv('ADMIN_PATH', 'secure-backend-panel-2026/'), admin.site.urls),
@@ -38,7 +69,7 @@ urlpatterns = [
     path("api-auth/", include("rest_framework.urls", namespace="rest_framework")),
 
     # API Documentation (v1)
-    path('api/v1/schema/', SpectacularAPIView.as_view(), name='schema'),
+    path('api/v1/schema/', cache_page(settings.CACHE_TTL_LONG)(PrebuiltSchemaView.as_view()), name='schema'),
     path('api/v1/docs/', SpectacularSwaggerView.as_view(url_name='schema'), name='swagger-ui'),
     path('api/v1/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
 ]
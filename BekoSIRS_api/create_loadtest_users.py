@@ -5,35 +5,35 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bekosirs_backend.settings')
 import django
 django.setup()
 
+from django.contrib.auth.hashers import make_password
+
 from products.models import CustomUser
 
-# Create admin user for load testing
-admin, created = CustomUser.objects.get_or_create(username='loadtest_admin')
-if created or not admin.check_password('LoadAdmin123!'):
-    admin.set_password('LoadAdmin123!')
-    admin.is_staff = True
-    admin.is_superuser = True
-    admin.role = 'admin'
-    admin.email = 'loadtest_admin@test.com'
-    admin.first_name = 'Load'
-    admin.last_name = 'Admin'
-    admin.save()
-    print(f"Admin created: loadtest_admin / LoadAdmin123!")
-else:
-    print(f"Admin already exists: loadtest_admin")
-
-# Create customer user for load testing
-customer, created = CustomUser.objects.get_or_create(username='loadtest_customer')
-if created or not customer.check_password('LoadCustomer123!'):
-    customer.set_password('LoadCustomer123!')
-    customer.role = 'customer'
-    customer.email = 'loadtest_customer@test.com'
-    customer.first_name = 'Load'
-    customer.last_name = 'Customer'
-    customer.save()
-    print(f"Customer created: loadtest_customer / LoadCustomer123!")
-else:
-    print(f"Customer already exists: loadtest_customer")
+# One upsert per account; passwords are hashed up front instead of
+# check_password + set_password + save on an already-fetched row.
+LOADTEST_USERS = [
+    ('loadtest_admin', 'LoadAdmin123!', {
+        'is_staff': True,
+        'is_superuser': True,
+        'role': 'admin',
+        'email': 'loadtest_admin@test.com',
+        'first_name': 'Load',
+        'last_name': 'Admin',
+    }),
+    ('loadtest_customer', 'LoadCustomer123!', {
+        'role': 'customer',
+        'email': 'loadtest_customer@test.com',
+        'first_name': 'Load',
+        'last_name': 'Customer',
+    }),
+]
+
+for username, password, fields in LOADTEST_USERS:
+    _, created = CustomUser.objects.update_or_create(
+        username=username,
+        defaults={**fields, 'password': make_password(password)},
+    )
+    print(f"{fields['role'].title()} {'created' if created else 'updated'}: {username} / {password}")
 
 # Verify login works
 import urllib.request, json, urllib.error
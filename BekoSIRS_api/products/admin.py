@@ -1,4 +1,11 @@
+from django.conf import settings
 from django.contrib import admin
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models import Count
+from django.views.decorators.cache import cache_page
+from django.views.decorators.vary import vary_on_cookie
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from .models import (
     CustomUser, Category, Product, ProductOwnership, UserActivity,
@@ -6,6 +13,38 @@ from .models import (
     ServiceRequest, ServiceQueue, Notification, Recommendation,
     CustomerAddress, UserNotificationPreference
 )
+from .signals import ADMIN_CHANGELIST_GENERATION_KEY
+
+
+class CachedChangelistMixin:
+    """
+    Okuma ağırlıklı changelist sayfalarını CACHE_TTL_SHORT süresince önbellekte tutar.
+    Önbellek oturum çerezine göre ayrılır (kullanıcılar birbirinin sayfasını görmez).
+    Kayıt eklendiğinde/silindiğinde products.signals nesil sayacını artırır ve
+    önbellek anahtarı değiştiği için sayfa yeniden oluşturulur.
+    Nesil sayacı yalnızca paylaşılan önbellekte (Redis) tüm worker'lara ulaştığından
+    süreç içi LocMem/Dummy önbellekte sayfa önbelleğe alınmaz.
+    """
+
+    def changelist_view(self, request, extra_context=None):
+        # Toplu işlemler (actions) POST ile gelir; bunlar önbelleğe alınmaz.
+        if request.method != 'GET' or isinstance(caches['default'], (LocMemCache, DummyCache)):
+            return super().changelist_view(request, extra_context)
+        label = self.model._meta.label_lower
+        generation = cache.get_or_set(ADMIN_CHANGELIST_GENERATION_KEY.format(label), 0, None)
+        view = cache_page(
+            settings.CACHE_TTL_SHORT,
+            key_prefix=f'admin-changelist:{label}:{generation}',
+        )(vary_on_cookie(lambda req: self._render_changelist(req, extra_context)))
+        return view(request)
+
+    def _render_changelist(self, request, extra_context):
+        # admin_view, yanıtı never_cache ile "private" işaretler; cache_page'in yanıtı
+        # saklayabilmesi için TemplateResponse burada, o başlıklardan önce render edilir.
+        response = super().changelist_view(request, extra_context)
+        if hasattr(response, 'render'):
+            response.render()
+        return response
 
 
 class UserNotificationPreferenceInline(admin.StackedInline):
@@ -34,13 +73,14 @@ class CustomUserAdmin(BaseUserAdmin):
 
 
 @admin.register(Category)
-class CategoryAdmin(admin.ModelAdmin):
+class CategoryAdmin(CachedChangelistMixin, admin.ModelAdmin):
     list_display = ('name',)
 
 
 @admin.register(Product)
-class ProductAdmin(admin.ModelAdmin):
+class ProductAdmin(CachedChangelistMixin, admin.ModelAdmin):
     list_display = ('name', 'brand', 'category', 'price', 'stock', 'warranty_duration_months')
+    list_select_related = ('category',)
     list_filter = ('category', 'brand')
     # search_fields: Üstteki arama kutusunun hangi alanlarda arama yapacağını belirler.
     search_fields = ('name', 'description')
@@ -49,6 +89,13 @@ class ProductAdmin(admin.ModelAdmin):
 @admin.register(ProductOwnership)
 class ProductOwnershipAdmin(admin.ModelAdmin):
     list_display = ('customer', 'product', 'purchase_date', 'warranty_end_date')
+    # list_select_related: Listede gösterilen ilişkili kayıtları tek bir JOIN sorgusuyla çeker
+    # (her satır için ayrı sorgu atılmasını, yani N+1 problemini önler).
+    list_select_related = ('customer', 'product')
+    # raw_id_fields: Düzenleme formunda tüm kullanıcı/ürünleri <select> içine yüklemek yerine
+    # sadece ID kutusu + arama penceresi gösterir (büyük tablolarda form açılışını hızlandırır).
+    raw_id_fields = ('customer', 'product')
+    list_per_page = 50
     list_filter = ('purchase_date',)
     search_fields = ('customer__username', 'product__name', 'serial_number')
 
@@ -56,6 +103,9 @@ class ProductOwnershipAdmin(admin.ModelAdmin):
 @admin.register(UserActivity)
 class UserActivityAdmin(admin.ModelAdmin):
     list_display = ('user', 'product', 'activity_type', 'timestamp')
+    list_select_related = ('user', 'product')
+    raw_id_fields = ('user', 'product')
+    list_per_page = 50
     list_filter = ('activity_type', 'timestamp')
 
 
@@ -72,13 +122,24 @@ class WishlistItemInline(admin.TabularInline):
 @admin.register(Wishlist)
 class WishlistAdmin(admin.ModelAdmin):
     list_display = ('customer', 'item_count', 'created_at', 'updated_at')
+    list_select_related = ('customer',)
     search_fields = ('customer__username',)
     inlines = [WishlistItemInline]
 
+    def get_queryset(self, request):
+        # Ürün sayısı satır başına COUNT yerine tek bir GROUP BY ile hesaplanır.
+        return super().get_queryset(request).annotate(_item_count=Count('items'))
+
+    @admin.display(ordering='_item_count', description='Ürün Sayısı')
+    def item_count(self, obj):
+        return obj._item_count
+
 
 @admin.register(WishlistItem)
 class WishlistItemAdmin(admin.ModelAdmin):
     list_display = ('wishlist', 'product', 'added_at', 'notify_on_price_drop', 'notify_on_restock')
+    list_select_related = ('wishlist__customer', 'product')
+    raw_id_fields = ('wishlist', 'product')
     list_filter = ('notify_on_price_drop', 'notify_on_restock', 'added_at')
     search_fields = ('wishlist__customer__username', 'product__name')
 
@@ -86,6 +147,9 @@ class WishlistItemAdmin(admin.ModelAdmin):
 @admin.register(ViewHistory)
 class ViewHistoryAdmin(admin.ModelAdmin):
     list_display = ('customer', 'product', 'view_count', 'viewed_at')
+    list_select_related = ('customer', 'product')
+    raw_id_fields = ('customer', 'product')
+    list_per_page = 50
     list_filter = ('viewed_at',)
     search_fields = ('customer__username', 'product__name')
 
@@ -93,6 +157,8 @@ class ViewHistoryAdmin(admin.ModelAdmin):
 @admin.register(Review)
 class ReviewAdmin(admin.ModelAdmin):
     list_display = ('customer', 'product', 'rating', 'is_approved', 'created_at')
+    list_select_related = ('customer', 'product')
+    raw_id_fields = ('customer', 'product')
     list_filter = ('rating', 'is_approved', 'created_at')
     search_fields = ('customer__username', 'product__name', 'comment')
     # actions: Birden fazla kaydı seçip tek tıkla toplu işlem yapmamızı sağlar.
@@ -111,6 +177,9 @@ class ServiceQueueInline(admin.StackedInline):
 @admin.register(ServiceRequest)
 class ServiceRequestAdmin(admin.ModelAdmin):
     list_display = ('id', 'customer', 'get_product_name', 'request_type', 'status', 'assigned_to', 'created_at')
+    list_select_related = ('customer', 'assigned_to', 'product_ownership__product')
+    raw_id_fields = ('customer', 'product_ownership', 'product_assignment', 'assigned_to')
+    list_per_page = 50
     list_filter = ('status', 'request_type', 'created_at')
     search_fields = ('customer__username', 'product_ownership__product__name', 'description')
     inlines = [ServiceQueueInline]
@@ -123,6 +192,8 @@ class ServiceRequestAdmin(admin.ModelAdmin):
 @admin.register(ServiceQueue)
 class ServiceQueueAdmin(admin.ModelAdmin):
     list_display = ('queue_number', 'service_request', 'priority', 'estimated_wait_time', 'entered_queue_at')
+    list_select_related = ('service_request',)
+    raw_id_fields = ('service_request',)
     list_filter = ('priority', 'entered_queue_at')
     ordering = ('priority', 'entered_queue_at')
 
@@ -130,6 +201,9 @@ class ServiceQueueAdmin(admin.ModelAdmin):
 @admin.register(Notification)
 class NotificationAdmin(admin.ModelAdmin):
     list_display = ('user', 'notification_type', 'title', 'is_read', 'created_at')
+    list_select_related = ('user',)
+    raw_id_fields = ('user', 'related_product', 'related_service_request')
+    list_per_page = 50
     list_filter = ('notification_type', 'is_read', 'created_at')
     search_fields = ('user__username', 'title', 'message')
 
@@ -137,5 +211,8 @@ class NotificationAdmin(admin.ModelAdmin):
 @admin.register(Recommendation)
 class RecommendationAdmin(admin.ModelAdmin):
     list_display = ('customer', 'product', 'score', 'reason', 'is_shown', 'clicked', 'created_at')
+    list_select_related = ('customer', 'product')
+    raw_id_fields = ('customer', 'product')
+    list_per_page = 50
     list_filter = ('is_shown', 'clicked', 'created_at')
     search_fields = ('customer__username', 'product__name', 'reason')
@@ -4,10 +4,16 @@ from django.apps import AppConfig
 class ProductsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'products'
+    _signals_loaded = False
 
     def ready(self):
+        # ready() can run more than once (autoreload, test runners); signal handlers
+        # also carry dispatch_uid so each save fires every handler exactly once.
+        if ProductsConfig._signals_loaded:
+            return
         # Import signals to register them
         import products.signals
+        ProductsConfig._signals_loaded = True
 
         # Start periodic ML retraining (only in the main runserver process)
         self._start_ml_retraining_scheduler()
@@ -0,0 +1,32 @@
+# products/authentication.py
+# JWT authentication that avoids a user SELECT on every request
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.settings import api_settings
+
+from products.signals import AUTH_USER_CACHE_KEY
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication with the token's user cached by id.
+
+    Only users that passed the stock checks (exists, active, password hash)
+    are cached; products.signals drops the entry whenever the user row is
+    saved or deleted. AUTH_USER_CACHE_TTL = 0 disables the cache.
+    """
+
+    def get_user(self, validated_token):
+        ttl = getattr(settings, 'AUTH_USER_CACHE_TTL', 60)
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if not ttl or user_id is None:
+            return super().get_user(validated_token)
+
+        key = AUTH_USER_CACHE_KEY.format(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(validated_token)
+            cache.set(key, user, ttl)
+        return user
@@ -7,6 +7,7 @@ Provides reusable test data for users, products, categories, etc.
 import pytest
 from decimal import Decimal
 from datetime import date, timedelta
+from django.contrib.auth.hashers import make_password
 from django.test import TestCase
 from rest_framework.test import APIClient
 
@@ -22,65 +23,71 @@ class BaseTestCase(TestCase):
     @classmethod
     def setUpTestData(cls):
         """Create shared test data for all test methods."""
-        # Create users with different roles
-        cls.admin_user = CustomUser.objects.create_user(
-            username='test_admin',
-            email='admin@test.com',
-            password='AdminPass123!',
-            first_name='Admin',
-            last_name='User',
-            role='admin'
-        )
-        cls.seller_user = CustomUser.objects.create_user(
-            username='test_seller',
-            email='seller@test.com',
-            password='SellerPass123!',
-            first_name='Seller',
-            last_name='User',
-            role='seller'
-        )
-        cls.customer_user = CustomUser.objects.create_user(
-            username='test_customer',
-            email='customer@test.com',
-            password='CustomerPass123!',
-            first_name='Customer',
-            last_name='User',
-            role='customer',
-            phone_number='+905551234567'
-        )
+        # Create users with different roles (one INSERT per table via bulk_create)
+        cls.admin_user, cls.seller_user, cls.customer_user = CustomUser.objects.bulk_create([
+            CustomUser(
+                username='test_admin',
+                email='admin@test.com',
+                password=make_password('AdminPass123!'),
+                first_name='Admin',
+                last_name='User',
+                role='admin'
+            ),
+            CustomUser(
+                username='test_seller',
+                email='seller@test.com',
+                password=make_password('SellerPass123!'),
+                first_name='Seller',
+                last_name='User',
+                role='seller'
+            ),
+            CustomUser(
+                username='test_customer',
+                email='customer@test.com',
+                password=make_password('CustomerPass123!'),
+                first_name='Customer',
+                last_name='User',
+                role='customer',
+                phone_number='+905551234567'
+            ),
+        ])
 
         # Create categories
-        cls.category_appliances = Category.objects.create(name='Beyaz Eşya')
-        cls.category_electronics = Category.objects.create(name='Elektronik')
+        cls.category_appliances, cls.category_electronics = Category.objects.bulk_create([
+            Category(name='Beyaz Eşya'),
+            Category(name='Elektronik'),
+        ])
 
         # Create products
-        cls.product_fridge = Product.objects.create(
-            name='Buzdolabı Pro',
-            brand='Beko',
-            category=cls.category_appliances,
-            description='Enerji verimli buzdolabı',
-            price=Decimal('15999.99'),
-            stock=10,
-            warranty_duration_months=24
-        )
-        cls.product_washer = Product.objects.create(
-            name='Çamaşır Makinesi',
-            brand='Beko',
-            category=cls.category_appliances,
-            description='Akıllı çamaşır makinesi',
-            price=Decimal('12499.50'),
-            stock=5,
-            warranty_duration_months=36
-        )
-        cls.product_tv = Product.objects.create(
-            name='Smart TV 55"',
-            brand='Grundig',
-            category=cls.category_electronics,
-            description='4K Ultra HD Smart TV',
-            price=Decimal('24999.00'),
-            stock=0,  # Out of stock
-            warranty_duration_months=24
-        )
+        cls.product_fridge, cls.product_washer, cls.product_tv = Product.objects.bulk_create([
+            Product(
+                name='Buzdolabı Pro',
+                brand='Beko',
+                category=cls.category_appliances,
+                description='Enerji verimli buzdolabı',
+                price=Decimal('15999.99'),
+                stock=10,
+                warranty_duration_months=24
+            ),
+            Product(
+                name='Çamaşır Makinesi',
+                brand='Beko',
+                category=cls.category_appliances,
+                description='Akıllı çamaşır makinesi',
+                price=Decimal('12499.50'),
+                stock=5,
+                warranty_duration_months=36
+            ),
+            Product(
+                name='Smart TV 55"',
+                brand='Grundig',
+                category=cls.category_electronics,
+                description='4K Ultra HD Smart TV',
+                price=Decimal('24999.00'),
+                stock=0,  # Out of stock
+                warranty_duration_months=24
+            ),
+        ])
 
     def setUp(self):
         """Set up API client for each test."""
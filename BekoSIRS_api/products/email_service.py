@@ -3,196 +3,153 @@
 Email service utility for sending various email types.
 """
 
+import logging
+import smtplib
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from django.conf import settings
-from django.core.mail import send_mail, EmailMultiAlternatives
+from django.core.mail import get_connection, EmailMultiAlternatives
 from django.template.loader import render_to_string
-from django.utils.html import strip_tags
+
+logger = logging.getLogger(__name__)
+
+# Background senders (EMAIL_SEND_ASYNC). Threads are only started on first use;
+# two workers keep concurrent SMTP connections bounded.
+_send_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='email')
+
+# Connection-level failures worth another attempt; rejected recipients or
+# content errors would fail the same way again.
+_TRANSIENT_SMTP_ERRORS = (smtplib.SMTPConnectError, smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
+
+def _deliver(email, label, retries=0):
+    """
+    Send a prepared message; failures are reported, never raised.
+    Transient connection errors are retried up to `retries` times with
+    exponential backoff (1s, 2s, 4s, ...).
+    """
+    for attempt in range(retries + 1):
+        try:
+            email.send()
+            return True
+        except _TRANSIENT_SMTP_ERRORS:
+            if attempt < retries:
+                time.sleep(2 ** attempt)
+                continue
+            logger.exception("Error sending %s email to %s", label, ', '.join(email.to))
+        except Exception:
+            logger.exception("Error sending %s email to %s", label, ', '.join(email.to))
+            break
+    return False
+
+
+# Relays throttle or drop very long sessions; a fresh connection is opened
+# after this many messages.
+_MESSAGES_PER_CONNECTION = 10000
+
+
+def _deliver_batch(messages, label):
+    """Send prepared messages reusing one SMTP connection per _MESSAGES_PER_CONNECTION messages."""
+    sent = 0
+    for start in range(0, len(messages), _MESSAGES_PER_CONNECTION):
+        chunk = messages[start:start + _MESSAGES_PER_CONNECTION]
+        try:
+            with get_connection() as connection:
+                sent += connection.send_messages(chunk) or 0
+        except Exception:
+            logger.exception("Error sending %s emails (%d messages)", label, len(chunk))
+    return sent
 
 
 class EmailService:
     """
     Service class for sending emails.
     Uses console backend in development, SMTP in production.
+    Messages are rendered in the caller; delivery runs in the background
+    when EMAIL_SEND_ASYNC is enabled.
     """
+
+    @staticmethod
+    def _send(email, label):
+        """Deliver now, or queue for a background thread (returns True once queued)."""
+        if getattr(settings, 'EMAIL_SEND_ASYNC', False):
+            # Retries only off the request thread; a synchronous send never sleeps
+            _send_pool.submit(_deliver, email, label, getattr(settings, 'EMAIL_SEND_RETRIES', 0))
+            return True
+        return _deliver(email, label)
     
     @staticmethod
-    def send_password_reset_email(user, token):
+    def send_bulk(messages, label='bulk'):
         """
-        Send password reset email with token.
+        Send many prepared messages over a single SMTP connection.
         
         Args:
-            user: CustomUser instance
-            token: PasswordResetToken instance
+            messages: list of EmailMessage / EmailMultiAlternatives
+            label: name used in error reports
         
         Returns:
-            bool: True if sent successfully
+            int: number of messages sent (or queued, with EMAIL_SEND_ASYNC)
         """
-        reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token.token}"
-        
-        subject = 'BekoSIRS - Şifre Sıfırlama Talebi'
-        
-        # Plain text message
-        text_message = f"""
-Merhaba {user.first_name or user.username},
-
-Şifrenizi sıfırlamak için bir talep aldık.
-
-Şifrenizi sıfırlamak için aşağıdaki linke tıklayın:
-{reset_url}
-
-Bu link 1 saat içinde geçerliliğini yitirecektir.
-
-Eğer bu talebi siz yapmadıysanız, bu e-postayı görmezden gelebilirsiniz.
+        messages = list(messages)
+        if not messages:
+            return 0
+        if getattr(settings, 'EMAIL_SEND_ASYNC', False):
+            _send_pool.submit(_deliver_batch, messages, label)
+            return len(messages)
+        return _deliver_batch(messages, label)
 
-Saygılarımızla,
-BekoSIRS Ekibi
+    @staticmethod
+    def _build(template, context, subject, to_email):
         """
-        
-        # HTML message
-        html_message = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: #2563eb; color: white; padding: 20px; text-align: center; }}
-        .content {{ padding: 30px; background-color: #f9fafb; }}
-        .button {{ 
-            display: inline-block; 
-            padding: 12px 24px; 
-            background-color: #2563eb; 
-            color: white; 
-            text-decoration: none; 
-            border-radius: 6px;
-            margin: 20px 0;
-        }}
-        .footer {{ padding: 20px; text-align: center; color: #6b7280; font-size: 12px; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>BekoSIRS</h1>
-        </div>
-        <div class="content">
-            <h2>Şifre Sıfırlama</h2>
-            <p>Merhaba <strong>{user.first_name or user.username}</strong>,</p>
-            <p>Şifrenizi sıfırlamak için bir talep aldık. Aşağıdaki butona tıklayarak yeni şifrenizi belirleyebilirsiniz:</p>
-            <p style="text-align: center;">
-                <a href="{reset_url}" class="button">Şifremi Sıfırla</a>
-            </p>
-            <p><small>Bu link 1 saat içinde geçerliliğini yitirecektir.</small></p>
-            <p>Eğer bu talebi siz yapmadıysanız, bu e-postayı görmezden gelebilirsiniz.</p>
-        </div>
-        <div class="footer">
-            <p>© 2026 BekoSIRS. Tüm hakları saklıdır.</p>
-        </div>
-    </div>
-</body>
-</html>
+        Render emails/<template>.txt and .html into one multipart message.
+        Templates live in products/templates/emails/ (parsed once by the cached loader).
         """
-        
-        try:
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=text_message.strip(),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email]
-            )
-            email.attach_alternative(html_message, "text/html")
-            email.send()
-            return True
-        except Exception as e:
-            print(f"Error sending password reset email: {e}")
-            return False
+        email = EmailMultiAlternatives(
+            subject=subject,
+            body=render_to_string(f'emails/{template}.txt', context).strip(),
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[to_email]
+        )
+        email.attach_alternative(render_to_string(f'emails/{template}.html', context), "text/html")
+        return email
 
     @staticmethod
-    def send_welcome_email(user):
+    def build_password_reset_email(user, token):
+        """Prepare (but do not send) the password reset message."""
+        reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token.token}"
+        context = {'name': user.first_name or user.username, 'reset_url': reset_url}
+        return EmailService._build('password_reset', context, 'BekoSIRS - Şifre Sıfırlama Talebi', user.email)
+
+    @staticmethod
+    def send_password_reset_email(user, token):
         """
-        Send welcome email to newly registered user.
+        Send password reset email with token.
         
         Args:
             user: CustomUser instance
+            token: PasswordResetToken instance
         
         Returns:
             bool: True if sent successfully
         """
-        subject = 'BekoSIRS\'a Hoş Geldiniz!'
-        
-        text_message = f"""
-Merhaba {user.first_name or user.username},
+        return EmailService._send(EmailService.build_password_reset_email(user, token), 'password reset')
 
-BekoSIRS ailesine hoş geldiniz!
-
-Artık Beko ürünlerinizi takip edebilir, servis taleplerinde bulunabilir ve size özel öneriler alabilirsiniz.
-
-Herhangi bir sorunuz olursa bizimle iletişime geçmekten çekinmeyin.
+    @staticmethod
+    def build_welcome_email(user):
+        """Prepare (but do not send) the welcome message."""
+        context = {'name': user.first_name or user.username, 'app_url': settings.FRONTEND_URL}
+        return EmailService._build('welcome', context, 'BekoSIRS\'a Hoş Geldiniz!', user.email)
 
-Saygılarımızla,
-BekoSIRS Ekibi
+    @staticmethod
+    def send_welcome_email(user):
         """
+        Send welcome email to newly registered user.
         
-        html_message = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <style>
-        body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-        .container {{ max-width: 600px; margin: 0 auto; padding: 20px; }}
-        .header {{ background-color: #2563eb; color: white; padding: 20px; text-align: center; }}
-        .content {{ padding: 30px; background-color: #f9fafb; }}
-        .button {{ 
-            display: inline-block; 
-            padding: 12px 24px; 
-            background-color: #2563eb; 
-            color: white; 
-            text-decoration: none; 
-            border-radius: 6px;
-            margin: 20px 0;
-        }}
-        .footer {{ padding: 20px; text-align: center; color: #6b7280; font-size: 12px; }}
-        .features {{ margin: 20px 0; }}
-        .features li {{ margin: 10px 0; }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>BekoSIRS'a Hoş Geldiniz!</h1>
-        </div>
-        <div class="content">
-            <p>Merhaba <strong>{user.first_name or user.username}</strong>,</p>
-            <p>BekoSIRS ailesine hoş geldiniz! 🎉</p>
-            <p>Artık şunları yapabilirsiniz:</p>
-            <ul class="features">
-                <li>✅ Beko ürünlerinizi takip edin</li>
-                <li>✅ Garanti durumunuzu kontrol edin</li>
-                <li>✅ Servis taleplerinde bulunun</li>
-                <li>✅ Size özel ürün önerileri alın</li>
-            </ul>
-            <p style="text-align: center;">
-                <a href="{settings.FRONTEND_URL}" class="button">Uygulamaya Git</a>
-            </p>
-        </div>
-        <div class="footer">
-            <p>© 2026 BekoSIRS. Tüm hakları saklıdır.</p>
-        </div>
-    </div>
-</body>
-</html>
-        """
+        Args:
+            user: CustomUser instance
         
-        try:
-            email = EmailMultiAlternatives(
-                subject=subject,
-                body=text_message.strip(),
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                to=[user.email]
-            )
-            email.attach_alternative(html_message, "text/html")
-            email.send()
-            return True
-        except Exception as e:
-            print(f"Error sending welcome email: {e}")
-            return False
+        Returns:
+            bool: True if sent successfully
+        """
+        return EmailService._send(EmailService.build_welcome_email(user), 'welcome')
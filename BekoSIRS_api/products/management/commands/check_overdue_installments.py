@@ -9,9 +9,11 @@ Cron job olarak günlük çalıştırılabilir:
     0 8 * * * cd /path/to/project && python manage.py check_overdue_installments
 """
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
 from datetime import timedelta
 from products.models import Installment, Notification
+from products.services.command_lock import command_lock
 
 
 class Command(BaseCommand):
@@ -25,6 +27,17 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        if options['dry_run']:
+            return self._check(**options)
+        # Çakışan çalıştırmalar (cron üst üste binmesi, iki sunucu) aynı bildirimleri
+        # iki kez yazmasın: gövdeyi aynı anda yalnızca bir çalıştırma yürütür
+        with command_lock('check_overdue_installments') as acquired:
+            if not acquired:
+                self.stdout.write(self.style.WARNING('Komut zaten çalışıyor; bu çalıştırma atlandı.'))
+                return
+            self._check(**options)
+
+    def _check(self, **options):
         dry_run = options['dry_run']
         today = timezone.now().date()
 
@@ -34,14 +47,13 @@ class Command(BaseCommand):
         overdue_installments = Installment.objects.filter(
             due_date__lt=today,
             status__in=['pending', 'customer_confirmed'],
-        ).select_related('plan__customer', 'plan__product')
-
-        count = overdue_installments.count()
-        self.stdout.write(f'{count} adet vadesi geçmiş taksit bulundu.')
+        )
 
         if dry_run:
+            overdue_list = list(overdue_installments.select_related('plan__customer', 'plan__product'))
+            self.stdout.write(f'{len(overdue_list)} adet vadesi geçmiş taksit bulundu.')
             self.stdout.write(self.style.WARNING('DRY RUN: Hiçbir değişiklik yapılmadı.'))
-            for inst in overdue_installments:
+            for inst in overdue_list:
                 days_late = (today - inst.due_date).days
                 self.stdout.write(
                     f'  - {inst.plan.customer.email}: Taksit #{inst.installment_number} '
@@ -49,50 +61,68 @@ class Command(BaseCommand):
                 )
             return
 
-        notifications = []
-        updated_ids = []
-
-        for inst in overdue_installments:
-            customer = inst.plan.customer
+        # Tarama, durum güncellemesi ve bildirim yazımı tek transaction'da: yarıda
+        # kalan çalıştırma kısmi durum bırakmaz
+        with transaction.atomic():
+            notifications = []
+            scanned_ids = []
+
+            # Son 7 günde overdue bildirimi almış (müşteri, ürün) çiftleri tek sorguda;
+            # bu çalıştırmada eklenenler de kümeye girer, aynı ürünün birden fazla
+            # gecikmiş taksidi tek bildirim üretir
+            notified = set(
+                Notification.objects.filter(
+                    notification_type='general',
+                    title__startswith='Gecikmiş Taksit',
+                    created_at__gte=timezone.now() - timedelta(days=7),
+                ).values_list('user_id', 'related_product_id')
+            )
 
-            # Son 7 gün içinde bu plan için overdue bildirimi gönderilmiş mi?
-            already_notified = Notification.objects.filter(
-                user=customer,
-                notification_type='general',
-                title__startswith='Gecikmiş Taksit',
-                created_at__gte=timezone.now() - timedelta(days=7),
-                related_product=inst.plan.product,
-            ).exists()
+            # Satırlar parça parça okunur; tüm taksitler belleğe alınmaz
+            # Bildirim yalnızca müşteri/ürün id'leri ve ürün adını kullanır; müşteri
+            # satırı join edilmez, FK nesneleri yerine *_id alanları atanır
+            rows = overdue_installments.select_related('plan__product')
+            for inst in rows.iterator(chunk_size=500):
+                scanned_ids.append(inst.pk)
+                key = (inst.plan.customer_id, inst.plan.product_id)
+
+                if key not in notified:
+                    notified.add(key)
+                    days_late = (today - inst.due_date).days
+                    notifications.append(
+                        Notification(
+                            user_id=inst.plan.customer_id,
+                            notification_type='general',
+                            title='Gecikmiş Taksit Bildirimi',
+                            message=(
+                                f'{inst.plan.product.name} ürününüz için {inst.installment_number}. '
+                                f'taksit ödemesi {inst.due_date.strftime("%d.%m.%Y")} tarihinde '
+                                f'vadesi doldu ({days_late} gün gecikmiş). '
+                                f'Lütfen en kısa sürede ödemenizi gerçekleştirin.'
+                            ),
+                            related_product_id=inst.plan.product_id,
+                        )
+                    )
 
-            updated_ids.append(inst.pk)
+            # Yalnızca taranan (bildirimi hazırlanan) taksitler güncellenir; tarama
+            # sonrası vadesi geçenler bir sonraki çalıştırmada bildirimle birlikte işlenir.
+            # id listesi parçalanır (MSSQL/SQLite parametre sınırı); satır sayısı UPDATE'ten döner
+            count = 0
+            for start in range(0, len(scanned_ids), 500):
+                count += overdue_installments.filter(
+                    pk__in=scanned_ids[start:start + 500]
+                ).update(status='overdue')
 
-            if not already_notified:
-                days_late = (today - inst.due_date).days
-                notifications.append(
-                    Notification(
-                        user=customer,
-                        notification_type='general',
-                        title='Gecikmiş Taksit Bildirimi',
-                        message=(
-                            f'{inst.plan.product.name} ürününüz için {inst.installment_number}. '
-                            f'taksit ödemesi {inst.due_date.strftime("%d.%m.%Y")} tarihinde '
-                            f'vadesi doldu ({days_late} gün gecikmiş). '
-                            f'Lütfen en kısa sürede ödemenizi gerçekleştirin.'
-                        ),
-                        related_product=inst.plan.product,
-                    )
-                )
+            if notifications:
+                Notification.objects.bulk_create(notifications, batch_size=1000)
 
-        # Taksit durumlarını toplu güncelle
-        if updated_ids:
-            Installment.objects.filter(pk__in=updated_ids).update(status='overdue')
+        self.stdout.write(f'{count} adet vadesi geçmiş taksit bulundu.')
+        if count:
             self.stdout.write(
-                self.style.SUCCESS(f'{len(updated_ids)} taksit "overdue" olarak güncellendi.')
+                self.style.SUCCESS(f'{count} taksit "overdue" olarak güncellendi.')
             )
 
-        # Bildirimleri toplu oluştur
         if notifications:
-            Notification.objects.bulk_create(notifications)
             self.stdout.write(
                 self.style.SUCCESS(f'{len(notifications)} bildirim oluşturuldu.')
             )
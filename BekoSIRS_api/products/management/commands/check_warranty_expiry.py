@@ -10,7 +10,10 @@ Cron job olarak günlük çalıştırılabilir:
 from django.core.management.base import BaseCommand
 from django.utils import timezone
 from datetime import timedelta
-from products.models import ProductOwnership, Notification
+from dateutil.relativedelta import relativedelta
+from django.db.models import Q
+from products.models import Product, ProductOwnership, Notification
+from products.services.command_lock import command_lock
 
 
 class Command(BaseCommand):
@@ -30,6 +33,17 @@ class Command(BaseCommand):
         )
 
     def handle(self, *args, **options):
+        if options['dry_run']:
+            return self._check(**options)
+        # Çakışan çalıştırmalar (cron üst üste binmesi, iki sunucu) aynı bildirimleri
+        # iki kez yazmasın: gövdeyi aynı anda yalnızca bir çalıştırma yürütür
+        with command_lock('check_warranty_expiry') as acquired:
+            if not acquired:
+                self.stdout.write(self.style.WARNING('Komut zaten çalışıyor; bu çalıştırma atlandı.'))
+                return
+            self._check(**options)
+
+    def _check(self, **options):
         days = options['days']
         dry_run = options['dry_run']
         
@@ -41,48 +55,75 @@ class Command(BaseCommand):
         # Garanti süresi dolmak üzere olan ürün sahipliklerini bul
         expiring_ownerships = []
         
-        for ownership in ProductOwnership.objects.select_related('customer', 'product'):
-            warranty_end = ownership.warranty_end_date
-            if warranty_end and today <= warranty_end <= warning_date:
-                # Bu ownership için daha önce bildirim gönderilmiş mi?
-                already_notified = Notification.objects.filter(
-                    user=ownership.customer,
-                    notification_type='warranty_expiry',
-                    related_product=ownership.product,
-                    created_at__gte=today - timedelta(days=7)  # Son 7 gün içinde
-                ).exists()
-                
-                if not already_notified:
-                    expiring_ownerships.append(ownership)
+        # Ay eklemek SQL'de taşınabilir değil; bunun yerine her garanti süresi için
+        # satın alma tarihi penceresi SQL'e verilir (ay sonu kırpması için ±3 gün pay),
+        # kesin kontrol aşağıda yalnızca bu adaylar üzerinde yapılır
+        purchase_window = Q()
+        for months in Product.objects.values_list('warranty_duration_months', flat=True).distinct():
+            purchase_window |= Q(
+                product__warranty_duration_months=months,
+                purchase_date__gte=today - relativedelta(months=months) - timedelta(days=3),
+                purchase_date__lte=warning_date - relativedelta(months=months) + timedelta(days=3),
+            )
+        if not purchase_window:
+            purchase_window = Q(pk__in=[])
+        
+        # Tarama model nesnesi kurmadan yalnızca gereken alanları ince satırlar olarak
+        # okur; garanti bildirimini kapatan kullanıcılar (tercih kaydı yoksa varsayılan
+        # açık) SQL'de hariç tutulur
+        rows = (
+            ProductOwnership.objects
+            .filter(purchase_window)
+            .exclude(customer__notification_preferences__notify_warranty_expiry=False)
+            .values_list(
+                'customer_id', 'product_id', 'purchase_date',
+                'product__warranty_duration_months', 'product__name', 'customer__email',
+                named=True,
+            )
+            .iterator(chunk_size=2000)
+        )
+        # Son 7 gün içinde bildirilmiş (müşteri, ürün) çiftleri tek sorguda; aynı
+        # ürüne iki kez sahip olan müşteri de tek bildirim alır
+        notified = set(
+            Notification.objects.filter(
+                notification_type='warranty_expiry',
+                created_at__gte=today - timedelta(days=7),
+            ).values_list('user_id', 'related_product_id')
+        )
+        for row in rows:
+            warranty_end_date = row.purchase_date + relativedelta(months=row.product__warranty_duration_months)
+            if not today <= warranty_end_date <= warning_date:
+                continue
+            key = (row.customer_id, row.product_id)
+            if key not in notified:
+                notified.add(key)
+                expiring_ownerships.append((row, warranty_end_date))
         
         self.stdout.write(f'{len(expiring_ownerships)} adet ürün için bildirim gönderilecek.')
         
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN: Bildirimler oluşturulmadı.'))
-            for o in expiring_ownerships:
-                days_left = (o.warranty_end_date - today).days
-                self.stdout.write(f'  - {o.customer.email}: {o.product.name} ({days_left} gün kaldı)')
+            for row, warranty_end_date in expiring_ownerships:
+                days_left = (warranty_end_date - today).days
+                self.stdout.write(f'  - {row.customer__email}: {row.product__name} ({days_left} gün kaldı)')
             return
         
         # Bildirimleri oluştur
         notifications = []
-        for ownership in expiring_ownerships:
-            days_left = (ownership.warranty_end_date - today).days
-            
-            # Kullanıcının garanti bildirimi tercihi açık mı?
-            if ownership.customer.notify_warranty_expiry:
-                notifications.append(
-                    Notification(
-                        user=ownership.customer,
-                        notification_type='warranty_expiry',
-                        title='Garanti Süresi Dolmak Üzere!',
-                        message=f'{ownership.product.name} ürününüzün garanti süresi {days_left} gün içinde ({ownership.warranty_end_date.strftime("%d.%m.%Y")}) dolacak.',
-                        related_product=ownership.product
-                    )
+        for row, warranty_end_date in expiring_ownerships:
+            days_left = (warranty_end_date - today).days
+            notifications.append(
+                Notification(
+                    user_id=row.customer_id,
+                    notification_type='warranty_expiry',
+                    title='Garanti Süresi Dolmak Üzere!',
+                    message=f'{row.product__name} ürününüzün garanti süresi {days_left} gün içinde ({warranty_end_date.strftime("%d.%m.%Y")}) dolacak.',
+                    related_product_id=row.product_id
                 )
+            )
         
         if notifications:
-            Notification.objects.bulk_create(notifications)
+            Notification.objects.bulk_create(notifications, batch_size=1000)
             self.stdout.write(self.style.SUCCESS(f'{len(notifications)} bildirim başarıyla oluşturuldu.'))
         else:
             self.stdout.write('Gönderilecek bildirim yok.')
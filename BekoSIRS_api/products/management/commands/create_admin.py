@@ -0,0 +1,51 @@
+"""
+Admin kullanıcısını oluşturan veya şifresini sıfırlayan idempotent command.
+
+Kullanım:
+    python manage.py create_admin
+    python manage.py create_admin --password YeniSifre123
+
+Eski reset_admin_password.py script'inin yerini alır.
+"""
+from django.apps import apps
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = 'Admin kullanıcısını oluşturur; varsa şifresini sıfırlar'
+
+    # Tek sorguluk bir iş için sistem ve migration kontrollerini atla
+    requires_system_checks = []
+    requires_migrations_checks = False
+
+    def add_arguments(self, parser):
+        parser.add_argument('--username', default='admin', help='Admin kullanıcı adı (varsayılan: admin)')
+        parser.add_argument('--password', default='admin123', help='Yeni şifre (varsayılan: admin123)')
+        parser.add_argument('--email', default='admin@bekosirs.com', help='Yeni oluşturulursa e-posta adresi')
+
+    def handle(self, *args, **options):
+        CustomUser = apps.get_model('products', 'CustomUser')
+        username = options['username']
+        password = options['password']
+
+        # save() post_save sinyallerini tetikler (denetim kaydı, önbellekteki
+        # kimlik doğrulanmış kullanıcının geçersiz kılınması); queryset.update() tetiklemez
+        user = CustomUser.objects.filter(username=username).first()
+        if user is not None:
+            user.set_password(password)
+            user.save(update_fields=['password'])
+            self.stdout.write(self.style.SUCCESS(f'✓ {username} şifresi sıfırlandı: {password}'))
+            return
+
+        CustomUser.objects.create(
+            username=username,
+            email=options['email'],
+            password=make_password(password),
+            first_name='Admin',
+            last_name='User',
+            role='admin',
+            is_staff=True,
+            is_superuser=True,
+        )
+        self.stdout.write(self.style.SUCCESS(f'✓ Yeni admin oluşturuldu: {username} / {password}'))
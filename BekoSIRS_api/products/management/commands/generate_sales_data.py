@@ -26,6 +26,7 @@ from django.core.management.base import BaseCommand
 from django.utils import timezone
 
 from products.models import CustomUser, Product, ProductAssignment
+from products.services.sales_aggregates import rebuild_sales_aggregates
 
 
 # ── Seasonal multipliers per calendar month (1=Jan … 12=Dec) ──────────────
@@ -126,6 +127,7 @@ class Command(BaseCommand):
                     customer=customer,
                     product=product,
                     quantity=qty,
+                    unit_price=product.price,
                     assigned_by=admin,
                     status="DELIVERED",
                     notes=f"[SYNTH-SALES] week {week_label}",
@@ -144,6 +146,9 @@ class Command(BaseCommand):
             n_weeks += 1
             week_cursor += timedelta(days=7)
 
+        # bulk_create/update bypass signals, so refresh the monthly sales rollup once
+        rebuild_sales_aggregates()
+
         self.stdout.write(self.style.SUCCESS(
             f"\n✅ Created {total_created} synthetic sales records "
             f"({n_weeks} weeks × {len(products)} products)\n"
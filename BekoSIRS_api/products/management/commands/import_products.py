@@ -1,95 +1,176 @@
 from django.core.management.base import BaseCommand
+from django.db import transaction
 import pandas as pd
-from products.models import Product, Category
+from products.models import AuditLog, Product, Category
+from products.signals import invalidate_admin_changelist, invalidate_dashboard_cache
 import os
-from decimal import Decimal, InvalidOperation
+from decimal import Decimal
+
+HEADER_MARKER = 'EK GARANTİ KODU'
+IMPORT_UPDATE_FIELDS = [
+    'name', 'category', 'description', 'warranty_code', 'price',
+    'price_cash', 'price_list', 'campaign_tag', 'stock',
+]
+
+
+def parse_price_list(df):
+    """
+    Excel sayfasını satır satır dolaşmadan (iterrows yok) sütun işlemleriyle ayrıştırır.
+
+    Döner: (kategori adları - sayfadaki sırayla, ürün satırları DataFrame'i)
+    Ürün satırları: model_code, category, description, warranty_code,
+    price_cash, price_list, campaign_tag sütunları.
+    """
+    col0 = df[0].fillna('').astype(str).str.strip()  # EK GARANTİ KODU
+    col1 = df[1].fillna('').astype(str).str.strip()  # Header Title / Model kodu
+
+    # 1. Başlık satırları: Col 0 veya Col 1 "EK GARANTİ KODU" içerir
+    header_mask = (
+        col0.str.contains(HEADER_MARKER, regex=False)
+        | col1.str.contains(HEADER_MARKER, regex=False)
+    )
+    # Col 1'de uzun bir metin varsa (ve sütun başlığı değilse) kategori satırıdır
+    cat_mask = header_mask & (col1.str.len() > 10) & ~col1.str.contains('Fiyat', regex=False)
+    categories = col1[cat_mask].str.split('(Ölçüler', regex=False).str[0].str.strip()
+    cat_names = categories.reindex(df.index)
+
+    # 2. Ürün satırları: Col 6'da (Peşin Fiyat) sayısal fiyat ve Col 1'de model kodu olmalı
+    price_cash = pd.to_numeric(df[6], errors='coerce')
+    price_list = pd.to_numeric(df[5], errors='coerce')
+    product_mask = (
+        ~header_mask
+        & price_cash.notna()
+        & (col1 != '')
+        # Liste fiyatı dolu ama sayı değilse satır geçersiz
+        & (df[5].isna() | price_list.notna())
+    )
+
+    products = pd.DataFrame({
+        'model_code': col1,
+        # Kategorisi olmayan ürünler 'Genel' altına
+        'category': cat_names.ffill().fillna('Genel'),
+        'description': df[2].astype(str).where(df[2].notna(), ''),
+        'warranty_code': col0.where(~col0.isin(['', '-'])),
+        'price_cash': price_cash,
+        'price_list': price_list,
+        'campaign_tag': df[7].astype(str).where(df[7].notna()),
+    })[product_mask]
+    return categories.tolist(), products
+
+
+def read_sheet(file_path):
+    """
+    Fiyat listesinin ilk sayfasını başlıksız DataFrame olarak okur.
+
+    .xlsx dosyaları openpyxl read_only modunda satır satır akıtılır (tüm çalışma
+    kitabı hücre nesneleriyle belleğe yüklenmez); eski .xls için pandas kullanılır.
+    """
+    if file_path.lower().endswith('.xlsx'):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            return pd.DataFrame(list(wb.active.iter_rows(values_only=True)))
+        finally:
+            wb.close()
+    return pd.read_excel(file_path, header=None) # using header=None to easier detect section headers
+
+
+def _product_audit_log(action, product):
+    """products.signals.log_product_save ile aynı içerikte denetim kaydı (toplu yazım için)."""
+    return AuditLog(
+        action=action,
+        model_name='Product',
+        object_id=product.pk,
+        object_repr=str(product)[:255],
+        changes={
+            'name': product.name,
+            'stock': product.stock,
+            'price': str(product.price) if product.price else None,
+        },
+    )
+
+
+def _decimal_or_none(value):
+    return None if pd.isna(value) else Decimal(str(value))
+
 
 class Command(BaseCommand):
     help = 'Imports products from bekoproducts.xls'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--file', default='bekoproducts.xls', help='Fiyat listesi (.xls veya .xlsx)')
+
     def handle(self, *args, **kwargs):
-        file_path = 'bekoproducts.xls'
+        file_path = kwargs['file']
         # Check absolute path if relative fails
         if not os.path.exists(file_path):
-            file_path = os.path.join(os.getcwd(), 'bekoproducts.xls')
-            
+            file_path = os.path.join(os.getcwd(), file_path)
+
         if not os.path.exists(file_path):
             self.stdout.write(self.style.ERROR(f'File not found: {file_path}'))
             return
 
         self.stdout.write(f"Reading {file_path}...")
-        df = pd.read_excel(file_path, header=None) # using header=None to easier detect section headers
-
-        current_category = None
-        imported_count = 0
-        
-        # Iterate through all rows
-        for index, row in df.iterrows():
-            col0 = str(row[0]).strip() # EK GARANTİ KODU
-            col1 = str(row[1]).strip() # Header Title
-            
-            # 1. Detect Header Row (Category)
-            # A header usually has text in Col 1 like "Buzdolapları..." and Col 0 is "EK GARANTİ KODU" or Empty or "-"
-            # OR Col 0 is "EK GARANTİ KODU" itself.
-            
-            if 'EK GARANTİ KODU' in col0 or 'EK GARANTİ KODU' in col1:
-                # Potential Header Row or Column Title Row
-                # If Col 1 has substantive text (longer than small code), it's likely a Category
-                if len(col1) > 10 and 'Fiyat' not in col1:
-                    cat_name = col1
-                    # Clean header text
-                    if "(Ölçüler" in cat_name:
-                        cat_name = cat_name.split("(Ölçüler")[0].strip()
-                    
-                    category, _ = Category.objects.get_or_create(name=cat_name)
-                    current_category = category
-                    self.stdout.write(f"--- Category: {current_category.name}")
-                continue
-
-            # 2. Detect Value Row (Product)
-            # Must have a price in Column 6 (Peşin Fiyat) - Index 6
-            try:
-                price_raw = row[6]
-                if pd.isna(price_raw) or str(price_raw).strip() == '' or str(price_raw).lower() == 'peşin fiyat':
-                    continue
-                
-                # Check for model code in col1
-                model_code = col1
-                if model_code == 'nan' or model_code == '': continue
-                
-                # Warranty code in col0
-                warranty_code = col0 if col0 not in ['nan', '-'] else None
-                
-                description = str(row[2]) if not pd.isna(row[2]) else ""
-                
-                # Prices
-                price_cash = Decimal(str(price_raw))
-                price_list = Decimal(str(row[5])) if not pd.isna(row[5]) else None
-                
-                campaign = str(row[7]) if not pd.isna(row[7]) else None
-                
-                # Use current category or 'Uncategorized'
-                if not current_category:
-                    current_category, _ = Category.objects.get_or_create(name="Genel")
-                
-                # Create/Update Product
-                Product.objects.update_or_create(
-                    model_code=model_code,
-                    defaults={
-                        'name': f"{model_code} - {current_category.name}",
-                        'category': current_category,
-                        'description': description,
-                        'warranty_code': warranty_code,
-                        'price': price_cash,
-                        'price_cash': price_cash,
-                        'price_list': price_list,
-                        'campaign_tag': campaign,
-                        'stock': 10 # Default
-                    }
-                )
-                imported_count += 1
-                
-            except (ValueError, InvalidOperation, IndexError):
-                continue
-                
+        df = read_sheet(file_path)
+        df = df.reindex(columns=range(8))  # Eksik sütunlar NaN olarak gelir
+
+        category_names, rows = parse_price_list(df)
+
+        for cat_name in category_names:
+            self.stdout.write(f"--- Category: {cat_name}")
+
+        # Kategori ve ürün yazımları tek transaction'da: tek commit, yarım kalan import olmaz
+        with transaction.atomic():
+            # Kategoriler: mevcutlar tek sorguda, eksikler tek INSERT ile. missing zaten
+            # yüklenen kategorilere göre hesaplandığından ignore_conflicts (MSSQL'de yok)
+            # gerekmez; pk'ler için yeni kayıtlar adlarıyla yeniden okunur
+            categories = {c.name: c for c in Category.objects.all()}
+            missing = set(category_names).union(rows['category']) - categories.keys()
+            if missing:
+                Category.objects.bulk_create([Category(name=name) for name in missing])
+                categories.update((c.name, c) for c in Category.objects.filter(name__in=missing))
+
+            # Aynı model kodu dosyada birden fazla geçerse son satır geçerli
+            rows = rows.drop_duplicates(subset='model_code', keep='last')
+            # Mevcut ürünler tek sorguda; conflict upsert (update_conflicts) MSSQL'de
+            # desteklenmediği için yeni satırlar INSERT, mevcutlar UPDATE olarak toplanır
+            existing = Product.objects.filter(model_code__in=rows['model_code'].tolist()).in_bulk(field_name='model_code')
+            to_create, to_update = [], []
+            for row in rows.itertuples(index=False):
+                category = categories[row.category]
+                price_cash = _decimal_or_none(row.price_cash)
+                product = existing.get(row.model_code) or Product(model_code=row.model_code)
+                product.name = f"{row.model_code} - {category.name}"
+                product.category = category
+                product.description = row.description
+                product.warranty_code = None if pd.isna(row.warranty_code) else row.warranty_code
+                product.price = price_cash
+                product.price_cash = price_cash
+                product.price_list = _decimal_or_none(row.price_list)
+                product.campaign_tag = None if pd.isna(row.campaign_tag) else row.campaign_tag
+                product.stock = 10 # Default
+                (to_update if product.pk else to_create).append(product)
+
+            # Create/Update Product: satır başına SELECT + INSERT/UPDATE yerine toplu yazım
+            Product.objects.bulk_create(to_create, batch_size=1000)
+            Product.objects.bulk_update(to_update, fields=IMPORT_UPDATE_FIELDS, batch_size=1000)
+
+            # bulk_create/bulk_update post_save tetiklemez; denetim kayıtları toplu yazılır.
+            # Her backend bulk_create sonrası pk döndürmediğinden yeni ürünlerin id'leri yeniden okunur
+            created = Product.objects.filter(
+                model_code__in=[p.model_code for p in to_create]
+            ).in_bulk(field_name='model_code')
+            AuditLog.objects.bulk_create(
+                [_product_audit_log('create', created[p.model_code]) for p in to_create]
+                + [_product_audit_log('update', p) for p in to_update],
+                batch_size=1000,
+            )
+        # Önbellekleri elle geçersiz kıl
+        if missing:
+            invalidate_admin_changelist(Category)
+        invalidate_admin_changelist(Product)
+        invalidate_dashboard_cache(Product)
+        imported_count = len(to_create) + len(to_update)
+
         self.stdout.write(self.style.SUCCESS(f'Successfully imported {imported_count} products'))
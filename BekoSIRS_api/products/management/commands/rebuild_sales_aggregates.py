@@ -0,0 +1,20 @@
+"""
+Aylık satış özet tablosunu (SalesMonthlyAggregate) ProductAssignment kayıtlarından yeniden hesaplar.
+
+Tekil satışlarda tablo sinyallerle güncel tutulur; toplu veri yüklemeleri
+(bulk_create / update) veya elle yapılan SQL düzeltmelerinden sonra çalıştırılmalıdır.
+
+Kullanım:
+    python manage.py rebuild_sales_aggregates
+"""
+from django.core.management.base import BaseCommand
+
+from products.services.sales_aggregates import rebuild_sales_aggregates
+
+
+class Command(BaseCommand):
+    help = 'Aylık satış özet tablosunu satış kayıtlarından yeniden oluşturur'
+
+    def handle(self, *args, **options):
+        rows = rebuild_sales_aggregates()
+        self.stdout.write(self.style.SUCCESS(f'✅ {rows} aylık satış özeti satırı oluşturuldu'))
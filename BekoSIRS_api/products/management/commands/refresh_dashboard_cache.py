@@ -0,0 +1,61 @@
+"""
+Dashboard grafik ve özet önbelleğini arka planda yeniden hesaplar.
+
+Görünümler önbellek boşsa veriyi istek sırasında üretir; bu komut cron ile
+(ör. dakikada bir) ya da --interval ile sürekli çalıştırıldığında panel
+kullanıcıları her zaman hazır veriyi okur ve istek süresi DB yükünden bağımsız olur.
+
+Kullanım:
+    python manage.py refresh_dashboard_cache
+    python manage.py refresh_dashboard_cache --interval 60
+"""
+import time
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from products.signals import DASHBOARD_CHARTS_CACHE_KEY, DASHBOARD_SUMMARY_CACHE_KEY
+from products.views.analytics_views import ChartsView
+from products.views.service_views import DashboardSummaryView
+
+
+class Command(BaseCommand):
+    help = 'Dashboard grafik ve özet önbelleğini yeniden hesaplar'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval',
+            type=int,
+            default=0,
+            help='Saniye cinsinden yenileme aralığı (0 = bir kez çalış ve çık)',
+        )
+        parser.add_argument(
+            '--ttl',
+            type=int,
+            default=120,
+            help='Önbellek süresi (saniye); yenileme aralığından uzun olmalı',
+        )
+
+    def handle(self, *args, **options):
+        interval = options['interval']
+        ttl = options['ttl']
+        # Süreç içi önbelleğe yazılan veri web worker'larına ulaşmaz
+        if isinstance(caches['default'], (LocMemCache, DummyCache)):
+            raise CommandError(
+                'Varsayılan önbellek süreçler arası paylaşılmıyor (LocMem/Dummy); '
+                'komut yalnızca REDIS_URL gibi paylaşılan bir önbellekle anlamlıdır.'
+            )
+        while True:
+            # Uzun süre çalışan süreç kopmuş/eskimiş DB bağlantısını tutmasın
+            close_old_connections()
+            cache.set_many({
+                DASHBOARD_CHARTS_CACHE_KEY: ChartsView.build_charts(),
+                DASHBOARD_SUMMARY_CACHE_KEY: DashboardSummaryView.build_summary(),
+            }, ttl)
+            self.stdout.write(self.style.SUCCESS('✅ Dashboard önbelleği yenilendi'))
+            if interval <= 0:
+                break
+            time.sleep(interval)
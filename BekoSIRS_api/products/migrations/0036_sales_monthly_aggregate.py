@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:07
+
+from django.db import migrations, models
+import django.db.models.deletion
+from django.db.models import Count, DateField, Sum
+from django.db.models.functions import TruncMonth
+
+
+def backfill_sales_monthly_aggregate(apps, schema_editor):
+    ProductAssignment = apps.get_model('products', 'ProductAssignment')
+    SalesMonthlyAggregate = apps.get_model('products', 'SalesMonthlyAggregate')
+    rows = (
+        ProductAssignment.objects
+        .annotate(month=TruncMonth('assigned_at', output_field=DateField()))
+        .values('product_id', 'month')
+        .annotate(quantity=Sum('quantity'), order_count=Count('id'))
+        .order_by()
+    )
+    SalesMonthlyAggregate.objects.bulk_create(
+        [SalesMonthlyAggregate(**row) for row in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0035_remove_biometric_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SalesMonthlyAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='Ayın ilk günü (yerel saat)', verbose_name='Ay')),
+                ('quantity', models.PositiveIntegerField(default=0, verbose_name='Satılan Adet')),
+                ('order_count', models.PositiveIntegerField(default=0, verbose_name='Satış Kaydı Sayısı')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_sales', to='products.product', verbose_name='Ürün')),
+            ],
+            options={
+                'verbose_name': 'Aylık Satış Özeti',
+                'verbose_name_plural': 'Aylık Satış Özetleri',
+                'ordering': ['-month'],
+                'unique_together': {('month', 'product')},
+            },
+        ),
+        migrations.RunPython(backfill_sales_monthly_aggregate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:09
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0036_sales_monthly_aggregate'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productassignment',
+            index=models.Index(fields=['assigned_at', 'product'], name='assign_date_product_idx'),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:11
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, OuterRef, Subquery, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+
+def backfill_unit_price_and_revenue(apps, schema_editor):
+    Product = apps.get_model('products', 'Product')
+    ProductAssignment = apps.get_model('products', 'ProductAssignment')
+    SalesMonthlyAggregate = apps.get_model('products', 'SalesMonthlyAggregate')
+
+    # Best available history: the product's current price
+    ProductAssignment.objects.filter(unit_price__isnull=True).update(
+        unit_price=Subquery(Product.objects.filter(pk=OuterRef('product_id')).values('price')[:1])
+    )
+
+    monthly_revenue = (
+        ProductAssignment.objects
+        .annotate(month=TruncMonth('assigned_at', output_field=models.DateField()))
+        .values('product_id', 'month')
+        .annotate(revenue=Coalesce(Sum(F('unit_price') * F('quantity')), Value(0), output_field=DecimalField()))
+        .order_by()
+    )
+    for row in monthly_revenue:
+        SalesMonthlyAggregate.objects.filter(
+            product_id=row['product_id'], month=row['month']
+        ).update(revenue=row['revenue'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0037_assignment_date_product_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productassignment',
+            name='unit_price',
+            field=models.DecimalField(blank=True, decimal_places=2, help_text='Satış anındaki ürün fiyatı (sonraki fiyat değişikliklerinden etkilenmez)', max_digits=10, null=True, verbose_name='Birim Satış Fiyatı'),
+        ),
+        migrations.AddField(
+            model_name='salesmonthlyaggregate',
+            name='revenue',
+            field=models.DecimalField(decimal_places=2, default=0, help_text='Adet × satış anındaki birim fiyat toplamı', max_digits=14, verbose_name='Ciro'),
+        ),
+        migrations.RunPython(backfill_unit_price_and_revenue, migrations.RunPython.noop),
+    ]
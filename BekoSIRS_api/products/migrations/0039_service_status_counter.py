@@ -0,0 +1,36 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:12
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_service_status_counters(apps, schema_editor):
+    ServiceRequest = apps.get_model('products', 'ServiceRequest')
+    ServiceStatusCounter = apps.get_model('products', 'ServiceStatusCounter')
+    ServiceStatusCounter.objects.bulk_create([
+        ServiceStatusCounter(status=row['status'], count=row['total'])
+        for row in ServiceRequest.objects.values('status').annotate(total=Count('id')).order_by()
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0038_assignment_unit_price'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ServiceStatusCounter',
+            fields=[
+                ('status', models.CharField(choices=[('pending', 'Beklemede'), ('in_queue', 'Sırada'), ('in_progress', 'İşlemde'), ('completed', 'Tamamlandı'), ('cancelled', 'İptal Edildi')], max_length=20, primary_key=True, serialize=False, verbose_name='Durum')),
+                ('count', models.PositiveIntegerField(default=0, verbose_name='Talep Sayısı')),
+            ],
+            options={
+                'verbose_name': 'Servis Durum Sayacı',
+                'verbose_name_plural': 'Servis Durum Sayaçları',
+                'ordering': ['status'],
+            },
+        ),
+        migrations.RunPython(backfill_service_status_counters, migrations.RunPython.noop),
+    ]
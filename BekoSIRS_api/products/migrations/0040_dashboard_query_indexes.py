@@ -0,0 +1,37 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0039_service_status_counter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', 'date_joined'], name='user_role_joined_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='customuser',
+            index=models.Index(fields=['role', 'last_login'], name='user_role_login_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='installmentplan',
+            index=models.Index(fields=['created_at'], name='instplan_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='productownership',
+            index=models.Index(fields=['purchase_date'], name='ownership_purchase_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['product', 'is_approved'], name='review_product_appr_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(fields=['is_approved', 'rating'], name='review_appr_rating_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.7 on 2026-10-16 23:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0040_dashboard_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='productownership',
+            index=models.Index(fields=['customer', 'purchase_date'], name='ownership_cust_purchase_idx'),
+        ),
+    ]
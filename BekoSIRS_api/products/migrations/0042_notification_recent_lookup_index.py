@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:08
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0041_ownership_customer_purchase_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='notification',
+            name='notif_type_idx',
+        ),
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['notification_type', 'created_at', 'user', 'related_product'], name='notif_type_recent_idx'),
+        ),
+    ]
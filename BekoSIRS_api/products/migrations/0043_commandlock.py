@@ -0,0 +1,27 @@
+# Generated by Django 4.2.7 on 2026-10-17 00:19
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('products', '0042_notification_recent_lookup_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True, verbose_name='Komut Adı')),
+                ('token', models.CharField(max_length=32, verbose_name='Sahip Anahtarı')),
+                ('acquired_at', models.DateTimeField(auto_now_add=True, verbose_name='Alınma Zamanı')),
+                ('expires_at', models.DateTimeField(verbose_name='Geçerlilik Sonu')),
+            ],
+            options={
+                'verbose_name': 'Komut Kilidi',
+                'verbose_name_plural': 'Komut Kilitleri',
+            },
+        ),
+    ]
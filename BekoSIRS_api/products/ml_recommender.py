@@ -150,13 +150,14 @@
 #     Neural Networks. ICLR 2016 (arXiv:1511.06939).
 #     → Çevrimiçi CTR ölçümünün temel online değerlendirme metriği olarak kullanımı.
 # ==============================================================================
+import bisect
 import math
 import os
 import time
 import threading
 import logging
 import warnings
-from datetime import date as dt_date, datetime as dt_datetime, time as dt_time, timedelta, timezone as dt_timezone
+from datetime import date as dt_date, datetime as dt_datetime, timedelta, timezone as dt_timezone
 
 import numpy as np
 import pandas as pd
@@ -165,6 +166,7 @@ from functools import lru_cache
 
 from django.conf import settings
 from django.core.cache import cache
+from django.db import IntegrityError, transaction
 
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
@@ -191,7 +193,10 @@ ITEMITEM_MODEL_PATH = os.path.join(ML_MODELS_DIR, 'itemitem_model.pkl')
 # ---------------------------------------------------------------------------
 # Zamana duyarli puan yardimcilari
 # ---------------------------------------------------------------------------
-def temporal_weight(interaction_date, half_life_days=30):
+_LN2 = math.log(2)
+
+
+def temporal_weight(interaction_date, half_life_days=30, now=None):
     """
     Zamana duyarli bir etkilesim icin ustel curume katsayisi hesaplar.
 
@@ -199,6 +204,8 @@ def temporal_weight(interaction_date, half_life_days=30):
         interaction_date: Etkilesimin olustugu tarih ya da zaman damgasi.
         half_life_days: Katkinin yarilanacagi gun sayisi. Ornegin 30 ise
             30 gunluk bir etkilesim 0.5 agirlik alir.
+        now: UTC referans zamani. Dongu icinde cok sayida etkilesim
+            agirliklandirilirken bir kez alinip gecirilir.
 
     Yari omur tabanli ustel curume secildi cunku keskin bir esik koymak yerine
     etkilesimi yumusak sekilde azaltir ve "her 30 gunde yariya iner" diye
@@ -209,23 +216,24 @@ def temporal_weight(interaction_date, half_life_days=30):
     if interaction_date is None:
         return 1.0
 
-    normalized_date = interaction_date
-    if isinstance(normalized_date, dt_date) and not isinstance(normalized_date, dt_datetime):
-        # Satin alma kayitlari yalnizca gun tuttugu icin tum veri tiplerini
-        # ayni formulde kullanabilmek adina gun basina normalize ediyoruz.
-        normalized_date = dt_datetime.combine(normalized_date, dt_time.min)
-
-    if normalized_date.tzinfo is None:
-        # Tum tarihler ayni saat diliminde olmali; aksi halde ayni veri farkli
-        # ortamlarda farkli yari omur sonucuna gidebilir.
-        normalized_date = normalized_date.replace(tzinfo=dt_timezone.utc)
+    if now is None:
+        now = dt_datetime.now(dt_timezone.utc)
 
-    now = dt_datetime.now(dt_timezone.utc)
-    days_old = max(0, (now - normalized_date).days)
+    if isinstance(interaction_date, dt_date) and not isinstance(interaction_date, dt_datetime):
+        # Satin alma kayitlari yalnizca gun tutar; UTC gece yarisina gore gun farki
+        # tam sayi ordinal farkina esittir (ara datetime/timedelta nesnesi uretilmez).
+        days_old = max(0, now.toordinal() - interaction_date.toordinal())
+    else:
+        normalized_date = interaction_date
+        if normalized_date.tzinfo is None:
+            # Tum tarihler ayni saat diliminde olmali; aksi halde ayni veri farkli
+            # ortamlarda farkli yari omur sonucuna gidebilir.
+            normalized_date = normalized_date.replace(tzinfo=dt_timezone.utc)
+        days_old = max(0, (now - normalized_date).days)
 
     # Ustel curume formulu: exp(-ln(2) * gun_sayisi / yari_omur)
     # Ornek: yari omur 30 ise 30 gunluk etkilesim 0.5, 60 gunluk etkilesim 0.25 olur.
-    return math.exp(-math.log(2) * days_old / half_life_days)
+    return math.exp(-_LN2 * days_old / half_life_days)
 
 
 # ---------------------------------------------------------------------------
@@ -938,6 +946,13 @@ class HybridRecommender:
     # Yeni eklenen stokta urunler, gecmis populerlik sinyalleri birikmeden
     # oneri listesine girebilsin diye gecici bir kesif boost'u alir.
     NEW_PRODUCT_MAX_AGE_DAYS = 30
+    # Kova ust sinirlari (gun, dahil) ve karsilik gelen bonuslar; son kova
+    # NEW_PRODUCT_MAX_AGE_DAYS ile kapanir. Kova eklemek yalnizca bu iki demeti uzatir.
+    NEW_PRODUCT_BOOST_AGES = (7, 14)
+    NEW_PRODUCT_BOOST_VALUES = (0.4, 0.25, 0.1)
+
+    # Arka plan on-uretiminde biriken oneri satirlari bu boyutta paketlerle yazilir.
+    PREGEN_INSERT_BATCH = 1000
 
     # Implicit negative sampling: kullanici son donemde bir urune bakmis ama
     # ne wishlist'e eklemis ne de satin almistir. Bu pasif gozlem zayif bir
@@ -1009,24 +1024,65 @@ class HybridRecommender:
                 from .models import Recommendation
                 from django.contrib.auth import get_user_model
                 User = get_user_model()
+
+                def flush(rows):
+                    # A concurrent on-demand generation can insert the same
+                    # (customer, product) pair; fall back to per-user inserts so
+                    # one conflict doesn't drop every other user in the batch.
+                    try:
+                        with transaction.atomic():
+                            Recommendation.objects.bulk_create(rows, batch_size=self.PREGEN_INSERT_BATCH)
+                        return
+                    except IntegrityError:
+                        pass
+                    by_user = {}
+                    for row in rows:
+                        by_user.setdefault(row.customer_id, []).append(row)
+                    for user_id, user_rows in by_user.items():
+                        try:
+                            with transaction.atomic():
+                                Recommendation.objects.bulk_create(user_rows)
+                        except IntegrityError as e:
+                            logger.debug("Pre-gen insert skipped for user %s: %s", user_id, e)
+
                 # Only customers who don't already have recommendations
-                customers = User.objects.filter(role='customer')
+                # (one anti-join instead of an exists() query per customer)
+                customer_ids = list(
+                    User.objects.filter(role='customer', recommendations__isnull=True)
+                    .values_list('id', flat=True)
+                )
+                # Only ids are held in memory; users are loaded 500 at a time.
+                # Separate chunk queries instead of one open cursor because the
+                # loop inserts into the table the anti-join reads.
+                customers = (
+                    user
+                    for start in range(0, len(customer_ids), 500)
+                    for user in User.objects.filter(id__in=customer_ids[start:start + 500])
+                )
+                # Rows from many users are inserted together: one INSERT per
+                # PREGEN_INSERT_BATCH rows instead of one per recommendation
+                pending = []
                 for user in customers:
-                    has_recs = Recommendation.objects.filter(customer=user).exists()
-                    if not has_recs:
-                        try:
-                            recs = self.recommend(user, top_n=10, ignore_cache=True)
-                            if recs:
-                                for rec in recs:
-                                    Recommendation.objects.create(
-                                        customer=user,
-                                        product_id=rec['product_id'],
-                                        score=rec.get('score', 0),
-                                        reason=rec.get('reason', 'AI önerisi')
-                                    )
-                                logger.info("📦 Pre-generated recs for user %s", user.id)
-                        except Exception as e:
-                            logger.debug("Pre-gen failed for user %s: %s", user.id, e)
+                    try:
+                        recs = self.recommend(user, top_n=10, ignore_cache=True)
+                        if recs:
+                            pending.extend(
+                                Recommendation(
+                                    customer=user,
+                                    product_id=rec['product_id'],
+                                    score=rec.get('score', 0),
+                                    reason=rec.get('reason', 'AI önerisi')
+                                )
+                                for rec in recs
+                            )
+                            logger.info("📦 Pre-generated recs for user %s", user.id)
+                    except Exception as e:
+                        logger.debug("Pre-gen failed for user %s: %s", user.id, e)
+                    if len(pending) >= self.PREGEN_INSERT_BATCH:
+                        flush(pending)
+                        pending = []
+                if pending:
+                    flush(pending)
                 logger.info("Background pre-generation complete")
             except Exception as e:
                 logger.warning("Background pre-generation failed: %s", e)
@@ -1383,6 +1439,8 @@ class HybridRecommender:
                 return cached
 
         interactions = {}
+        # Tum etkilesimler ayni referans zamanina gore curutulur
+        now = dt_datetime.now(dt_timezone.utc)
 
         # Satin almalar kalici tercih sinyalidir; bu nedenle yari omurleri daha uzundur.
         for ownership in ProductOwnership.objects.filter(
@@ -1391,6 +1449,7 @@ class HybridRecommender:
             decay = temporal_weight(
                 ownership['purchase_date'],
                 half_life_days=self.DECAY_PURCHASE_DAYS,
+                now=now,
             )
             interactions[ownership['product_id']] = (
                 interactions.get(ownership['product_id'], 0) + (5.0 * decay)
@@ -1403,6 +1462,7 @@ class HybridRecommender:
             decay = temporal_weight(
                 r['created_at'],
                 half_life_days=self.DECAY_REVIEW_DAYS,
+                now=now,
             )
             interactions[r['product_id']] = (
                 interactions.get(r['product_id'], 0) + (float(r['rating']) * decay)
@@ -1416,6 +1476,7 @@ class HybridRecommender:
             decay = temporal_weight(
                 item['added_at'],
                 half_life_days=self.DECAY_WISHLIST_DAYS,
+                now=now,
             )
             interactions[item['product_id']] = (
                 interactions.get(item['product_id'], 0) + (3.0 * decay)
@@ -1428,6 +1489,7 @@ class HybridRecommender:
             decay = temporal_weight(
                 vh['viewed_at'],
                 half_life_days=self.DECAY_VIEW_DAYS,
+                now=now,
             )
             interactions[vh['product_id']] = interactions.get(vh['product_id'], 0) + (weight * decay)
 
@@ -1439,6 +1501,7 @@ class HybridRecommender:
             decay = temporal_weight(
                 rec['created_at'],
                 half_life_days=self.DECAY_CLICK_DAYS,
+                now=now,
             )
             interactions[rec['product_id']] = interactions.get(rec['product_id'], 0) + (2.0 * decay)
 
@@ -1535,6 +1598,9 @@ class HybridRecommender:
             stock__gt=0,
         ).values('id', 'created_at')
 
+        age_limits = self.NEW_PRODUCT_BOOST_AGES + (self.NEW_PRODUCT_MAX_AGE_DAYS,)
+        boost_values = self.NEW_PRODUCT_BOOST_VALUES
+
         for product in recent_products:
             created_at = product['created_at']
             if created_at is None:
@@ -1546,12 +1612,10 @@ class HybridRecommender:
             days_old = max(0, (now - created_at).days)
             # Kaba kovalar secildi cunku urun ekibine anlatmasi kolaydir:
             # 3 gunluk urun 0.4, 10 gunluk urun 0.25, 20 gunluk urun 0.1 bonus alir.
-            if days_old <= 7:
-                boosts[product['id']] = 0.4
-            elif days_old <= 14:
-                boosts[product['id']] = 0.25
-            elif days_old <= self.NEW_PRODUCT_MAX_AGE_DAYS:
-                boosts[product['id']] = 0.1
+            # Kova secimi ikili arama ile: ust siniri days_old'dan kucuk olmayan ilk kova
+            tier = bisect.bisect_left(age_limits, days_old)
+            if tier < len(boost_values):
+                boosts[product['id']] = boost_values[tier]
 
         return boosts
 
@@ -2122,15 +2186,19 @@ class HybridRecommender:
                  len(sorted_items),
                  user.id if user else 'Guest',
              )
-             # Check one for debug
-             pid, score = sorted_items[0]
-             try:
-                 p_id = int(pid)
-                 p = Product.objects.get(id=p_id)
-                 p_cat = str(p.category.name).strip() if p.category else 'Other'
-                 logger.info(f"   Debug candidate 0: ID={p_id}, Name={p.name}, Cat={p_cat}, UserCats={user_categories}")
-             except Exception as e: 
-                 logger.error(f"   Debug failed: {e}")
+             # Check one for debug (extra query only when DEBUG logging is on)
+             if logger.isEnabledFor(logging.DEBUG):
+                 pid, score = sorted_items[0]
+                 try:
+                     p_id = int(pid)
+                     p = Product.objects.get(id=p_id)
+                     p_cat = str(p.category.name).strip() if p.category else 'Other'
+                     logger.debug(
+                         "   Debug candidate 0: ID=%s, Name=%s, Cat=%s, UserCats=%s",
+                         p_id, p.name, p_cat, user_categories,
+                     )
+                 except Exception as e:
+                     logger.debug("   Debug failed: %s", e)
 
         return diverse_items
 
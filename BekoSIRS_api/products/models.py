@@ -69,6 +69,13 @@ class CustomUser(AbstractUser):
     # Push Notification Token (Expo)
     push_token = models.CharField(max_length=200, blank=True, null=True, verbose_name="Push Token")
 
+    class Meta(AbstractUser.Meta):
+        indexes = [
+            # Dashboard müşteri sayımları (role='customer' + tarih aralığı)
+            models.Index(fields=['role', 'date_joined'], name='user_role_joined_idx'),
+            models.Index(fields=['role', 'last_login'], name='user_role_login_idx'),
+        ]
+
     # Adres Bilgileri (Taşındı -> CustomerAddress)
     # address_* fields removed
 
@@ -156,6 +163,13 @@ class ProductOwnership(models.Model):
     purchase_date = models.DateField()
     serial_number = models.CharField(max_length=100, blank=True, null=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['purchase_date'], name='ownership_purchase_idx'),
+            # Müşterinin satın alma geçmişi (öneri etkileşimleri, tarih sıralı sorgular)
+            models.Index(fields=['customer', 'purchase_date'], name='ownership_cust_purchase_idx'),
+        ]
+
     def __str__(self):
         return f"{self.customer.username} owns {self.product.name}"
 
@@ -297,6 +311,10 @@ class Review(models.Model):
     class Meta:
         unique_together = ('customer', 'product')
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['product', 'is_approved'], name='review_product_appr_idx'),
+            models.Index(fields=['is_approved', 'rating'], name='review_appr_rating_idx'),
+        ]
 
     def __str__(self):
         return f"{self.customer.username} - {self.product.name} ({self.rating}/5)"
@@ -373,6 +391,32 @@ class ServiceRequest(models.Model):
         return f"SR-{self.id}: {self.customer.username} - {product_name}"
 
 
+# -------------------------------
+# 🔹 Service Status Counter (Servis Durum Sayacı)
+# -------------------------------
+class ServiceStatusCounter(models.Model):
+    """
+    Durum başına servis talebi sayısı.
+    products.signals tarafından her ServiceRequest yazımında güncellenir;
+    dashboard ekranları ServiceRequest tablosunu gruplamak yerine bu satırları okur.
+    """
+    status = models.CharField(
+        max_length=20,
+        primary_key=True,
+        choices=ServiceRequest.STATUS_CHOICES,
+        verbose_name="Durum"
+    )
+    count = models.PositiveIntegerField(default=0, verbose_name="Talep Sayısı")
+
+    class Meta:
+        ordering = ['status']
+        verbose_name = "Servis Durum Sayacı"
+        verbose_name_plural = "Servis Durum Sayaçları"
+
+    def __str__(self):
+        return f"{self.get_status_display()}: {self.count}"
+
+
 # -------------------------------
 # 🔹 ServiceQueue (Servis Kuyruğu)
 # -------------------------------
@@ -445,7 +489,13 @@ class Notification(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', 'is_read'], name='notif_user_read_idx'),
-            models.Index(fields=['notification_type'], name='notif_type_idx'),
+            # Cron/overdue "son 7 günde bildirildi mi" taraması: tür + tarih aralığı,
+            # (kullanıcı, ürün) çiftleri tabloya dönmeden indeksten okunur.
+            # Tek başına notification_type filtreleri de bu indeksin önekini kullanır.
+            models.Index(
+                fields=['notification_type', 'created_at', 'user', 'related_product'],
+                name='notif_type_recent_idx',
+            ),
             models.Index(fields=['created_at'], name='notif_created_idx'),
         ]
 
@@ -716,6 +766,14 @@ class ProductAssignment(models.Model):
         verbose_name="Ürün"
     )
     quantity = models.PositiveIntegerField(default=1, verbose_name="Adet")
+    unit_price = models.DecimalField(
+        max_digits=10,
+        decimal_places=2,
+        null=True,
+        blank=True,
+        verbose_name="Birim Satış Fiyatı",
+        help_text="Satış anındaki ürün fiyatı (sonraki fiyat değişikliklerinden etkilenmez)"
+    )
     assigned_at = models.DateTimeField(auto_now_add=True, verbose_name="Atama Tarihi")
     assigned_by = models.ForeignKey(
         CustomUser, 
@@ -735,12 +793,54 @@ class ProductAssignment(models.Model):
 
     class Meta:
         ordering = ['-assigned_at']
+        indexes = [
+            models.Index(fields=['assigned_at', 'product'], name='assign_date_product_idx'),
+        ]
         verbose_name = "Ürün Atama"
         verbose_name_plural = "Ürün Atamaları"
 
     def __str__(self):
         return f"{self.customer.first_name} - {self.product.name} ({self.get_status_display()})"
 
+    def save(self, *args, **kwargs):
+        # Ciro raporları ürün tablosuna join yapmadan satış anındaki fiyatı kullanır
+        if self.unit_price is None and self.product_id:
+            self.unit_price = self.product.price
+        super().save(*args, **kwargs)
+
+
+# -------------------------------
+# 🔹 Sales Monthly Aggregate (Aylık Satış Özeti)
+# -------------------------------
+class SalesMonthlyAggregate(models.Model):
+    """
+    ProductAssignment kayıtlarının ay + ürün bazında önceden hesaplanmış toplamı.
+    products.signals tarafından her satışta güncellenir; grafik/tahmin ekranları
+    tüm satış tablosunu gruplamak yerine bu tabloyu okur.
+    """
+    month = models.DateField(verbose_name="Ay", help_text="Ayın ilk günü (yerel saat)")
+    product = models.ForeignKey(
+        Product,
+        on_delete=models.CASCADE,
+        related_name='monthly_sales',
+        verbose_name="Ürün"
+    )
+    quantity = models.PositiveIntegerField(default=0, verbose_name="Satılan Adet")
+    order_count = models.PositiveIntegerField(default=0, verbose_name="Satış Kaydı Sayısı")
+    revenue = models.DecimalField(
+        max_digits=14, decimal_places=2, default=0, verbose_name="Ciro",
+        help_text="Adet × satış anındaki birim fiyat toplamı"
+    )
+
+    class Meta:
+        unique_together = ('month', 'product')
+        ordering = ['-month']
+        verbose_name = "Aylık Satış Özeti"
+        verbose_name_plural = "Aylık Satış Özetleri"
+
+    def __str__(self):
+        return f"{self.month:%Y-%m} - {self.product.name}: {self.quantity}"
+
 
 
 # -------------------------------
@@ -934,6 +1034,7 @@ class InstallmentPlan(models.Model):
         indexes = [
             models.Index(fields=['customer', 'status'], name='instplan_cust_status_idx'),
             models.Index(fields=['status'], name='instplan_status_idx'),
+            models.Index(fields=['created_at'], name='instplan_created_idx'),
         ]
 
     def __str__(self):
@@ -1136,3 +1237,24 @@ class MLModelStore(models.Model):
     def __str__(self):
         size_kb = len(self.data) / 1024 if self.data else 0
         return f"{self.name} ({size_kb:.1f} KB) - {self.updated_at}"
+
+
+# -------------------------------
+# 🔹 CommandLock (Cron Komut Kilidi)
+# -------------------------------
+class CommandLock(models.Model):
+    """
+    Aynı management command'ın çakışan çalıştırmalarını engelleyen kilit satırı.
+    name üzerindeki unique kısıt kilidi tüm veritabanı backend'lerinde atomik kılar.
+    """
+    name = models.CharField(max_length=100, unique=True, verbose_name="Komut Adı")
+    token = models.CharField(max_length=32, verbose_name="Sahip Anahtarı")
+    acquired_at = models.DateTimeField(auto_now_add=True, verbose_name="Alınma Zamanı")
+    expires_at = models.DateTimeField(verbose_name="Geçerlilik Sonu")
+
+    class Meta:
+        verbose_name = "Komut Kilidi"
+        verbose_name_plural = "Komut Kilitleri"
+
+    def __str__(self):
+        return f"{self.name} (bitiş: {self.expires_at})"
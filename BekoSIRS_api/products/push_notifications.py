@@ -8,6 +8,15 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+EXPO_PUSH_URL = 'https://exp.host/--/api/v2/push/send'
+
+# Her istekte aynı; çağrı başına yeniden oluşturulmaz
+_EXPO_HEADERS = {
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    'Accept-Encoding': 'gzip, deflate',
+}
+
 
 def send_push(push_token: str, title: str, body: str, data: dict = None) -> bool:
     """
@@ -27,13 +36,9 @@ def send_push(push_token: str, title: str, body: str, data: dict = None) -> bool
     }).encode('utf-8')
 
     req = urllib.request.Request(
-        'https://exp.host/--/api/v2/push/send',
+        EXPO_PUSH_URL,
         data=payload,
-        headers={
-            'Content-Type': 'application/json',
-            'Accept': 'application/json',
-            'Accept-Encoding': 'gzip, deflate',
-        },
+        headers=_EXPO_HEADERS,
         method='POST'
     )
 
@@ -41,10 +46,10 @@ def send_push(push_token: str, title: str, body: str, data: dict = None) -> bool
         with urllib.request.urlopen(req, timeout=5) as r:
             result = json.loads(r.read())
             if result.get('data', {}).get('status') == 'error':
-                logger.warning(f"Push notification error: {result}")
+                logger.warning("Push notification error: %s", result)
             return True
     except Exception as e:
-        logger.warning(f"Push notification failed for token {push_token[:20]}...: {e}")
+        logger.warning("Push notification failed for token %s...: %s", push_token[:20], e)
         return False
 
 
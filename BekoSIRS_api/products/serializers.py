@@ -1,5 +1,6 @@
 from rest_framework import serializers, validators
 from django.contrib.auth.models import Group, Permission
+from django.db.models import Sum
 from .models import (
     Category, Product, ProductOwnership, CustomUser,
     Wishlist, WishlistItem, ViewHistory, Review,
@@ -630,10 +631,10 @@ class ProductAssignmentSerializer(serializers.ModelSerializer):
         model = ProductAssignment
         fields = [
             'id', 'customer', 'customer_id', 'product', 'product_id', 
-            'quantity', 'assigned_at', 'status', 'status_display', 'notes', 
+            'quantity', 'unit_price', 'assigned_at', 'status', 'status_display', 'notes', 
             'assigned_by', 'delivery_info'
         ]
-        read_only_fields = ['id', 'assigned_at', 'assigned_by']
+        read_only_fields = ['id', 'unit_price', 'assigned_at', 'assigned_by']
 
     def get_delivery_info(self, obj):
         try:
@@ -846,7 +847,11 @@ class InstallmentPlanSerializer(serializers.ModelSerializer):
         ]
 
     def get_paid_amount(self, obj):
-        paid = sum(inst.amount for inst in obj.installments.filter(status='paid'))
+        # Views annotate paid_installments_total; otherwise sum in SQL once and keep it on the instance
+        paid = getattr(obj, 'paid_installments_total', None)
+        if paid is None:
+            paid = obj.installments.filter(status='paid').aggregate(total=Sum('amount'))['total'] or 0
+            obj.paid_installments_total = paid
         return paid + obj.down_payment
 
     def get_remaining_amount(self, obj):
@@ -977,6 +977,7 @@ def approve_plan(plan_data: Dict[str, Any]) -> Dict[str, Any]:
                         customer=orig.customer,
                         product=orig.product,
                         quantity=pi['quantity'],
+                        unit_price=orig.unit_price,
                         status='PLANNED',
                         assigned_by=orig.assigned_by,
                         notes=(f"[{pi.get('split_index')}/{pi.get('split_total')} parti — "
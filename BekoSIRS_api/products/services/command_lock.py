@@ -0,0 +1,46 @@
+"""
+Single-run lock for cron management commands.
+
+The lock is a products.CommandLock row with a unique name, so two overlapping
+runs (cron overlap on one host, or two hosts sharing the database) cannot both
+write notifications. It works on every supported backend (MSSQL, PostgreSQL,
+SQLite) without a shared cache.
+"""
+
+import uuid
+from contextlib import contextmanager
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from ..models import CommandLock
+
+
+@contextmanager
+def command_lock(name, timeout=60 * 60):
+    """
+    Yield True if this run holds the lock for ``name``, False if another run does.
+
+    ``timeout`` bounds how long a crashed run can keep the lock; an expired lock
+    is taken over by the next run.
+    """
+    token = uuid.uuid4().hex
+    now = timezone.now()
+    expires_at = now + timedelta(seconds=timeout)
+    try:
+        with transaction.atomic():
+            CommandLock.objects.create(name=name, token=token, expires_at=expires_at)
+        acquired = True
+    except IntegrityError:
+        # Conditional UPDATE: only one run can take over an expired lock
+        acquired = bool(
+            CommandLock.objects.filter(name=name, expires_at__lt=now)
+            .update(token=token, acquired_at=now, expires_at=expires_at)
+        )
+    try:
+        yield acquired
+    finally:
+        # Only release our own lock; an expired one may already belong to the next run
+        if acquired:
+            CommandLock.objects.filter(name=name, token=token).delete()
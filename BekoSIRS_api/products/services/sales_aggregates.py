@@ -0,0 +1,89 @@
+"""
+Sales Aggregate Service
+=======================
+Maintains SalesMonthlyAggregate, the per-month / per-product rollup of
+ProductAssignment that the analytics views read instead of grouping the
+whole sales table on every request.
+
+Single-row writes are applied incrementally from products.signals
+(apply_sales_delta). bulk_create / queryset.update() do not send signals, so
+scripts that load sales in bulk must call rebuild_sales_aggregates() afterwards.
+"""
+
+from django.db import transaction
+from django.db.models import Count, DateField, DecimalField, F, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+from django.utils import timezone
+
+
+def month_bucket(value):
+    """Return the first day of the (local time) month of a datetime."""
+    if timezone.is_aware(value):
+        value = timezone.localtime(value)
+    return value.date().replace(day=1)
+
+
+def sale_revenue(quantity, unit_price):
+    """Revenue of one ProductAssignment row (unit price captured at sale time)."""
+    return (unit_price or 0) * quantity
+
+
+def apply_sales_delta(product_id, month, quantity, orders, revenue=0):
+    """Atomically add quantity / order-count / revenue deltas to one month+product row."""
+    from products.models import SalesMonthlyAggregate
+
+    if not quantity and not orders and not revenue:
+        return
+    rows = SalesMonthlyAggregate.objects.filter(product_id=product_id, month=month)
+    deltas = {
+        'quantity': F('quantity') + quantity,
+        'order_count': F('order_count') + orders,
+        'revenue': F('revenue') + revenue,
+    }
+    if rows.update(**deltas):
+        return
+    if quantity <= 0 and orders <= 0:
+        # Nothing to subtract from, e.g. the row was already removed by a
+        # product delete cascading ahead of its assignments.
+        return
+    _, created = SalesMonthlyAggregate.objects.get_or_create(
+        product_id=product_id,
+        month=month,
+        defaults={'quantity': quantity, 'order_count': orders, 'revenue': revenue},
+    )
+    if not created:
+        # A concurrent sale created the row between our update and insert.
+        rows.update(**deltas)
+
+
+@transaction.atomic
+def rebuild_sales_aggregates():
+    """Recompute the whole rollup from ProductAssignment. Returns the row count."""
+    from products.models import ProductAssignment, SalesMonthlyAggregate
+
+    SalesMonthlyAggregate.objects.all().delete()
+    rows = (
+        ProductAssignment.objects
+        .annotate(bucket=TruncMonth('assigned_at', output_field=DateField()))
+        .values('product_id', 'bucket')
+        .annotate(
+            total_quantity=Sum('quantity'),
+            orders=Count('id'),
+            total_revenue=Coalesce(Sum(F('unit_price') * F('quantity')), Value(0), output_field=DecimalField()),
+        )
+        .order_by()
+    )
+    created = SalesMonthlyAggregate.objects.bulk_create(
+        [
+            SalesMonthlyAggregate(
+                product_id=row['product_id'],
+                month=row['bucket'],
+                quantity=row['total_quantity'],
+                order_count=row['orders'],
+                revenue=row['total_revenue'],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+    return len(created)
@@ -0,0 +1,49 @@
+"""
+Service Status Counter Service
+==============================
+Maintains ServiceStatusCounter, one row per ServiceRequest status, so the
+dashboard reads a handful of rows instead of grouping the whole
+ServiceRequest table on every load.
+
+Single-row writes are applied from products.signals (apply_status_delta).
+Call rebuild_service_status_counters() after bulk writes that bypass signals.
+"""
+
+from django.db import transaction
+from django.db.models import Count, F
+
+
+def apply_status_delta(status, delta):
+    """Atomically add delta to the counter row of the given status."""
+    from products.models import ServiceStatusCounter
+
+    if not delta or not status:
+        return
+    rows = ServiceStatusCounter.objects.filter(status=status)
+    if rows.update(count=F('count') + delta) or delta < 0:
+        return
+    _, created = ServiceStatusCounter.objects.get_or_create(status=status, defaults={'count': delta})
+    if not created:
+        # A concurrent request created the row between our update and insert.
+        rows.update(count=F('count') + delta)
+
+
+def status_counts():
+    """Return {status: count} for every status, zero-filled."""
+    from products.models import ServiceRequest, ServiceStatusCounter
+
+    counts = {code: 0 for code, _ in ServiceRequest.STATUS_CHOICES}
+    counts.update(ServiceStatusCounter.objects.values_list('status', 'count'))
+    return counts
+
+
+@transaction.atomic
+def rebuild_service_status_counters():
+    """Recompute every counter from ServiceRequest."""
+    from products.models import ServiceRequest, ServiceStatusCounter
+
+    ServiceStatusCounter.objects.all().delete()
+    ServiceStatusCounter.objects.bulk_create([
+        ServiceStatusCounter(status=row['status'], count=row['total'])
+        for row in ServiceRequest.objects.values('status').annotate(total=Count('id')).order_by()
+    ])
@@ -4,11 +4,35 @@ Automatic AuditLog generation for key model CRUD operations.
 Registers Django post_save and post_delete signals for important models.
 """
 import logging
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_save, post_delete, pre_save
 from django.dispatch import receiver
 
 logger = logging.getLogger(__name__)
 
+# Cache key holding the current generation of a model's cached admin changelist.
+# Bumping it makes products.admin.CachedChangelistMixin render a fresh page.
+ADMIN_CHANGELIST_GENERATION_KEY = 'admin-changelist-gen:{}'
+
+
+# Cached dashboard payloads (analytics ChartsView / DashboardSummaryView).
+DASHBOARD_CHARTS_CACHE_KEY = 'dashboard:charts'
+DASHBOARD_SUMMARY_CACHE_KEY = 'dashboard:summary'
+SEASONAL_ANALYSIS_CACHE_KEY = 'analytics:seasonal'
+
+# Users resolved from JWTs (products.authentication.CachedJWTAuthentication).
+AUTH_USER_CACHE_KEY = 'auth-user:{}'
+
+
+def bump_admin_changelist_generation(model_label):
+    """Invalidate cached admin changelist pages for the given model label."""
+    from django.core.cache import cache
+
+    key = ADMIN_CHANGELIST_GENERATION_KEY.format(model_label)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
 
 def _create_audit_log(action, instance, model_name, user=None, changes=None):
     """Helper to create an AuditLog entry."""
@@ -36,7 +60,7 @@ def _extract_user(instance):
 
 
 # ─── ProductAssignment ───
-@receiver(post_save, sender='products.ProductAssignment')
+@receiver(post_save, sender='products.ProductAssignment', dispatch_uid='products.signals.log_assignment_save')
 def log_assignment_save(sender, instance, created, **kwargs):
     action = 'create' if created else 'update'
     user = _extract_user(instance)
@@ -49,13 +73,64 @@ def log_assignment_save(sender, instance, created, **kwargs):
     _create_audit_log(action, instance, 'ProductAssignment', user=user, changes=changes)
 
 
-@receiver(post_delete, sender='products.ProductAssignment')
+@receiver(post_delete, sender='products.ProductAssignment', dispatch_uid='products.signals.log_assignment_delete')
 def log_assignment_delete(sender, instance, **kwargs):
     _create_audit_log('delete', instance, 'ProductAssignment', user=_extract_user(instance))
 
 
+@receiver(pre_save, sender='products.ProductAssignment', dispatch_uid='products.signals.remember_assignment_sales_bucket')
+def remember_assignment_sales_bucket(sender, instance, raw=False, **kwargs):
+    """Keep the pre-update bucket so the monthly aggregate can move it on post_save."""
+    instance._sales_bucket_before = None
+    if raw or instance.pk is None:
+        return
+    previous = (
+        sender.objects.filter(pk=instance.pk)
+        .values('product_id', 'assigned_at', 'quantity', 'unit_price')
+        .first()
+    )
+    if previous is not None:
+        instance._sales_bucket_before = previous
+
+
+@receiver(post_save, sender='products.ProductAssignment', dispatch_uid='products.signals.update_sales_monthly_aggregate')
+def update_sales_monthly_aggregate(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    from products.services.sales_aggregates import apply_sales_delta, month_bucket, sale_revenue
+
+    previous = getattr(instance, '_sales_bucket_before', None)
+    instance._sales_bucket_before = None
+    new_key = (instance.product_id, month_bucket(instance.assigned_at))
+    new_revenue = sale_revenue(instance.quantity, instance.unit_price)
+    if previous is None:
+        apply_sales_delta(*new_key, instance.quantity, 1, new_revenue)
+        return
+
+    old_key = (previous['product_id'], month_bucket(previous['assigned_at']))
+    old_revenue = sale_revenue(previous['quantity'], previous['unit_price'])
+    if old_key == new_key:
+        apply_sales_delta(*new_key, instance.quantity - previous['quantity'], 0, new_revenue - old_revenue)
+    else:
+        apply_sales_delta(*old_key, -previous['quantity'], -1, -old_revenue)
+        apply_sales_delta(*new_key, instance.quantity, 1, new_revenue)
+
+
+@receiver(post_delete, sender='products.ProductAssignment', dispatch_uid='products.signals.update_sales_monthly_aggregate_on_delete')
+def update_sales_monthly_aggregate_on_delete(sender, instance, **kwargs):
+    from products.services.sales_aggregates import apply_sales_delta, month_bucket, sale_revenue
+
+    apply_sales_delta(
+        instance.product_id,
+        month_bucket(instance.assigned_at),
+        -instance.quantity,
+        -1,
+        -sale_revenue(instance.quantity, instance.unit_price),
+    )
+
+
 # ─── Product ───
-@receiver(post_save, sender='products.Product')
+@receiver(post_save, sender='products.Product', dispatch_uid='products.signals.log_product_save')
 def log_product_save(sender, instance, created, **kwargs):
     action = 'create' if created else 'update'
     changes = {
@@ -66,13 +141,57 @@ def log_product_save(sender, instance, created, **kwargs):
     _create_audit_log(action, instance, 'Product', changes=changes)
 
 
-@receiver(post_delete, sender='products.Product')
+@receiver(post_delete, sender='products.Product', dispatch_uid='products.signals.log_product_delete')
 def log_product_delete(sender, instance, **kwargs):
     _create_audit_log('delete', instance, 'Product')
 
 
+# ─── Admin changelist cache ───
+@receiver(post_save, sender='products.Product', dispatch_uid='products.signals.invalidate_admin_changelist')
+@receiver(post_delete, sender='products.Product', dispatch_uid='products.signals.invalidate_admin_changelist')
+@receiver(post_save, sender='products.Category', dispatch_uid='products.signals.invalidate_admin_changelist')
+@receiver(post_delete, sender='products.Category', dispatch_uid='products.signals.invalidate_admin_changelist')
+def invalidate_admin_changelist(sender, **kwargs):
+    bump_admin_changelist_generation(sender._meta.label_lower)
+    # The product changelist shows each product's category name
+    if sender._meta.label_lower == 'products.category':
+        bump_admin_changelist_generation('products.product')
+
+
+# ─── Dashboard cache ───
+@receiver(post_save, sender='products.ProductAssignment', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.ProductAssignment', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.InstallmentPlan', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.InstallmentPlan', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.ServiceRequest', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.ServiceRequest', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.ProductOwnership', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.ProductOwnership', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.Review', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.Review', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.Product', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.Product', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_save, sender='products.Category', dispatch_uid='products.signals.invalidate_dashboard_cache')
+@receiver(post_delete, sender='products.Category', dispatch_uid='products.signals.invalidate_dashboard_cache')
+def invalidate_dashboard_cache(sender, **kwargs):
+    """Sales, service, review or catalogue writes make the cached dashboard stale."""
+    from django.core.cache import cache
+
+    cache.delete_many([DASHBOARD_CHARTS_CACHE_KEY, DASHBOARD_SUMMARY_CACHE_KEY, SEASONAL_ANALYSIS_CACHE_KEY])
+
+
+# ─── Authenticated user cache ───
+@receiver(post_save, sender='products.CustomUser', dispatch_uid='products.signals.invalidate_auth_user_cache')
+@receiver(post_delete, sender='products.CustomUser', dispatch_uid='products.signals.invalidate_auth_user_cache')
+def invalidate_auth_user_cache(sender, instance, **kwargs):
+    """Role, activation or password changes must reach the next request."""
+    from django.core.cache import cache
+
+    cache.delete(AUTH_USER_CACHE_KEY.format(instance.pk))
+
+
 # ─── ServiceRequest ───
-@receiver(post_save, sender='products.ServiceRequest')
+@receiver(post_save, sender='products.ServiceRequest', dispatch_uid='products.signals.log_service_save')
 def log_service_save(sender, instance, created, **kwargs):
     action = 'create' if created else 'update'
     changes = {
@@ -82,8 +201,38 @@ def log_service_save(sender, instance, created, **kwargs):
     _create_audit_log(action, instance, 'ServiceRequest', user=instance.customer, changes=changes)
 
 
+@receiver(pre_save, sender='products.ServiceRequest', dispatch_uid='products.signals.remember_service_status')
+def remember_service_status(sender, instance, raw=False, **kwargs):
+    """Keep the pre-update status so the status counters can move it on post_save."""
+    instance._status_before = None
+    if raw or instance.pk is None:
+        return
+    instance._status_before = sender.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+
+
+@receiver(post_save, sender='products.ServiceRequest', dispatch_uid='products.signals.update_service_status_counter')
+def update_service_status_counter(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    from products.services.service_counters import apply_status_delta
+
+    previous = getattr(instance, '_status_before', None)
+    instance._status_before = None
+    if previous == instance.status:
+        return
+    apply_status_delta(previous, -1)
+    apply_status_delta(instance.status, 1)
+
+
+@receiver(post_delete, sender='products.ServiceRequest', dispatch_uid='products.signals.update_service_status_counter_on_delete')
+def update_service_status_counter_on_delete(sender, instance, **kwargs):
+    from products.services.service_counters import apply_status_delta
+
+    apply_status_delta(instance.status, -1)
+
+
 # ─── Delivery ───
-@receiver(post_save, sender='products.Delivery')
+@receiver(post_save, sender='products.Delivery', dispatch_uid='products.signals.log_delivery_save')
 def log_delivery_save(sender, instance, created, **kwargs):
     action = 'create' if created else 'update'
     changes = {'status': instance.status}
@@ -91,7 +240,7 @@ def log_delivery_save(sender, instance, created, **kwargs):
 
 
 # ─── InstallmentPlan ───
-@receiver(post_save, sender='products.InstallmentPlan')
+@receiver(post_save, sender='products.InstallmentPlan', dispatch_uid='products.signals.log_installment_plan_save')
 def log_installment_plan_save(sender, instance, created, **kwargs):
     action = 'create' if created else 'update'
     changes = {
@@ -0,0 +1,95 @@
+"""
+Admin changelist onbelleginin (CachedChangelistMixin) davranis testleri.
+"""
+
+import shutil
+import tempfile
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from products.conftest import BaseTestCase
+from products.models import Category, CustomUser, Product
+
+
+class AdminChangelistCacheTestCase(BaseTestCase):
+    """Urun changelist sayfasi onbellekten donmeli ve yazmalarda yenilenmeli."""
+
+    def setUp(self):
+        # Sayfa onbellegi yalnizca paylasilan (surecler arasi) onbellekte acik
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir, ignore_errors=True)
+        shared_cache = override_settings(CACHES={'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': cache_dir,
+        }})
+        shared_cache.enable()
+        self.addCleanup(shared_cache.disable)
+        cache.clear()
+        self.superuser = CustomUser.objects.create_superuser(
+            username='cache_admin', email='cache_admin@test.com', password='Pass123!', role='admin'
+        )
+        self.client.force_login(self.superuser)
+        self.url = reverse('admin:products_product_changelist')
+
+    def _get(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url, secure=True)
+        self.assertEqual(response.status_code, 200)
+        return response, len(queries.captured_queries)
+
+    def test_repeated_changelist_is_served_from_cache(self):
+        # Ilk istek CSRF cerezini ayarlar; cerezler sabitlendikten sonra sayfa onbellekte olmali.
+        self._get()
+        _, warm_queries = self._get()
+        response, cached_queries = self._get()
+
+        self.assertLess(cached_queries, warm_queries)
+        self.assertIn('no-store', response['Cache-Control'])
+
+    def test_product_save_invalidates_cached_changelist(self):
+        self._get()
+        self._get()
+        Product.objects.create(name='Onbellek Testi TV', brand='Beko', price=Decimal('10.00'), stock=1)
+
+        response, _ = self._get()
+
+        self.assertContains(response, 'Onbellek Testi TV')
+
+    def test_category_rename_invalidates_product_changelist(self):
+        category = Category.objects.create(name='Eski Kategori')
+        Product.objects.create(
+            name='Kategorili Urun', brand='Beko', category=category, price=Decimal('10.00'), stock=1
+        )
+        self._get()
+        self._get()
+        category.name = 'Yeni Kategori'
+        category.save()
+
+        response, _ = self._get()
+
+        self.assertContains(response, 'Yeni Kategori')
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_process_local_cache_disables_changelist_cache(self):
+        self._get()
+        _, warm_queries = self._get()
+        _, repeat_queries = self._get()
+
+        self.assertEqual(repeat_queries, warm_queries)
+
+    def test_cached_page_is_not_shared_between_sessions(self):
+        self._get()
+        self._get()
+        other = CustomUser.objects.create_superuser(
+            username='other_admin', email='other_admin@test.com', password='Pass123!', role='admin'
+        )
+        self.client.force_login(other)
+
+        response, _ = self._get()
+
+        self.assertContains(response, 'other_admin')
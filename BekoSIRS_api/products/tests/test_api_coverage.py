@@ -5,8 +5,12 @@ Recommendation, ServiceRequest, Delivery, Installment, Wishlist, Review endpoint
 import pytest
 from decimal import Decimal
 from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
 from django.contrib.auth import get_user_model
 from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
 from products.models import (
@@ -15,6 +19,7 @@ from products.models import (
     ServiceRequest, Notification,
     InstallmentPlan, Installment, Recommendation,
 )
+from products.services.command_lock import command_lock
 
 User = get_user_model()
 
@@ -325,6 +330,91 @@ class TestCheckOverdueInstallmentsCommand:
             title__startswith='Gecikmiş Taksit',
         ).exists()
 
+    def test_one_notification_per_product_and_week(self, admin_user, customer_user, product):
+        plan = self._create_plan(customer_user, product, admin_user)
+        for number in (1, 2):
+            Installment.objects.create(
+                plan=plan,
+                installment_number=number,
+                amount=Decimal('1000.00'),
+                due_date=date.today() - timedelta(days=40 - 30 * number),
+                status='pending',
+            )
+        call_command('check_overdue_installments')
+        Installment.objects.filter(plan=plan).update(status='pending')
+        call_command('check_overdue_installments')
+        assert Notification.objects.filter(
+            user=customer_user,
+            title__startswith='Gecikmiş Taksit',
+        ).count() == 1
+
+    def test_update_reports_count_without_count_query(self, admin_user, customer_user, product):
+        plan = self._create_plan(customer_user, product, admin_user)
+        for number in (1, 2):
+            Installment.objects.create(
+                plan=plan,
+                installment_number=number,
+                amount=Decimal('1000.00'),
+                due_date=date.today() - timedelta(days=number),
+                status='pending',
+            )
+        out = StringIO()
+        with CaptureQueriesContext(connection) as queries:
+            call_command('check_overdue_installments', stdout=out)
+        assert '2 taksit "overdue" olarak güncellendi.' in out.getvalue()
+        assert not [q for q in queries.captured_queries if 'COUNT(' in q['sql']]
+        assert Installment.objects.filter(plan=plan, status='overdue').count() == 2
+
+    def test_notifications_built_without_customer_lookups(
+        self, admin_user, customer_user, product, django_assert_num_queries
+    ):
+        other = User.objects.create_user(username='overdue2', password='Overdue123!', role='customer')
+        for customer in (customer_user, other):
+            Installment.objects.create(
+                plan=self._create_plan(customer, product, admin_user),
+                installment_number=1,
+                amount=Decimal('1000.00'),
+                due_date=date.today() - timedelta(days=4),
+                status='pending',
+            )
+        # kilit (SAVEPOINT + INSERT + RELEASE, DELETE) + SAVEPOINT/RELEASE
+        # + son bildirimler + tarama + UPDATE + INSERT
+        with django_assert_num_queries(10):
+            call_command('check_overdue_installments', stdout=StringIO())
+        assert set(
+            Notification.objects.values_list('user_id', 'related_product_id')
+        ) == {(customer_user.id, product.id), (other.id, product.id)}
+
+    def test_overlapping_run_is_skipped(self, admin_user, customer_user, product):
+        plan = self._create_plan(customer_user, product, admin_user)
+        inst = Installment.objects.create(
+            plan=plan,
+            installment_number=1,
+            amount=Decimal('1000.00'),
+            due_date=date.today() - timedelta(days=5),
+            status='pending',
+        )
+        with command_lock('check_overdue_installments'):
+            call_command('check_overdue_installments', stdout=StringIO())
+        inst.refresh_from_db()
+        assert inst.status == 'pending'
+        assert not Notification.objects.exists()
+
+    def test_failed_notification_write_rolls_back_status(self, admin_user, customer_user, product):
+        plan = self._create_plan(customer_user, product, admin_user)
+        inst = Installment.objects.create(
+            plan=plan,
+            installment_number=1,
+            amount=Decimal('1000.00'),
+            due_date=date.today() - timedelta(days=5),
+            status='pending',
+        )
+        with mock.patch.object(Notification.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            with pytest.raises(DatabaseError):
+                call_command('check_overdue_installments', stdout=StringIO())
+        inst.refresh_from_db()
+        assert inst.status == 'pending'
+
     def test_paid_installment_not_marked_overdue(self, admin_user, customer_user, product):
         plan = self._create_plan(customer_user, product, admin_user)
         inst = Installment.objects.create(
@@ -0,0 +1,37 @@
+"""
+Cron komutlari icin veritabani tabanli tekil calistirma kilidi testleri.
+"""
+
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from products.models import CommandLock
+from products.services.command_lock import command_lock
+
+
+class CommandLockTestCase(TestCase):
+
+    def test_second_holder_is_refused_until_release(self):
+        with command_lock('demo') as first:
+            with command_lock('demo') as second:
+                self.assertTrue(first)
+                self.assertFalse(second)
+            # Reddedilen calistirma kilidi birakmaz
+            self.assertTrue(CommandLock.objects.filter(name='demo').exists())
+
+        self.assertFalse(CommandLock.objects.filter(name='demo').exists())
+        with command_lock('demo') as again:
+            self.assertTrue(again)
+
+    def test_expired_lock_is_taken_over(self):
+        CommandLock.objects.create(
+            name='demo', token='stale', expires_at=timezone.now() - timedelta(minutes=1),
+        )
+
+        with command_lock('demo') as acquired:
+            self.assertTrue(acquired)
+            self.assertNotEqual(CommandLock.objects.get(name='demo').token, 'stale')
+
+        self.assertFalse(CommandLock.objects.exists())
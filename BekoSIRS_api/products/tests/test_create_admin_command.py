@@ -0,0 +1,37 @@
+"""
+create_admin komutunun olusturma ve sifre sifirlama testleri.
+"""
+
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+
+from products.conftest import BaseTestCase
+from products.models import CustomUser
+from products.signals import AUTH_USER_CACHE_KEY
+
+
+class CreateAdminCommandTestCase(BaseTestCase):
+
+    def test_existing_admin_password_is_reset(self):
+        call_command('create_admin', username=self.admin_user.username, password='YeniSifre123!', stdout=StringIO())
+
+        self.admin_user.refresh_from_db()
+        self.assertTrue(self.admin_user.check_password('YeniSifre123!'))
+
+    def test_reset_drops_cached_authenticated_user(self):
+        key = AUTH_USER_CACHE_KEY.format(self.admin_user.pk)
+        cache.set(key, self.admin_user)
+
+        call_command('create_admin', username=self.admin_user.username, password='YeniSifre123!', stdout=StringIO())
+
+        self.assertIsNone(cache.get(key))
+
+    def test_missing_admin_is_created(self):
+        call_command('create_admin', username='root-admin', password='Kok12345!', stdout=StringIO())
+
+        user = CustomUser.objects.get(username='root-admin')
+        self.assertTrue(user.check_password('Kok12345!'))
+        self.assertTrue(user.is_superuser)
+        self.assertEqual(user.role, 'admin')
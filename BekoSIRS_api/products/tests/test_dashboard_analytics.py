@@ -0,0 +1,245 @@
+"""
+Dashboard grafik (analytics/charts) ve ozet (dashboard/summary) uc noktalarinin testleri.
+"""
+
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from products.conftest import APITestCase
+from products.models import InstallmentPlan, ProductAssignment, Review
+from products.services.sales_aggregates import apply_sales_delta, month_bucket
+
+
+class DashboardChartsTestCase(APITestCase):
+    """ChartsView icerigi ve onbellek davranisi."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_charts_summarise_sales_and_services(self):
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_fridge, quantity=2)
+        self.create_service_request(status='pending')
+
+        response = self.client.get('/api/v1/analytics/charts/')
+
+        self.assertEqual(response.status_code, 200)
+        summary = response.data['summary']
+        self.assertEqual(summary['pending_service'], 1)
+        self.assertEqual(summary['total_customers'], 1)
+        self.assertEqual(response.data['top_products']['labels'], ['Buzdolabı Pro'])
+        self.assertEqual(response.data['top_products']['datasets'][0]['data'], [2])
+        self.assertEqual(response.data['revenue_by_category']['labels'], ['Beyaz Eşya'])
+        self.assertEqual(response.data['service_by_status']['datasets'][0]['data'], [1])
+
+    def test_top_n_charts_are_limited_in_sql(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get('/api/v1/analytics/charts/')
+
+        rollup_queries = [q['sql'] for q in queries if 'salesmonthlyaggregate' in q['sql'].lower()]
+        self.assertEqual(len(rollup_queries), 2)
+        self.assertTrue(all('LIMIT 5' in sql for sql in rollup_queries))
+
+    def test_today_cards_count_local_day_sales(self):
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_tv, quantity=2)
+        InstallmentPlan.objects.create(
+            customer=self.customer_user,
+            product=self.product_washer,
+            total_amount='1000.00',
+            installment_count=4,
+            start_date=timezone.localdate(),
+        )
+
+        summary = self.client.get('/api/v1/analytics/charts/').data['summary']
+
+        self.assertEqual(summary['today_sales'], 2)
+        self.assertAlmostEqual(summary['today_revenue'], 2 * 24999.00 + 1000.0, places=2)
+
+    def test_customer_segments_split_by_order_count(self):
+        for _ in range(6):
+            ProductAssignment.objects.create(customer=self.customer_user, product=self.product_tv)
+        ProductAssignment.objects.create(customer=self.seller_user, product=self.product_tv)
+
+        response = self.client.get('/api/v1/analytics/charts/')
+
+        loyal, potential, _new, inactive = response.data['customer_segments']['datasets'][0]['data']
+        self.assertEqual((loyal, potential, inactive), (1, 1, 0))
+
+    def test_charts_are_cached_until_a_sale_is_recorded(self):
+        first = self.client.get('/api/v1/analytics/charts/')
+        self.assertEqual(first.data['top_products']['labels'], ['Satış Yok'])
+
+        with self.assertNumQueries(0):
+            self.client.get('/api/v1/analytics/charts/')
+
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_fridge)
+        refreshed = self.client.get('/api/v1/analytics/charts/')
+
+        self.assertEqual(refreshed.data['top_products']['labels'], ['Buzdolabı Pro'])
+
+    def test_refresh_command_warms_the_cache(self):
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_fridge)
+
+        with tempfile.TemporaryDirectory() as cache_dir, override_settings(CACHES={
+            'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': cache_dir},
+        }):
+            call_command('refresh_dashboard_cache', stdout=StringIO())
+
+            with self.assertNumQueries(0):
+                response = self.client.get('/api/v1/analytics/charts/')
+        self.assertEqual(response.data['top_products']['labels'], ['Buzdolabı Pro'])
+
+    def test_refresh_command_refuses_process_local_cache(self):
+        with self.assertRaises(CommandError):
+            call_command('refresh_dashboard_cache', stdout=StringIO())
+
+
+class DashboardSummaryTestCase(APITestCase):
+    """DashboardSummaryView icerigi ve onbellek davranisi."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_summary_counts(self):
+        self.create_service_request(status='pending')
+        Review.objects.create(customer=self.customer_user, product=self.product_fridge, rating=4, is_approved=True)
+        self.authenticate_admin()
+
+        response = self.client.get('/api/v1/dashboard/summary/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['products'], {'total': 3, 'low_stock': 2, 'out_of_stock': 1})
+        self.assertEqual(response.data['orders']['total'], 1)
+        self.assertEqual(response.data['service_requests']['pending'], 1)
+        self.assertEqual(response.data['reviews']['average_rating'], 4.0)
+
+    def test_summary_is_invalidated_by_review_write(self):
+        self.authenticate_admin()
+        self.assertEqual(self.client.get('/api/v1/dashboard/summary/').data['reviews']['pending_approval'], 0)
+
+        Review.objects.create(customer=self.customer_user, product=self.product_tv, rating=3)
+
+        self.assertEqual(self.client.get('/api/v1/dashboard/summary/').data['reviews']['pending_approval'], 1)
+
+    def test_customer_is_forbidden(self):
+        self.authenticate_customer()
+
+        response = self.client.get('/api/v1/dashboard/summary/')
+
+        self.assertEqual(response.status_code, 403)
+
+
+class MarketingSalesChartTestCase(APITestCase):
+    """MarketingAutomationView satis grafikleri."""
+
+    def test_weekly_chart_is_the_tail_of_the_monthly_chart(self):
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_tv, quantity=2)
+
+        charts = self.client.get('/api/v1/analytics/marketing/').data['sales_chart']
+
+        self.assertEqual(len(charts['monthly']), 30)
+        self.assertEqual(charts['weekly'], charts['monthly'][-7:])
+        self.assertEqual(charts['weekly'][-1]['sales'], 2)
+        self.assertEqual(charts['weekly'][-1]['revenue'], 49998.0)
+        self.assertEqual(charts['yearly'][-1]['sales'], 2)
+
+    def test_customer_campaign_counts(self):
+        self.customer_user.last_login = timezone.now() - timedelta(days=100)
+        self.customer_user.save(update_fields=['last_login'])
+
+        data = self.client.get('/api/v1/analytics/marketing/').data
+
+        self.assertEqual(data['campaigns']['churn_prevention']['eligible'], 1)
+        self.assertEqual(data['campaigns']['welcome']['eligible'], 1)
+        self.assertEqual(data['campaigns']['anniversary']['eligible'], 1)
+        self.assertEqual(data['summary']['total_customers'], 1)
+        self.assertEqual(data['summary']['active_last_30_days'], 0)
+
+
+class SeasonalAnalysisTestCase(APITestCase):
+    """SeasonalAnalysisView mevsimsellik skorlari ve onbellek davranisi."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_peak_product_scores_above_flat_product(self):
+        this_month = month_bucket(timezone.now())
+        apply_sales_delta(self.product_tv.id, this_month, 10, 1)
+        month = this_month
+        for _ in range(12):
+            apply_sales_delta(self.product_fridge.id, month, 1, 1)
+            month = (month - timedelta(days=1)).replace(day=1)
+
+        products = {
+            row['product_id']: row
+            for row in self.client.get('/api/v1/analytics/seasonal/').data['seasonal_products']
+        }
+
+        tv = products[self.product_tv.id]
+        self.assertEqual(tv['seasonality_score'], 2.0)
+        self.assertEqual(tv['peak_sales'], 10)
+        self.assertEqual(tv['monthly_sales'][tv['peak_month']], 10)
+        fridge = products[self.product_fridge.id]
+        self.assertEqual(fridge['seasonality_score'], 0.0)
+        self.assertEqual(fridge['total_year_sales'], 12)
+        self.assertEqual(fridge['recommendation'], 'Yıl boyunca dengeli satış')
+
+    def test_products_ranked_by_total_sales(self):
+        this_month = month_bucket(timezone.now())
+        apply_sales_delta(self.product_tv.id, this_month, 3, 1)
+        apply_sales_delta(self.product_fridge.id, this_month, 7, 1)
+
+        products = self.client.get('/api/v1/analytics/seasonal/').data['seasonal_products']
+
+        self.assertEqual([p['product_id'] for p in products], [self.product_fridge.id, self.product_tv.id])
+
+    def test_window_covers_twelve_months(self):
+        this_month = month_bucket(timezone.now())
+        year_ago_month = month_bucket(timezone.now() - timedelta(days=365))
+        apply_sales_delta(self.product_tv.id, this_month, 2, 1)
+        # 365 gun onceki ay pencere disinda; ayni takvim ayina eklenmemeli
+        apply_sales_delta(self.product_tv.id, year_ago_month, 5, 1)
+
+        products = self.client.get('/api/v1/analytics/seasonal/').data['seasonal_products']
+
+        self.assertEqual([(p['product_id'], p['total_year_sales']) for p in products], [(self.product_tv.id, 2)])
+
+    def test_analysis_is_cached_until_a_sale_is_recorded(self):
+        self.assertEqual(self.client.get('/api/v1/analytics/seasonal/').data['seasonal_products'], [])
+
+        with self.assertNumQueries(0):
+            self.client.get('/api/v1/analytics/seasonal/')
+
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_tv, quantity=4)
+        products = self.client.get('/api/v1/analytics/seasonal/').data['seasonal_products']
+
+        self.assertEqual([(p['product_id'], p['total_year_sales']) for p in products], [(self.product_tv.id, 4)])
+
+
+class SalesForecastWindowTestCase(APITestCase):
+    """SalesForecastView en cok satanlari son 12 aydan secer."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_partial_month_a_year_ago_is_excluded(self):
+        apply_sales_delta(self.product_tv.id, month_bucket(timezone.now()), 2, 1)
+        # 365 gun onceki ay pencere disinda; daha cok satsa da listeye girmemeli
+        apply_sales_delta(
+            self.product_fridge.id, month_bucket(timezone.now() - timedelta(days=365)), 5, 1
+        )
+
+        forecasts = self.client.get('/api/v1/analytics/forecast/').data['top_forecasts']
+
+        self.assertEqual([f['product_name'] for f in forecasts], [self.product_tv.name])
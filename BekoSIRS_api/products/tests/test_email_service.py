@@ -0,0 +1,104 @@
+"""
+EmailService sablon tabanli e-posta testleri.
+"""
+
+import smtplib
+from unittest import mock
+
+from django.conf import settings
+from django.core import mail
+from django.test import override_settings
+
+from products.conftest import APITestCase
+from products import email_service
+from products.email_service import EmailService
+from products.models import PasswordResetToken
+
+
+class EmailServiceTestCase(APITestCase):
+
+    def test_password_reset_request_sends_reset_link(self):
+        response = self.client.post('/api/v1/password-reset/', {'email': self.customer_user.email}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 1)
+        token = PasswordResetToken.objects.get(user=self.customer_user, is_used=False)
+        message = mail.outbox[0]
+        reset_url = f"{settings.FRONTEND_URL}/reset-password?token={token.token}"
+        self.assertIn(reset_url, message.body)
+        self.assertIn(f'href="{reset_url}"', message.alternatives[0][0])
+
+    def test_welcome_email_escapes_name_only_in_html(self):
+        self.customer_user.first_name = "Ali <Can>"
+
+        self.assertTrue(EmailService.send_welcome_email(self.customer_user))
+
+        message = mail.outbox[0]
+        self.assertTrue(message.body.startswith('Merhaba Ali <Can>,'))
+        html = message.alternatives[0][0]
+        self.assertIn('Ali &lt;Can&gt;', html)
+        self.assertIn('.features li', html)
+
+    @override_settings(EMAIL_SEND_ASYNC=True)
+    def test_async_mode_queues_delivery_off_the_request(self):
+        with mock.patch.object(email_service._send_pool, 'submit') as submit:
+            self.assertTrue(EmailService.send_welcome_email(self.customer_user))
+
+        self.assertEqual(mail.outbox, [])
+        deliver, message, label, retries = submit.call_args.args
+        self.assertIs(deliver, email_service._deliver)
+        self.assertEqual(message.to, [self.customer_user.email])
+        self.assertEqual(label, 'welcome')
+        self.assertEqual(retries, settings.EMAIL_SEND_RETRIES)
+
+    def test_send_bulk_uses_one_connection(self):
+        messages = [EmailService.build_welcome_email(user) for user in (self.customer_user, self.seller_user)]
+
+        with mock.patch('products.email_service.get_connection', wraps=email_service.get_connection) as get_connection:
+            sent = EmailService.send_bulk(messages, 'welcome')
+
+        self.assertEqual(sent, 2)
+        get_connection.assert_called_once_with()
+        self.assertEqual([m.to for m in mail.outbox], [[self.customer_user.email], [self.seller_user.email]])
+
+    def test_send_bulk_rotates_connection(self):
+        messages = [EmailService.build_welcome_email(self.customer_user) for _ in range(5)]
+
+        with mock.patch.object(email_service, '_MESSAGES_PER_CONNECTION', 2), \
+                mock.patch('products.email_service.get_connection', wraps=email_service.get_connection) as get_connection:
+            sent = EmailService.send_bulk(messages, 'welcome')
+
+        self.assertEqual(sent, 5)
+        self.assertEqual(get_connection.call_count, 3)
+        self.assertEqual(len(mail.outbox), 5)
+
+    def test_send_failure_is_logged_not_raised(self):
+        message = EmailService.build_welcome_email(self.customer_user)
+
+        with mock.patch.object(message, 'send', side_effect=OSError('smtp down')), \
+                self.assertLogs('products.email_service', level='ERROR') as logs:
+            self.assertFalse(EmailService._send(message, 'welcome'))
+
+        self.assertIn(f'Error sending welcome email to {self.customer_user.email}', logs.output[0])
+
+    def test_transient_failure_is_retried_with_backoff(self):
+        message = EmailService.build_welcome_email(self.customer_user)
+        send = mock.Mock(side_effect=[smtplib.SMTPServerDisconnected('bye'), 1])
+
+        with mock.patch.object(message, 'send', send), mock.patch('products.email_service.time.sleep') as sleep:
+            self.assertTrue(email_service._deliver(message, 'welcome', retries=3))
+
+        self.assertEqual(send.call_count, 2)
+        sleep.assert_called_once_with(1)
+
+    def test_permanent_failure_is_not_retried(self):
+        message = EmailService.build_welcome_email(self.customer_user)
+        refused = smtplib.SMTPRecipientsRefused({self.customer_user.email: (550, b'no such user')})
+
+        with mock.patch.object(message, 'send', side_effect=refused) as send, \
+                mock.patch('products.email_service.time.sleep') as sleep, \
+                self.assertLogs('products.email_service', level='ERROR'):
+            self.assertFalse(email_service._deliver(message, 'welcome', retries=3))
+
+        send.assert_called_once_with()
+        sleep.assert_not_called()
@@ -0,0 +1,147 @@
+"""
+import_products komutunun Excel fiyat listesi ayristirma testleri.
+"""
+
+import os
+import tempfile
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from products.models import AuditLog, Category, Product
+
+
+def _price_list_frame():
+    nan = np.nan
+    return pd.DataFrame([
+        ['EK GARANTİ KODU', 'Buzdolapları (Ölçüler cm)', nan, nan, nan, nan, nan, nan],
+        ['EK GARANTİ KODU', 'Model', 'Açıklama', nan, nan, 'Liste Fiyat', 'Peşin Fiyat', 'Kampanya'],
+        ['G123', 'RFN 1234', 'No-Frost', nan, nan, 32000.0, 29999.5, 'Yaz'],
+        ['-', 'RFN 5678', nan, nan, nan, nan, 25000.0, nan],
+        ['', 'RFN 9999', 'Fiyatsiz', nan, nan, nan, nan, nan],
+        ['EK GARANTİ KODU', 'Çamaşır Makineleri', nan, nan, nan, nan, nan, nan],
+        [nan, 'CM 9000', nan, nan, nan, 'yok', 18000.0, nan],
+        [nan, 'CM 8000', nan, nan, nan, nan, 17000.0, nan],
+    ])
+
+
+class ImportProductsCommandTestCase(TestCase):
+
+    def _run(self, frame):
+        out = StringIO()
+        with mock.patch('os.path.exists', return_value=True), \
+                mock.patch('pandas.read_excel', return_value=frame):
+            call_command('import_products', stdout=out)
+        return out.getvalue()
+
+    def test_rows_are_parsed_into_categories_and_products(self):
+        output = self._run(_price_list_frame())
+
+        self.assertIn('Successfully imported 3 products', output)
+        self.assertEqual(
+            set(Category.objects.values_list('name', flat=True)),
+            {'Buzdolapları', 'Çamaşır Makineleri'},
+        )
+        fridge = Product.objects.get(model_code='RFN 1234')
+        self.assertEqual(fridge.name, 'RFN 1234 - Buzdolapları')
+        self.assertEqual(fridge.price_cash, Decimal('29999.5'))
+        self.assertEqual(fridge.price_list, Decimal('32000'))
+        self.assertEqual(fridge.warranty_code, 'G123')
+        self.assertEqual(fridge.campaign_tag, 'Yaz')
+
+        plain = Product.objects.get(model_code='RFN 5678')
+        self.assertIsNone(plain.warranty_code)
+        self.assertIsNone(plain.price_list)
+        self.assertEqual(plain.description, '')
+
+        self.assertEqual(Product.objects.get(model_code='CM 8000').category.name, 'Çamaşır Makineleri')
+        # Fiyatsiz satir ve gecersiz liste fiyatli satir atlanir
+        self.assertFalse(Product.objects.filter(model_code__in=['RFN 9999', 'CM 9000']).exists())
+
+    def test_reimport_updates_existing_products(self):
+        self._run(_price_list_frame())
+        frame = _price_list_frame()
+        frame.loc[2, 6] = 27999.0
+
+        self._run(frame)
+
+        self.assertEqual(Product.objects.count(), 3)
+        self.assertEqual(Product.objects.get(model_code='RFN 1234').price, Decimal('27999'))
+
+    def test_products_without_category_go_to_general(self):
+        frame = pd.DataFrame([[np.nan, 'XYZ 1', np.nan, np.nan, np.nan, np.nan, 100.0, np.nan]])
+
+        self._run(frame)
+
+        self.assertEqual(Product.objects.get(model_code='XYZ 1').category.name, 'Genel')
+
+    def test_products_are_written_in_bulk_statements(self):
+        Category.objects.create(name='Buzdolapları')
+        self._run(_price_list_frame())
+        frame = _price_list_frame()
+        frame.loc[7, 1] = 'CM 7000'
+        with CaptureQueriesContext(connection) as queries:
+            self._run(frame)
+
+        product_writes = [
+            q for q in queries.captured_queries
+            if q['sql'].startswith(('INSERT', 'UPDATE')) and '"products_product"' in q['sql']
+        ]
+        # yeni urun icin bir INSERT, mevcut iki urun icin bir toplu UPDATE
+        self.assertEqual(len(product_writes), 2)
+        self.assertEqual(Category.objects.count(), 2)
+        self.assertEqual(Product.objects.count(), 4)
+
+    def test_import_writes_audit_log_per_product(self):
+        self._run(_price_list_frame())
+        frame = _price_list_frame()
+        frame.loc[2, 6] = 27999.0
+        self._run(frame)
+
+        fridge = Product.objects.get(model_code='RFN 1234')
+        logs = AuditLog.objects.filter(model_name='Product', object_id=fridge.pk)
+        self.assertEqual(sorted(logs.values_list('action', flat=True)), ['create', 'update'])
+        self.assertEqual(Decimal(logs.get(action='update').changes['price']), Decimal('27999'))
+        self.assertEqual(AuditLog.objects.filter(model_name='Product', action='create').count(), 3)
+
+    def test_duplicate_model_code_keeps_last_row(self):
+        frame = pd.DataFrame([
+            [np.nan, 'DUP 1', np.nan, np.nan, np.nan, np.nan, 100.0, np.nan],
+            [np.nan, 'DUP 1', np.nan, np.nan, np.nan, np.nan, 200.0, np.nan],
+        ])
+
+        self._run(frame)
+
+        self.assertEqual(Product.objects.get(model_code='DUP 1').price, Decimal('200'))
+
+    def test_failed_product_write_rolls_back_new_categories(self):
+        with mock.patch.object(Product.objects, 'bulk_create', side_effect=DatabaseError('boom')):
+            with self.assertRaises(DatabaseError):
+                self._run(_price_list_frame())
+
+        self.assertFalse(Category.objects.exists())
+
+    def test_xlsx_is_streamed_with_openpyxl(self):
+        from openpyxl import Workbook
+
+        frame = _price_list_frame().astype(object)
+        workbook = Workbook()
+        for row in frame.where(frame.notna(), None).values.tolist():
+            workbook.active.append(row)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'fiyat.xlsx')
+            workbook.save(path)
+            with mock.patch('pandas.read_excel') as read_excel:
+                out = StringIO()
+                call_command('import_products', file=path, stdout=out)
+
+        read_excel.assert_not_called()
+        self.assertIn('Successfully imported 3 products', out.getvalue())
+        self.assertEqual(Product.objects.get(model_code='RFN 1234').price_cash, Decimal('29999.5'))
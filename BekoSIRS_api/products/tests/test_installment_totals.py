@@ -0,0 +1,115 @@
+"""
+Taksit plani odenen/kalan tutar ve tamamlanma testleri.
+"""
+
+from decimal import Decimal
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from products.models import AuditLog, CustomUser, Product, Category, InstallmentPlan, Installment
+
+
+class InstallmentPlanTotalsTest(TestCase):
+    """paid_amount ve remaining_amount odenmis taksitlerden SQL ile hesaplanir."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer = CustomUser.objects.create_user(
+            username='customer_totals', password='Customer123!', role='customer'
+        )
+        category = Category.objects.create(name='Toplam Kategori')
+        product = Product.objects.create(
+            name='Toplam Urun', brand='Test', category=category,
+            price=Decimal('4000.00'), stock=5, warranty_duration_months=12
+        )
+        cls.plan = InstallmentPlan.objects.create(
+            customer=cls.customer,
+            product=product,
+            total_amount=Decimal('4000.00'),
+            down_payment=Decimal('1000.00'),
+            installment_count=3,
+            start_date=date.today(),
+            status='active',
+        )
+        for number, inst_status in enumerate(['paid', 'paid', 'pending'], start=1):
+            Installment.objects.create(
+                plan=cls.plan,
+                installment_number=number,
+                amount=Decimal('1000.00'),
+                due_date=date.today(),
+                status=inst_status,
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.customer)
+
+    def test_my_plans_amounts(self):
+        response = self.client.get('/api/v1/installment-plans/my-plans/')
+
+        self.assertEqual(response.status_code, 200)
+        plan = response.data[0]
+        self.assertEqual(Decimal(str(plan['paid_amount'])), Decimal('3000.00'))
+        self.assertEqual(Decimal(str(plan['remaining_amount'])), Decimal('1000.00'))
+
+    def test_plan_without_paid_installments(self):
+        Installment.objects.filter(plan=self.plan).update(status='pending')
+
+        response = self.client.get('/api/v1/installment-plans/my-plans/')
+
+        self.assertEqual(Decimal(str(response.data[0]['paid_amount'])), Decimal('1000.00'))
+
+
+class InstallmentApproveCompletesPlanTest(TestCase):
+    """Son taksit onaylaninca plan tamamlanir, oncesinde aktif kalir."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = CustomUser.objects.create_user(
+            username='admin_complete', password='Admin123!', role='admin'
+        )
+        customer = CustomUser.objects.create_user(
+            username='customer_complete', password='Customer123!', role='customer'
+        )
+        category = Category.objects.create(name='Tamamlama Kategori')
+        product = Product.objects.create(
+            name='Tamamlama Urun', brand='Test', category=category,
+            price=Decimal('2000.00'), stock=5, warranty_duration_months=12
+        )
+        cls.plan = InstallmentPlan.objects.create(
+            customer=customer, product=product, total_amount=Decimal('2000.00'),
+            down_payment=Decimal('0.00'), installment_count=2,
+            start_date=date.today(), status='active',
+        )
+        cls.first, cls.second = (
+            Installment.objects.create(
+                plan=cls.plan, installment_number=number, amount=Decimal('1000.00'),
+                due_date=date.today(), status='pending',
+            )
+            for number in (1, 2)
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_plan_completes_only_after_last_payment(self):
+        self.client.post(f'/api/v1/installments/{self.first.id}/approve/', {}, format='json')
+        self.plan.refresh_from_db()
+        self.assertEqual(self.plan.status, 'active')
+
+        response = self.client.post(f'/api/v1/installments/{self.second.id}/approve/', {}, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        self.plan.refresh_from_db()
+        self.assertEqual(self.plan.status, 'completed')
+
+    def test_completion_fires_plan_signals(self):
+        for installment in (self.first, self.second):
+            self.client.post(f'/api/v1/installments/{installment.id}/approve/', {}, format='json')
+
+        log = AuditLog.objects.filter(model_name='InstallmentPlan', object_id=self.plan.id, action='update')
+        self.assertEqual(log.count(), 1)
+        self.assertEqual(log.get().changes['status'], 'completed')
@@ -0,0 +1,51 @@
+"""
+JWT rol claim'i ve CachedJWTAuthentication kullanici onbellegi testleri.
+"""
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import AccessToken
+
+from products.conftest import APITestCase
+
+
+class TokenRoleClaimTestCase(APITestCase):
+    """Token endpoint'i rolu access token icine yazar."""
+
+    def test_access_token_carries_role(self):
+        response = self.client.post(
+            '/api/v1/token/',
+            {'username': 'test_seller', 'password': 'SellerPass123!', 'platform': 'web'},
+            format='json',
+        )
+
+        self.assertEqual(response.status_code, 200, response.data)
+        self.assertEqual(AccessToken(response.data['access'])['role'], 'seller')
+
+
+@override_settings(AUTH_USER_CACHE_TTL=60)
+class CachedJWTAuthenticationTestCase(APITestCase):
+    """Bearer istekleri kullaniciyi onbellekten cozer."""
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.authenticate_with_token(self.customer_user)
+
+    def test_repeat_requests_skip_user_lookup(self):
+        with CaptureQueriesContext(connection) as first:
+            self.assertEqual(self.client.get('/api/v1/profile/').status_code, 200)
+        with CaptureQueriesContext(connection) as second:
+            self.assertEqual(self.client.get('/api/v1/profile/').status_code, 200)
+
+        self.assertEqual(len(second), len(first) - 1)
+
+    def test_user_save_invalidates_cached_user(self):
+        self.assertEqual(self.client.get('/api/v1/profile/').status_code, 200)
+
+        self.customer_user.is_active = False
+        self.customer_user.save(update_fields=['is_active'])
+
+        self.assertEqual(self.client.get('/api/v1/profile/').status_code, 401)
@@ -0,0 +1,38 @@
+"""
+settings.LOGGING yapilandirmasinin dictConfig ile kurulabildigini dogrulayan testler.
+"""
+
+import copy
+import logging
+import logging.config
+import tempfile
+from pathlib import Path
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from bekosirs_backend.logging_handlers import QueuedRotatingFileHandler
+
+
+class LoggingConfigTestCase(SimpleTestCase):
+
+    def tearDown(self):
+        # Test disindaki loglama Django'nun kurdugu yapilandirmaya geri doner
+        logging.config.dictConfig(settings.LOGGING)
+
+    def test_settings_logging_configures_and_writes_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            config = copy.deepcopy(settings.LOGGING)
+            for name in ('file', 'error_file'):
+                config['handlers'][name]['filename'] = Path(tmp) / f'{name}.log'
+
+            logging.config.dictConfig(config)
+
+            handlers = {h.name: h for h in logging.getLogger('products').handlers}
+            self.assertIsInstance(handlers['file'], QueuedRotatingFileHandler)
+            logging.getLogger('products.test').error('disk %s', 'hatasi')
+            for handler in handlers.values():
+                handler.close()
+
+            self.assertIn('ERROR', (Path(tmp) / 'error_file.log').read_text())
+            self.assertIn('disk hatasi', (Path(tmp) / 'file.log').read_text())
@@ -59,3 +59,29 @@ def test_old_product_no_boost():
     boosts = recommender._get_new_product_boost()
 
     assert old_product.id not in boosts
+
+
+@pytest.mark.django_db
+def test_boost_tier_boundaries_are_inclusive():
+    """Kova sinirlari dahildir: 7. gun 0.4, 8-14. gun 0.25, 15. gunden sonra 0.1 almali."""
+    category = Category.objects.create(name='Sinir Kategorisi')
+    expected = {7: 0.4, 8: 0.25, 14: 0.25, 15: 0.1, 29: 0.1}
+    products = {}
+    for days in expected:
+        product = Product.objects.create(
+            name=f'Sinir Urun {days}',
+            brand='Beko',
+            category=category,
+            price=Decimal('5000.00'),
+            stock=2,
+        )
+        Product.objects.filter(pk=product.pk).update(
+            created_at=timezone.now() - timedelta(days=days, hours=1)
+        )
+        products[days] = product.id
+
+    recommender = _build_recommender_for_unit_test()
+    boosts = recommender._get_new_product_boost()
+
+    for days, value in expected.items():
+        assert boosts[products[days]] == pytest.approx(value)
@@ -0,0 +1,90 @@
+"""
+Arka plan oneri on-uretiminin toplu yazimini dogrulayan testler.
+"""
+
+import threading
+from decimal import Decimal
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from products.ml_recommender import HybridRecommender
+from products.models import Category, Product, Recommendation
+
+User = get_user_model()
+
+
+_RealThread = threading.Thread
+
+
+class _InlineThread(_RealThread):
+    """On-uretim hedefini ayni thread'de calistirir; diger thread'ler (log vb.) etkilenmez."""
+
+    def start(self):
+        if getattr(self._target, '__name__', '') == '_bg_pregen':
+            self.run()
+        else:
+            super().start()
+
+
+@pytest.mark.django_db
+def test_pregeneration_inserts_all_users_in_one_batch():
+    """Birden fazla kullanicinin onerileri tek INSERT ile yazilmali."""
+    category = Category.objects.create(name='On Uretim Kategorisi')
+    products = [
+        Product.objects.create(
+            name=f'On Uretim Urun {i}', brand='Beko', category=category, price=Decimal('1000.00'), stock=3,
+        )
+        for i in range(3)
+    ]
+    customers = [
+        User.objects.create_user(username=f'pregen-{i}', password='Pregen123!', role='customer')
+        for i in range(3)
+    ]
+    recommender = object.__new__(HybridRecommender)
+    recs = [{'product_id': p.id, 'score': 0.5, 'reason': 'Test'} for p in products]
+
+    with mock.patch.object(HybridRecommender, 'recommend', return_value=recs), \
+            mock.patch('threading.Thread', _InlineThread), \
+            CaptureQueriesContext(connection) as queries:
+        recommender._pregenerate_in_background()
+
+    inserts = [q for q in queries.captured_queries if q['sql'].startswith('INSERT')]
+    assert len(inserts) == 1
+    for customer in customers:
+        assert Recommendation.objects.filter(customer=customer).count() == 3
+
+
+@pytest.mark.django_db(transaction=True)
+def test_conflicting_user_does_not_drop_other_users_rows():
+    """Eszamanli uretimle cakisan kullanici, toplu yazimdaki diger kullanicilari dusurmemeli."""
+    category = Category.objects.create(name='Cakisma Kategorisi')
+    products = [
+        Product.objects.create(
+            name=f'Cakisma Urun {i}', brand='Beko', category=category, price=Decimal('1000.00'), stock=3,
+        )
+        for i in range(2)
+    ]
+    customers = [
+        User.objects.create_user(username=f'conflict-{i}', password='Conflict123!', role='customer')
+        for i in range(3)
+    ]
+    recommender = object.__new__(HybridRecommender)
+    recs = [{'product_id': p.id, 'score': 0.5, 'reason': 'Test'} for p in products]
+
+    def recommend(user, **kwargs):
+        if user == customers[0]:
+            # Ayni anda calisan istek uzerinden eklenmis oneri
+            Recommendation.objects.create(customer=user, product=products[0], score=0.9)
+        return recs
+
+    with mock.patch.object(HybridRecommender, 'recommend', side_effect=recommend), \
+            mock.patch('threading.Thread', _InlineThread):
+        recommender._pregenerate_in_background()
+
+    assert Recommendation.objects.filter(customer=customers[0]).count() == 1
+    for customer in customers[1:]:
+        assert Recommendation.objects.filter(customer=customer).count() == 2
@@ -78,6 +78,14 @@ def test_temporal_weight_half_life():
     assert abs(weight - 0.5) < 0.05
 
 
+def test_temporal_weight_date_counts_whole_days():
+    """Yalnizca gun tutan tarihler referans gunune gore tam gun farkiyla curumeli."""
+    now = datetime(2024, 3, 31, 23, 59, tzinfo=timezone.utc)
+
+    assert temporal_weight(date(2024, 3, 1), half_life_days=30, now=now) == pytest.approx(0.5)
+    assert temporal_weight(date(2024, 4, 5), now=now) == 1.0
+
+
 @pytest.mark.django_db
 def test_interactions_include_decay(customer, products):
     """View kayitlari yaslandikca daha dusuk agirlikla toplanmali."""
@@ -0,0 +1,48 @@
+"""
+Toplu bildirim (send-bulk) ve fiyat dususu bildirimlerinin hedef kitle testleri.
+"""
+
+from decimal import Decimal
+
+from products.conftest import APITestCase
+from products.models import (
+    CustomUser, Notification, UserNotificationPreference, WishlistItem
+)
+
+
+class NotificationFanoutTestCase(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.opted_out = CustomUser.objects.create_user(
+            username='opted_out', email='opted_out@test.com', password='Pass123!', role='customer'
+        )
+        UserNotificationPreference.objects.create(
+            user=self.opted_out, notify_general=False, notify_price_drops=False
+        )
+
+    def test_send_bulk_respects_general_preference(self):
+        self.authenticate_admin()
+
+        response = self.client.post('/api/v1/notifications/send-bulk/', {
+            'title': 'Kampanya', 'message': 'Yeni ürünler', 'target': 'customers',
+        }, format='json')
+
+        self.assertEqual(response.status_code, 200)
+        recipients = set(Notification.objects.filter(title='Kampanya').values_list('user__username', flat=True))
+        self.assertEqual(recipients, {'test_customer'})
+
+    def test_price_drop_notifies_opted_in_wishlist_owners(self):
+        for customer in (self.customer_user, self.opted_out):
+            wishlist = self.create_wishlist_for_customer(customer)
+            WishlistItem.objects.create(wishlist=wishlist, product=self.product_fridge, notify_on_price_drop=True)
+        self.authenticate_admin()
+
+        response = self.client.patch(
+            f'/api/v1/products/{self.product_fridge.id}/', {'price': '9999.99'}, format='json'
+        )
+
+        self.assertEqual(response.status_code, 200)
+        drops = Notification.objects.filter(notification_type='price_drop')
+        self.assertEqual(list(drops.values_list('user', flat=True)), [self.customer_user.id])
+        self.assertIn(str(Decimal('9999.99')), drops.get().message)
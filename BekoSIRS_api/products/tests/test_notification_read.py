@@ -0,0 +1,62 @@
+"""
+Bildirim okundu isaretleme (tekil ve toplu) uc noktalarinin testleri.
+"""
+
+from products.conftest import APITestCase
+from products.models import Notification
+
+
+class NotificationReadTestCase(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate_customer()
+        self.first, self.second, self.third = (
+            Notification.objects.create(user=self.customer_user, title=f'Bildirim {i}', message='Mesaj')
+            for i in range(3)
+        )
+        self.foreign = Notification.objects.create(user=self.seller_user, title='Baskasi', message='Mesaj')
+
+    def test_mark_as_read_is_a_single_update(self):
+        with self.assertNumQueries(1):
+            response = self.client.post(f'/api/v1/notifications/{self.first.id}/read/')
+
+        self.assertEqual(response.status_code, 200)
+        self.first.refresh_from_db()
+        self.assertTrue(self.first.is_read)
+
+    def test_mark_as_read_of_foreign_notification_is_not_found(self):
+        response = self.client.post(f'/api/v1/notifications/{self.foreign.id}/read/')
+
+        self.assertEqual(response.status_code, 404)
+        self.foreign.refresh_from_db()
+        self.assertFalse(self.foreign.is_read)
+
+    def test_read_all_with_ids_marks_only_that_batch(self):
+        response = self.client.post('/api/v1/notifications/read-all/', {
+            'ids': [self.first.id, self.second.id, self.foreign.id],
+        }, format='json')
+
+        self.assertEqual(response.data['updated'], 2)
+        unread = set(Notification.objects.filter(is_read=False).values_list('id', flat=True))
+        self.assertEqual(unread, {self.third.id, self.foreign.id})
+
+    def test_read_all_rejects_non_integer_ids(self):
+        response = self.client.post('/api/v1/notifications/read-all/', {'ids': ['x']}, format='json')
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_stats_counts_in_one_query(self):
+        self.first.is_read = True
+        self.first.notification_type = 'price_drop'
+        self.first.save(update_fields=['is_read', 'notification_type'])
+        self.authenticate_admin()
+
+        with self.assertNumQueries(1):
+            response = self.client.get('/api/v1/notifications/stats/')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data['total'], response.data['read'], response.data['unread']), (4, 1, 3))
+        self.assertEqual(response.data['by_type']['general'], 3)
+        self.assertEqual(response.data['by_type']['price_drop'], 1)
+        self.assertEqual(response.data['by_type']['restock'], 0)
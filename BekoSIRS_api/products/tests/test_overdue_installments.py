@@ -10,7 +10,7 @@ from datetime import date, timedelta
 from django.test import TestCase
 from rest_framework.test import APIClient
 
-from products.models import CustomUser, Product, Category, InstallmentPlan, Installment
+from products.models import CustomUser, Product, Category, InstallmentPlan, Installment, Notification
 from products.views.installment_views import _mark_overdue_installments
 
 
@@ -163,3 +163,21 @@ class OverdueAPITriggerTest(TestCase):
 
         self.overdue_inst.refresh_from_db()
         self.assertEqual(self.overdue_inst.status, 'overdue')
+
+    def test_one_notification_per_product_and_week(self):
+        """Aynı ürünün birden fazla gecikmiş taksidi tek bildirim üretmeli."""
+        Installment.objects.create(
+            plan=self.plan,
+            installment_number=2,
+            amount=Decimal('1000.00'),
+            due_date=date.today() - timedelta(days=3),
+            status='pending'
+        )
+
+        with self.assertNumQueries(4):
+            _mark_overdue_installments()
+
+        self.assertEqual(Installment.objects.filter(plan=self.plan, status='overdue').count(), 2)
+        self.assertEqual(
+            Notification.objects.filter(user=self.customer, title__startswith='Gecikmiş Taksit').count(), 1
+        )
@@ -66,3 +66,28 @@ def test_post_dismiss_remains_backward_compatible(recommendation_action_setup):
     assert response.status_code == 200
     assert response.data['success'] is True
     assert recommendation.dismissed is True
+
+
+@pytest.mark.django_db
+def test_list_loads_product_categories_with_the_recommendations(recommendation_action_setup):
+    """Listing should join product categories instead of fetching one per recommendation."""
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    user, recommendation = recommendation_action_setup
+    for i in range(4):
+        category = Category.objects.create(name=f'Liste Kategori {i}')
+        product = Product.objects.create(
+            name=f'Liste Ürünü {i}', brand='Beko', category=category, price=Decimal('100.00'), stock=1,
+        )
+        Recommendation.objects.create(customer=user, product=product, score=0.5 - i * 0.01, reason='Liste')
+    client = APIClient()
+    client.force_authenticate(user=user)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get('/api/v1/recommendations/')
+
+    assert response.status_code == 200
+    assert len(response.data['recommendations']) == 5
+    category_lookups = [q for q in queries.captured_queries if 'FROM "products_category"' in q['sql']]
+    assert category_lookups == []
@@ -0,0 +1,42 @@
+"""
+ORJSONRenderer cikti bicimi DRF JSONRenderer ile ayni olmali.
+"""
+
+import datetime
+import uuid
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from bekosirs_backend.renderers import ORJSONRenderer
+
+
+class ORJSONRendererTestCase(SimpleTestCase):
+
+    def assertSameOutput(self, data, **kwargs):
+        self.assertEqual(ORJSONRenderer().render(data, **kwargs), JSONRenderer().render(data, **kwargs))
+
+    def test_matches_drf_output(self):
+        self.assertSameOutput({
+            'when': datetime.datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=datetime.timezone.utc),
+            'local': timezone.localtime(datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)),
+            'day': datetime.date(2026, 1, 2),
+            'at': datetime.time(9, 30),
+            'price': Decimal('15999.99'),
+            'label': gettext_lazy('Beklemede'),
+            'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+            'nested': [{'ş': 'Çamaşır', 1: None, 'ok': True}],
+            'separator': 'a\u2028b\u2029c',
+        })
+
+    def test_indent_falls_back_to_drf(self):
+        self.assertSameOutput({'a': [1, 2]}, accepted_media_type='application/json; indent=4')
+
+    def test_oversized_int_falls_back_to_drf(self):
+        self.assertSameOutput({'big': 2 ** 70})
+
+    def test_none_renders_empty(self):
+        self.assertEqual(ORJSONRenderer().render(None), b'')
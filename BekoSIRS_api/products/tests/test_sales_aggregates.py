@@ -0,0 +1,88 @@
+"""
+Aylik satis ozet tablosunun (SalesMonthlyAggregate) sinyal ve yeniden hesaplama testleri.
+"""
+
+from datetime import timedelta
+from decimal import Decimal
+
+from django.utils import timezone
+
+from products.conftest import BaseTestCase
+from products.models import ProductAssignment, SalesMonthlyAggregate
+from products.services.sales_aggregates import month_bucket, rebuild_sales_aggregates
+
+
+class SalesMonthlyAggregateTestCase(BaseTestCase):
+
+    def _rows(self):
+        return set(SalesMonthlyAggregate.objects.values_list('product_id', 'month', 'quantity', 'order_count'))
+
+    def _assign(self, product, quantity=1):
+        return ProductAssignment.objects.create(customer=self.customer_user, product=product, quantity=quantity)
+
+    def test_sales_are_accumulated_per_month_and_product(self):
+        self._assign(self.product_fridge, 2)
+        self._assign(self.product_fridge, 3)
+        self._assign(self.product_tv)
+        month = month_bucket(timezone.now())
+
+        self.assertEqual(self._rows(), {
+            (self.product_fridge.id, month, 5, 2),
+            (self.product_tv.id, month, 1, 1),
+        })
+
+    def test_update_and_delete_adjust_the_bucket(self):
+        assignment = self._assign(self.product_fridge, 2)
+        month = month_bucket(assignment.assigned_at)
+
+        assignment.quantity = 4
+        assignment.save()
+        self.assertEqual(self._rows(), {(self.product_fridge.id, month, 4, 1)})
+
+        assignment.product = self.product_tv
+        assignment.save()
+        self.assertEqual(self._rows(), {
+            (self.product_fridge.id, month, 0, 0),
+            (self.product_tv.id, month, 4, 1),
+        })
+
+        assignment.delete()
+        self.assertEqual(self._rows(), {
+            (self.product_fridge.id, month, 0, 0),
+            (self.product_tv.id, month, 0, 0),
+        })
+
+    def test_rebuild_matches_backdated_bulk_updates(self):
+        self._assign(self.product_fridge, 2)
+        old = self._assign(self.product_washer, 3)
+        backdated = timezone.now() - timedelta(days=70)
+        ProductAssignment.objects.filter(pk=old.pk).update(assigned_at=backdated)
+
+        rebuild_sales_aggregates()
+
+        self.assertEqual(self._rows(), {
+            (self.product_fridge.id, month_bucket(timezone.now()), 2, 1),
+            (self.product_washer.id, month_bucket(backdated), 3, 1),
+        })
+
+    def test_revenue_uses_price_at_sale_time(self):
+        self._assign(self.product_tv, 2)
+        self.product_tv.price = Decimal('1.00')
+        self.product_tv.save()
+        self._assign(self.product_tv, 1)
+
+        aggregate = SalesMonthlyAggregate.objects.get(product=self.product_tv)
+        self.assertEqual(aggregate.revenue, Decimal('24999.00') * 2 + Decimal('1.00'))
+
+        rebuild_sales_aggregates()
+        self.assertEqual(
+            SalesMonthlyAggregate.objects.get(product=self.product_tv).revenue,
+            aggregate.revenue,
+        )
+
+    def test_product_delete_cascades_cleanly(self):
+        self._assign(self.product_tv, 2)
+
+        self.product_tv.delete()
+
+        self.assertFalse(SalesMonthlyAggregate.objects.exists())
@@ -0,0 +1,34 @@
+"""
+Derleme zamaninda uretilen OpenAPI semasini sunan gorunumun testleri.
+"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIRequestFactory
+
+from bekosirs_backend.urls import PrebuiltSchemaView
+
+STALE_SCHEMA = {'openapi': '3.0.3', 'info': {'title': 'stale'}, 'paths': {}}
+
+
+class PrebuiltSchemaViewTestCase(SimpleTestCase):
+
+    def _get(self):
+        request = APIRequestFactory().get('/api/v1/schema/', HTTP_ACCEPT='application/json')
+        with mock.patch('bekosirs_backend.urls._load_prebuilt_schema', return_value=STALE_SCHEMA):
+            response = PrebuiltSchemaView.as_view()(request)
+        response.render()
+        return response
+
+    @override_settings(DEBUG=False)
+    def test_artifact_is_served_in_production(self):
+        self.assertEqual(self._get().data, STALE_SCHEMA)
+
+    @override_settings(DEBUG=True)
+    def test_debug_generates_schema_live(self):
+        response = self._get()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.data['info']['title'], 'stale')
+        self.assertTrue(response.data['paths'])
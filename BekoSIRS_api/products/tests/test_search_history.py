@@ -0,0 +1,34 @@
+"""
+Urun aramasinda musteri arama gecmisi kaydinin testleri.
+"""
+
+from datetime import timedelta
+
+from django.utils import timezone
+
+from products.conftest import APITestCase
+from products.models import SearchHistory
+
+
+class SearchHistoryTestCase(APITestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.authenticate_customer()
+
+    def _search(self, query):
+        self.assertEqual(self.client.get('/api/v1/products/', {'search': query}).status_code, 200)
+
+    def test_repeated_search_within_five_minutes_is_logged_once(self):
+        self._search('Buzdolabı')
+        self._search('buzdolabı')
+
+        self.assertEqual(SearchHistory.objects.filter(customer=self.customer_user).count(), 1)
+
+    def test_search_repeated_a_day_later_is_logged_again(self):
+        self._search('Buzdolabı')
+        SearchHistory.objects.update(created_at=timezone.now() - timedelta(days=1, seconds=10))
+
+        self._search('Buzdolabı')
+
+        self.assertEqual(SearchHistory.objects.filter(customer=self.customer_user).count(), 2)
@@ -0,0 +1,41 @@
+"""
+Servis durum sayaclarinin (ServiceStatusCounter) sinyal ve yeniden hesaplama testleri.
+"""
+
+from products.conftest import BaseTestCase
+from products.models import ServiceRequest, ServiceStatusCounter
+from products.services.service_counters import rebuild_service_status_counters, status_counts
+
+
+class ServiceStatusCounterTestCase(BaseTestCase):
+
+    def _nonzero(self):
+        return {code: count for code, count in status_counts().items() if count}
+
+    def test_counts_follow_create_status_change_and_delete(self):
+        first = self.create_service_request(status='pending')
+        self.create_service_request(status='pending')
+        self.assertEqual(self._nonzero(), {'pending': 2})
+
+        first.status = 'in_progress'
+        first.save()
+        self.assertEqual(self._nonzero(), {'pending': 1, 'in_progress': 1})
+
+        first.delete()
+        self.assertEqual(self._nonzero(), {'pending': 1})
+
+    def test_status_counts_are_zero_filled(self):
+        counts = status_counts()
+
+        self.assertEqual(set(counts), {code for code, _ in ServiceRequest.STATUS_CHOICES})
+        self.assertFalse(any(counts.values()))
+
+    def test_rebuild_matches_bulk_updates(self):
+        self.create_service_request(status='pending')
+        self.create_service_request(status='pending')
+        ServiceRequest.objects.update(status='completed')
+
+        rebuild_service_status_counters()
+
+        self.assertEqual(self._nonzero(), {'completed': 2})
+        self.assertEqual(ServiceStatusCounter.objects.count(), 1)
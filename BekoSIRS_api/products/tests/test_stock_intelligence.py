@@ -0,0 +1,33 @@
+"""
+Stok zekasi panosunun satis hizi girdilerinin testleri.
+"""
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from products.conftest import APITestCase
+from products.models import Product, ProductAssignment
+
+
+class StockIntelligenceDashboardTestCase(APITestCase):
+
+    def test_recent_sales_feed_product_rows(self):
+        ProductAssignment.objects.create(customer=self.customer_user, product=self.product_tv, quantity=3)
+        self.authenticate_admin()
+
+        response = self.client.get('/api/v1/stock-intelligence/dashboard/')
+
+        self.assertEqual(response.status_code, 200)
+        sales = {row['name']: row['sales_count'] for row in response.data['low_performers']}
+        self.assertEqual(sales[self.product_tv.name], 3)
+        self.assertEqual(sales[self.product_fridge.name], 0)
+        self.assertEqual(response.data['top_sellers'][0]['sales_count'], 3)
+
+    def test_total_products_without_separate_count_query(self):
+        self.authenticate_admin()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/v1/stock-intelligence/dashboard/')
+
+        self.assertEqual(response.data['summary']['total_products'], Product.objects.count())
+        self.assertFalse([q for q in queries.captured_queries if 'COUNT(*)' in q['sql'] and 'products_product' in q['sql']])
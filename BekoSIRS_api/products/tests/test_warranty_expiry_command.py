@@ -0,0 +1,124 @@
+"""
+check_warranty_expiry komutunun garanti bitis taramasi testleri.
+"""
+
+from datetime import datetime, timezone as dt_timezone
+from io import StringIO
+from unittest import mock
+
+from dateutil.relativedelta import relativedelta
+from django.core.management import call_command
+from django.utils import timezone
+
+from products.conftest import BaseTestCase
+from products.models import Notification, UserNotificationPreference
+from products.services.command_lock import command_lock
+
+
+class CheckWarrantyExpiryCommandTestCase(BaseTestCase):
+
+    def test_only_ownerships_expiring_in_window_are_notified(self):
+        today = timezone.now().date()
+        months = self.product_tv.warranty_duration_months
+        expiring = self.create_product_ownership(
+            product=self.product_tv,
+            purchase_date=today - relativedelta(months=months) + relativedelta(days=10),
+        )
+        self.create_product_ownership(product=self.product_fridge, purchase_date=today)
+
+        call_command('check_warranty_expiry', stdout=StringIO())
+
+        notifications = Notification.objects.filter(notification_type='warranty_expiry')
+        self.assertEqual(
+            list(notifications.values_list('user_id', 'related_product_id')),
+            [(self.customer_user.id, expiring.product_id)],
+        )
+
+        # Ayni hafta icinde ikinci calistirma tekrar bildirim uretmez
+        call_command('check_warranty_expiry', stdout=StringIO())
+        self.assertEqual(notifications.count(), 1)
+
+    def test_opted_out_customer_is_skipped(self):
+        today = timezone.now().date()
+        months = self.product_tv.warranty_duration_months
+        UserNotificationPreference.objects.create(user=self.customer_user, notify_warranty_expiry=False)
+        self.create_product_ownership(
+            product=self.product_tv,
+            purchase_date=today - relativedelta(months=months) + relativedelta(days=5),
+        )
+
+        call_command('check_warranty_expiry', stdout=StringIO())
+
+        self.assertFalse(Notification.objects.filter(notification_type='warranty_expiry').exists())
+
+    def test_duplicate_ownerships_of_a_product_notify_once(self):
+        today = timezone.now().date()
+        months = self.product_tv.warranty_duration_months
+        for days in (3, 12):
+            self.create_product_ownership(
+                product=self.product_tv,
+                purchase_date=today - relativedelta(months=months) + relativedelta(days=days),
+            )
+
+        call_command('check_warranty_expiry', stdout=StringIO())
+
+        self.assertEqual(Notification.objects.filter(notification_type='warranty_expiry').count(), 1)
+
+    def test_window_edges_are_inclusive(self):
+        now = datetime(2025, 6, 15, 9, 0, tzinfo=dt_timezone.utc)
+        today = now.date()
+        months = self.product_tv.warranty_duration_months
+        self.create_product_ownership(product=self.product_tv, purchase_date=today - relativedelta(months=months))
+        self.create_product_ownership(
+            customer=self.seller_user,
+            product=self.product_tv,
+            purchase_date=today + relativedelta(days=30) - relativedelta(months=months),
+        )
+        self.create_product_ownership(
+            customer=self.admin_user,
+            product=self.product_tv,
+            purchase_date=today + relativedelta(days=31) - relativedelta(months=months),
+        )
+
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            call_command('check_warranty_expiry', stdout=StringIO())
+
+        self.assertEqual(
+            set(Notification.objects.filter(notification_type='warranty_expiry').values_list('user_id', flat=True)),
+            {self.customer_user.id, self.seller_user.id},
+        )
+
+    def test_dry_run_reports_projected_fields_in_fixed_queries(self):
+        today = timezone.now().date()
+        months = self.product_tv.warranty_duration_months
+        self.create_product_ownership(
+            product=self.product_tv,
+            purchase_date=today - relativedelta(months=months) + relativedelta(days=10),
+        )
+        out = StringIO()
+
+        # garanti sureleri + tarama + son bildirimler
+        with self.assertNumQueries(3):
+            call_command('check_warranty_expiry', '--dry-run', stdout=out)
+
+        self.assertIn(f'{self.customer_user.email}: {self.product_tv.name}', out.getvalue())
+        self.assertFalse(Notification.objects.exists())
+
+    def test_overlapping_run_is_skipped(self):
+        today = timezone.now().date()
+        months = self.product_tv.warranty_duration_months
+        self.create_product_ownership(
+            product=self.product_tv,
+            purchase_date=today - relativedelta(months=months) + relativedelta(days=10),
+        )
+        out = StringIO()
+
+        with command_lock('check_warranty_expiry'):
+            call_command('check_warranty_expiry', stdout=out)
+
+        self.assertIn('atlandı', out.getvalue())
+        self.assertFalse(Notification.objects.exists())
+
+        # Kilit birakildiktan sonra bir sonraki calistirma normal yurur
+        call_command('check_warranty_expiry', stdout=StringIO())
+        self.assertEqual(Notification.objects.count(), 1)
@@ -1,15 +1,48 @@
 from rest_framework import viewsets, views, response, permissions, status
 from rest_framework.decorators import action
-from datetime import timedelta, date
+from collections import Counter
+from datetime import datetime, time, timedelta, date
+import heapq
+from django.core.cache import cache
 from django.db.models import Sum, Count, F, Q, Avg
 from django.utils import timezone
+import numpy as np
 import traceback
 import sys
 from products.models import (
     Product, ProductOwnership, ServiceRequest, CustomUser, Category, 
-    AuditLog, ProductAssignment, InstallmentPlan, Delivery
+    AuditLog, ProductAssignment, InstallmentPlan, Delivery, SalesMonthlyAggregate
 )
 from products.serializers import AuditLogSerializer
+from products.services.sales_aggregates import month_bucket
+from products.services.service_counters import status_counts
+from products.signals import DASHBOARD_CHARTS_CACHE_KEY, SEASONAL_ANALYSIS_CACHE_KEY
+
+# Dashboard grafikleri her yüklemede birkaç tam tablo toplama sorgusu çalıştırır. Sonuç kısa süre
+# önbellekte tutulur; satış/servis kayıtları değiştiğinde products.signals anahtarı siler.
+CHARTS_CACHE_TTL = 60
+
+# Mevsimsel analiz yalnızca aylık satış özetine bağlı; aynı sinyallerle geçersiz kılınır
+SEASONAL_CACHE_TTL = 60 * 5
+
+# Ay numarası (1-12) ile doğrudan indekslenir; 0. eleman boş bırakıldı
+MONTH_NAMES_TR = (
+    "", "Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran",
+    "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık",
+)
+
+SERVICE_STATUS_LABELS = dict(ServiceRequest.STATUS_CHOICES)
+
+CUSTOMER_SEGMENT_LABELS = ("Sadık Müşteri (>5 Sipariş)", "Potansiyel (1-5 Sipariş)", "Yeni Üye (<30 Gün)", "Pasif")
+
+
+def _local_day_start(day):
+    """Yerel saatte günün başlangıcı (aware datetime).
+
+    `alan__date=...` filtreleri sütunu fonksiyona sardığı için indeks kullanılamaz;
+    bunun yerine [gün başı, ertesi gün başı) aralığı ile filtrelenir.
+    """
+    return timezone.make_aware(datetime.combine(day, time.min))
 
 # ... other views ...
 
@@ -17,68 +50,99 @@ class ChartsView(views.APIView):
     permission_classes = [permissions.AllowAny]
 
     def get(self, request):
-        today = timezone.now().date()
+        data = cache.get_or_set(DASHBOARD_CHARTS_CACHE_KEY, self.build_charts, CHARTS_CACHE_TTL)
+        return response.Response(data)
+
+    @staticmethod
+    def build_charts():
+        """Grafik verisini hesaplar (önbelleği ısıtan refresh_dashboard_cache komutu da kullanır)."""
+        # Saat tek kez okunur; tüm pencereler aynı andan türetilir (gece yarısında tutarlı kalır)
+        now = timezone.now()
+        today = timezone.localdate(now)
+        today_start = _local_day_start(today)
+        tomorrow_start = _local_day_start(today + timedelta(days=1))
         
         # 1. Summary Cards
         # Calculate from ProductAssignment (Cash/Regular Sales)
-        assignments_today = ProductAssignment.objects.filter(assigned_at__date=today)
-        assignments_count = assignments_today.count()
-        assignments_revenue = assignments_today.aggregate(
-            total=Sum(F('product__price') * F('quantity'))
-        )['total'] or 0
+        assignments_today = ProductAssignment.objects.filter(
+            assigned_at__gte=today_start, assigned_at__lt=tomorrow_start
+        ).aggregate(
+            count=Count('id'),
+            revenue=Sum(F('unit_price') * F('quantity')),
+        )
+        assignments_count = assignments_today['count']
+        assignments_revenue = assignments_today['revenue'] or 0
 
         # Calculate from InstallmentPlan (Installment Sales)
-        installments_today = InstallmentPlan.objects.filter(created_at__date=today)
-        installments_count = installments_today.count()
-        installments_revenue = installments_today.aggregate(total=Sum('total_amount'))['total'] or 0
+        installments_today = InstallmentPlan.objects.filter(
+            created_at__gte=today_start, created_at__lt=tomorrow_start
+        ).aggregate(
+            count=Count('id'),
+            revenue=Sum('total_amount'),
+        )
+        installments_count = installments_today['count']
+        installments_revenue = installments_today['revenue'] or 0
 
         today_sales_count = assignments_count + installments_count
         today_revenue = assignments_revenue + installments_revenue
-        
-        pending_service_count = ServiceRequest.objects.filter(status='pending').count()
-        total_customers_count = CustomUser.objects.filter(role='customer').count()
 
-        # 2. Revenue by Category
+        # Müşteri sayıları tek sorguda (özet kartı + segmentler)
+        month_ago = now - timedelta(days=30)
+        customer_stats = CustomUser.objects.filter(role='customer').aggregate(
+            total=Count('id'),
+            inactive=Count('id', filter=Q(last_login__lt=month_ago)),
+            new=Count('id', filter=Q(date_joined__gte=month_ago)),
+        )
+        total_customers_count = customer_stats['total']
+
+        # 2. Revenue by Category (aylık satış özetinden; tüm satış tablosu taranmaz)
+        # Grafikler yalnızca (etiket, değer) çiftlerini kullanır; dict yerine tuple çekilir.
+        # Dilim sorguya LIMIT olarak gider; satırlar etiket/veri listelerine tek geçişte dağıtılır.
         category_revenue = (
-            ProductAssignment.objects.values('product__category__name')
-            .annotate(total_revenue=Sum(F('product__price') * F('quantity')))
+            SalesMonthlyAggregate.objects.values_list('product__category__name')
+            .annotate(total_revenue=Sum('revenue'))
             .order_by('-total_revenue')[:5]
         )
-        
-        cat_labels = [item['product__category__name'] or 'Diğer' for item in category_revenue]
-        cat_data = [float(item['total_revenue'] or 0) for item in category_revenue]
+        cat_labels, cat_data = [], []
+        for name, total in category_revenue:
+            cat_labels.append(name or 'Diğer')
+            cat_data.append(float(total or 0))
 
         # 3. Top Products (Best Sellers)
-        top_products_qs = (
-            ProductAssignment.objects.values('product__name')
+        top_products = (
+            SalesMonthlyAggregate.objects.values_list('product__name')
             .annotate(sales_count=Sum('quantity'))
             .order_by('-sales_count')[:5]
         )
-        
-        prod_labels = [item['product__name'] for item in top_products_qs]
-        prod_data = [item['sales_count'] for item in top_products_qs]
+        prod_labels, prod_data = [], []
+        for name, count in top_products:
+            prod_labels.append(name)
+            prod_data.append(count)
 
         # 4. Customer Segments
-        month_ago = timezone.now() - timedelta(days=30)
-        active_customers = CustomUser.objects.filter(role='customer', last_login__gte=month_ago).count()
-        inactive_customers = CustomUser.objects.filter(role='customer', last_login__lt=month_ago).count()
-        new_customers = CustomUser.objects.filter(role='customer', date_joined__gte=month_ago).count()
-        
-        loyal_count = ProductAssignment.objects.values('customer').annotate(count=Count('id')).filter(count__gt=5).count()
-        potential_count = ProductAssignment.objects.values('customer').annotate(count=Count('id')).filter(count__range=(1, 5)).count()
-        
-        segment_labels = ["Sadık Müşteri (>5 Sipariş)", "Potansiyel (1-5 Sipariş)", "Yeni Üye (<30 Gün)", "Pasif"]
-        segment_data = [loyal_count, potential_count, new_customers, inactive_customers]
+        new_customers = customer_stats['new']
+        inactive_customers = customer_stats['inactive']
 
-        # 5. Service by Status
-        service_stats = (
-            ServiceRequest.objects.values('status')
+        # Müşteri başına sipariş sayısı tek GROUP BY alt sorgusunda; iki segment aynı geçişte sayılır
+        segment_counts = (
+            ProductAssignment.objects.values('customer')
             .annotate(count=Count('id'))
-            .order_by('status')
+            .aggregate(
+                loyal=Count('customer', filter=Q(count__gt=5)),
+                potential=Count('customer', filter=Q(count__range=(1, 5))),
+            )
         )
-        status_map = dict(ServiceRequest.STATUS_CHOICES)
-        svc_labels = [status_map.get(item['status'], item['status']) for item in service_stats]
-        svc_data = [item['count'] for item in service_stats]
+        loyal_count = segment_counts['loyal']
+        potential_count = segment_counts['potential']
+        
+        segment_data = [loyal_count, potential_count, new_customers, inactive_customers]
+
+        # 5. Service by Status (durum sayaç tablosundan; ServiceRequest taranmaz)
+        service_counts = status_counts()
+        service_stats = [(code, count) for code, count in sorted(service_counts.items()) if count]
+        svc_labels = [SERVICE_STATUS_LABELS.get(code, code) for code, _ in service_stats]
+        svc_data = [count for _, count in service_stats]
+        pending_service_count = service_counts['pending']
 
         data = {
             "summary": {
@@ -96,7 +160,7 @@ class ChartsView(views.APIView):
                 "datasets": [{"data": prod_data if prod_data else [0]}]
             },
             "customer_segments": {
-                "labels": segment_labels,
+                "labels": list(CUSTOMER_SEGMENT_LABELS),
                 "datasets": [{"data": segment_data}]
             },
             "service_by_status": {
@@ -104,7 +168,7 @@ class ChartsView(views.APIView):
                 "datasets": [{"data": svc_data if svc_data else [0]}]
             }
         }
-        return response.Response(data)
+        return data
 
 
 class SalesForecastView(views.APIView):
@@ -116,12 +180,6 @@ class SalesForecastView(views.APIView):
     """
     permission_classes = [permissions.AllowAny]
 
-    MONTH_NAMES_TR = {
-        1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan",
-        5: "Mayıs", 6: "Haziran", 7: "Temmuz", 8: "Ağustos",
-        9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-    }
-
     @staticmethod
     def _trend_label(m1, m2, m3):
         if m3 > m2 > m1:
@@ -168,7 +226,6 @@ class SalesForecastView(views.APIView):
 
     def get(self, request):
         from products.ml_sales_forecaster import get_sales_forecaster
-        from django.db.models.functions import ExtractMonth, ExtractYear
 
         n_months = int(request.query_params.get('months', 3))
         if n_months not in (3, 12):
@@ -194,10 +251,14 @@ class SalesForecastView(views.APIView):
         now = timezone.now()
         twelve_months_ago = now - timedelta(days=365)
 
+        # Aylık satış özet tablosundan okunur (ay + ürün başına tek satır).
+        # 365 gün önceki kısmi ay dahil edilmez (month__gt): pencere son 12 ay
+        window_start = month_bucket(twelve_months_ago)
+
         # --- BATCH: Get top products by sales volume (single query) ---
         top_product_ids = list(
-            ProductAssignment.objects
-            .filter(assigned_at__gte=twelve_months_ago)
+            SalesMonthlyAggregate.objects
+            .filter(month__gt=window_start)
             .values('product_id')
             .annotate(total_sales=Sum('quantity'))
             .order_by('-total_sales')[:20]
@@ -211,22 +272,15 @@ class SalesForecastView(views.APIView):
 
         # --- BATCH: Get ALL monthly sales for these products in ONE query ---
         monthly_agg = (
-            ProductAssignment.objects
-            .filter(product_id__in=top_product_ids, assigned_at__gte=twelve_months_ago)
-            .annotate(
-                sale_year=ExtractYear('assigned_at'),
-                sale_month=ExtractMonth('assigned_at'),
-            )
-            .values('product_id', 'sale_year', 'sale_month')
-            .annotate(total=Sum('quantity'))
+            SalesMonthlyAggregate.objects
+            .filter(product_id__in=top_product_ids, month__gt=window_start)
+            .values_list('product_id', 'month', 'quantity')
         )
 
         # Build a lookup: {product_id: {(year, month): total}}
         sales_lookup = {}
-        for row in monthly_agg:
-            pid = row['product_id']
-            key = (row['sale_year'], row['sale_month'])
-            sales_lookup.setdefault(pid, {})[key] = row['total']
+        for pid, month, total in monthly_agg:
+            sales_lookup.setdefault(pid, {})[(month.year, month.month)] = total
 
         # --- Build forecasts ---
         forecasts = []
@@ -246,7 +300,7 @@ class SalesForecastView(views.APIView):
                 y, m = target_date.year, target_date.month
                 total = product_sales.get((y, m), 0)
                 monthly_sales.append(total)
-                monthly_labels.append(self.MONTH_NAMES_TR.get(m, str(m)))
+                monthly_labels.append(MONTH_NAMES_TR[m])
 
             m1, m2, m3 = monthly_sales[9], monthly_sales[10], monthly_sales[11]
             trend = self._trend_label(m1, m2, m3)
@@ -271,7 +325,7 @@ class SalesForecastView(views.APIView):
             forecast_entries = []
             for i in range(len(preds)):
                 future_m = ((now.month - 1 + i + 1) % 12) + 1
-                label = self.MONTH_NAMES_TR.get(future_m, f"Ay {i+1}")
+                label = MONTH_NAMES_TR[future_m]
                 forecast_entries.append({
                     "month": label,
                     "month_index": i + 1,
@@ -309,83 +363,81 @@ class SeasonalAnalysisView(views.APIView):
     """
     permission_classes = [permissions.AllowAny]
 
-    MONTH_NAMES_TR = {
-        1: "Ocak", 2: "Şubat", 3: "Mart", 4: "Nisan",
-        5: "Mayıs", 6: "Haziran", 7: "Temmuz", 8: "Ağustos",
-        9: "Eylül", 10: "Ekim", 11: "Kasım", 12: "Aralık"
-    }
-
     def get(self, request):
-        from django.db.models.functions import ExtractMonth
-        
+        data = cache.get_or_set(SEASONAL_ANALYSIS_CACHE_KEY, self.build_analysis, SEASONAL_CACHE_TTL)
+        return response.Response(data)
+
+    @staticmethod
+    def build_analysis():
         # Son 12 ay veya tüm geçmiş veri
-        one_year_ago = timezone.now() - timedelta(days=365)
+        now = timezone.now()
+        one_year_ago = now - timedelta(days=365)
         
-        # Ürün bazlı aylık satış verileri
+        # Ürün bazlı aylık satış verileri (aylık satış özet tablosundan).
+        # 365 gün önceki ay kısmi bir aydır; tam olarak sayılırsa aynı takvim ayı
+        # içinde bulunulan ayla üst üste biner. Pencere bir sonraki aydan başlar (12 ay).
         monthly_sales = (
-            ProductAssignment.objects
-            .filter(assigned_at__gte=one_year_ago)
-            .annotate(month=ExtractMonth('assigned_at'))
-            .values('product_id', 'product__name', 'product__category__name', 'month')
-            .annotate(total_sales=Sum('quantity'))
+            SalesMonthlyAggregate.objects
+            .filter(month__gt=month_bucket(one_year_ago))
+            .values('product_id', 'product__name', 'product__category__name', 'month', 'quantity')
             .order_by('product_id', 'month')
         )
         
-        # Ürünleri grupla
-        products_data = {}
-        for item in monthly_sales:
+        # Ürünleri grupla (satırlar parça parça okunur; queryset önbelleği doldurulmaz)
+        # Her ürün bir satır, her ay bir sütun: skorlar tüm ürünler için tek seferde hesaplanır
+        product_index = {}
+        product_meta = []
+        cell_rows, cell_months, cell_quantities = [], [], []
+        for item in monthly_sales.iterator(chunk_size=1000):
             pid = item['product_id']
-            if pid not in products_data:
-                products_data[pid] = {
-                    "product_name": item['product__name'],
-                    "category": item['product__category__name'] or "Diğer",
-                    "monthly_sales": {m: 0 for m in range(1, 13)},
-                    "total_year_sales": 0
-                }
-            products_data[pid]["monthly_sales"][item['month']] = item['total_sales']
-            products_data[pid]["total_year_sales"] += item['total_sales']
+            row = product_index.get(pid)
+            if row is None:
+                row = product_index[pid] = len(product_meta)
+                product_meta.append((pid, item['product__name'], item['product__category__name'] or "Diğer"))
+            cell_rows.append(row)
+            cell_months.append(item['month'].month - 1)
+            cell_quantities.append(item['quantity'])
+
+        sales = np.zeros((len(product_meta), 12), dtype=np.int64)
+        np.add.at(sales, (cell_rows, cell_months), cell_quantities)
+        totals = sales.sum(axis=1)
+        peak_months = sales.argmax(axis=1) + 1
+
+        # Mevsimsellik skoru (ne kadar belirgin bir tepe varsa o kadar yüksek)
+        # Standart sapma / ortalama (popülasyon std'si, 12 ay üzerinden)
+        avg_sales = totals / 12
+        with np.errstate(divide='ignore', invalid='ignore'):
+            seasonality = np.where(avg_sales > 0, np.minimum(sales.std(axis=1) / avg_sales, 2.0), 0.0)
         
-        # Sonuçları hazırla
+        # Sonuçları hazırla: yalnızca toplam satışı en yüksek 20 ürün (satışı olmayanlar hariç)
+        # için; tüm listeyi sıralamak yerine kısmi seçim, eşitlikte ilk görülen önde kalır
+        top_rows = heapq.nlargest(20, np.flatnonzero(totals).tolist(), key=totals.__getitem__)
         seasonal_products = []
-        for pid, data in products_data.items():
-            monthly = data["monthly_sales"]
-            total = data["total_year_sales"]
-            
-            if total == 0:
-                continue
+        for row in top_rows:
+            pid, product_name, category = product_meta[row]
+            total = int(totals[row])
             
             # En yüksek satış yapılan ay
-            peak_month = max(monthly, key=monthly.get)
-            peak_sales = monthly[peak_month]
-            
-            # Mevsimsellik skoru (ne kadar belirgin bir tepe varsa o kadar yüksek)
-            # Standart sapma / ortalama
-            avg_sales = total / 12
-            if avg_sales > 0:
-                variance = sum((s - avg_sales) ** 2 for s in monthly.values()) / 12
-                std_dev = variance ** 0.5
-                seasonality_score = round(min(std_dev / avg_sales, 2.0), 2)
-            else:
-                seasonality_score = 0
+            peak_month = int(peak_months[row])
+            peak_sales = int(sales[row, peak_month - 1])
+            seasonality_score = round(float(seasonality[row]), 2)
             
             # Öneri oluştur
             if seasonality_score > 1.0:
-                recommendation = f"{self.MONTH_NAMES_TR[peak_month]} ayında stok artır"
+                recommendation = f"{MONTH_NAMES_TR[peak_month]} ayında stok artır"
             elif seasonality_score > 0.5:
                 recommendation = "Mevsimsel dalgalanma var, dikkatli takip et"
             else:
                 recommendation = "Yıl boyunca dengeli satış"
             
             # Aylık satışları Türkçe ay isimleriyle
-            monthly_sales_tr = {
-                self.MONTH_NAMES_TR[m]: s for m, s in monthly.items()
-            }
+            monthly_sales_tr = dict(zip(MONTH_NAMES_TR[1:], sales[row].tolist()))
             
             seasonal_products.append({
                 "product_id": pid,
-                "product_name": data["product_name"],
-                "category": data["category"],
-                "peak_month": self.MONTH_NAMES_TR[peak_month],
+                "product_name": product_name,
+                "category": category,
+                "peak_month": MONTH_NAMES_TR[peak_month],
                 "peak_sales": peak_sales,
                 "total_year_sales": total,
                 "monthly_sales": monthly_sales_tr,
@@ -393,12 +445,9 @@ class SeasonalAnalysisView(views.APIView):
                 "recommendation": recommendation
             })
         
-        # En yüksek toplam satışlara göre sırala
-        seasonal_products.sort(key=lambda x: x["total_year_sales"], reverse=True)
-        
         # Kategori bazlı özet
         category_summary = {}
-        for product in seasonal_products[:20]:  # İlk 20 ürün
+        for product in seasonal_products:
             cat = product["category"]
             if cat not in category_summary:
                 category_summary[cat] = {"peak_months": [], "products_count": 0}
@@ -410,18 +459,17 @@ class SeasonalAnalysisView(views.APIView):
             months = category_summary[cat]["peak_months"]
             if months:
                 # En çok tekrar eden 3 ay
-                from collections import Counter
                 top_months = [m for m, _ in Counter(months).most_common(3)]
                 category_summary[cat]["peak_months"] = top_months
         
-        return response.Response({
-            "seasonal_products": seasonal_products[:20],  # İlk 20 ürün
+        return {
+            "seasonal_products": seasonal_products,  # İlk 20 ürün
             "category_summary": category_summary,
             "data_period": {
                 "start": one_year_ago.strftime("%Y-%m-%d"),
-                "end": timezone.now().strftime("%Y-%m-%d")
+                "end": now.strftime("%Y-%m-%d")
             }
-        })
+        }
 
 class MarketingAutomationView(views.APIView):
     """
@@ -433,37 +481,32 @@ class MarketingAutomationView(views.APIView):
 
     def get(self, request):
         try:
-            today = timezone.now().date()
+            now = timezone.now()
+            today = timezone.localdate(now)
             
-            # 1. Anniversary Campaign - customers who joined in this month (instead of birthday)
-            # Note: birth_date field does not exist in CustomUser model
-            anniversary_eligible = CustomUser.objects.filter(
-                role='customer',
-                date_joined__month=today.month
-            ).count()
-
-            
-            # 2. Churn Prevention
-            ninety_days_ago = timezone.now() - timedelta(days=90)
-            churn_eligible = CustomUser.objects.filter(
-                role='customer',
-                last_login__lt=ninety_days_ago
-            ).count()
+            # Müşteri tabanlı kampanyalar (1, 2, 4) ve özet sayıları tek aggregate sorgusunda
+            ninety_days_ago = now - timedelta(days=90)
+            thirty_days_ago = now - timedelta(days=30)
+            seven_days_ago = now - timedelta(days=7)
+            customer_campaigns = CustomUser.objects.filter(role='customer').aggregate(
+                # 1. Anniversary Campaign - customers who joined in this month (instead of birthday)
+                # Note: birth_date field does not exist in CustomUser model
+                anniversary=Count('id', filter=Q(date_joined__month=today.month)),
+                # 2. Churn Prevention
+                churn=Count('id', filter=Q(last_login__lt=ninety_days_ago)),
+                # 4. Welcome Campaign
+                welcome=Count('id', filter=Q(date_joined__gte=seven_days_ago)),
+                total=Count('id'),
+                active=Count('id', filter=Q(last_login__gte=thirty_days_ago)),
+            )
+            anniversary_eligible = customer_campaigns['anniversary']
+            churn_eligible = customer_campaigns['churn']
+            welcome_eligible = customer_campaigns['welcome']
             
             # 3. Review Request
-            thirty_days_ago = timezone.now() - timedelta(days=30)
-            recent_buyers = ProductAssignment.objects.filter(
+            review_eligible = ProductAssignment.objects.filter(
                 assigned_at__gte=thirty_days_ago
-            ).values_list('customer_id', flat=True).distinct()
-            
-            review_eligible = len(set(recent_buyers))
-            
-            # 4. Welcome Campaign
-            seven_days_ago = timezone.now() - timedelta(days=7)
-            welcome_eligible = CustomUser.objects.filter(
-                role='customer',
-                date_joined__gte=seven_days_ago
-            ).count()
+            ).values('customer_id').distinct().count()
             
             # 5. Installment Reminder
             from products.models import Installment
@@ -483,63 +526,44 @@ class MarketingAutomationView(views.APIView):
             # SALES CHARTS DATA (Weekly / Monthly / Yearly)
             # ==========================================
             
-            # 1. Weekly Sales (batch query instead of per-day loop)
-            seven_days_ago = today - timedelta(days=6)
-            weekly_qs = ProductAssignment.objects.filter(
-                assigned_at__date__gte=seven_days_ago,
-                assigned_at__date__lte=today,
-            ).values('assigned_at__date').annotate(
-                total_sales=Sum('quantity'),
-                total_revenue=Sum(F('product__price') * F('quantity'))
-            )
-            weekly_map = {item['assigned_at__date']: item for item in weekly_qs}
-            
-            weekly_stats = []
-            for i in range(6, -1, -1):
-                day = today - timedelta(days=i)
-                stats = weekly_map.get(day, {'total_sales': 0, 'total_revenue': 0})
-                weekly_stats.append({
-                    "label": day.strftime("%d %b"),
-                    "sales": stats['total_sales'] or 0,
-                    "revenue": float(stats['total_revenue'] or 0)
-                })
+            # 1-2. Monthly / Weekly Sales
+            # Son 30 günün günlük toplamları tek sorguda; haftalık grafik son 7 günün dilimidir
+            window_start = today - timedelta(days=29)
+            daily_totals = {
+                day: (total_sales, total_revenue)
+                for day, total_sales, total_revenue in ProductAssignment.objects.filter(
+                    assigned_at__gte=_local_day_start(window_start),
+                    assigned_at__lt=_local_day_start(today + timedelta(days=1)),
+                ).values_list('assigned_at__date').annotate(
+                    total_sales=Sum('quantity'),
+                    total_revenue=Sum(F('unit_price') * F('quantity'))
+                ).order_by()
+            }
 
-            # 2. Monthly Sales
             monthly_stats = []
-            monthly_data_qs = ProductAssignment.objects.filter(
-                assigned_at__date__gte=thirty_days_ago
-            ).values('assigned_at__date').annotate(
-                total_sales=Sum('quantity'),
-                total_revenue=Sum(F('product__price') * F('quantity'))
-            ).order_by('assigned_at__date')
-            
-            monthly_map = {item['assigned_at__date']: item for item in monthly_data_qs}
-            
             for i in range(29, -1, -1):
                 day = today - timedelta(days=i)
-                stats = monthly_map.get(day, {'total_sales': 0, 'total_revenue': 0})
+                total_sales, total_revenue = daily_totals.get(day, (0, 0))
                 monthly_stats.append({
                     "label": day.strftime("%d %b"),
-                    "sales": stats['total_sales'] or 0,
-                    "revenue": float(stats['total_revenue'] or 0)
+                    "sales": total_sales or 0,
+                    "revenue": float(total_revenue or 0)
                 })
+            weekly_stats = monthly_stats[-7:]
 
-            # 3. Yearly Sales
-            from django.db.models.functions import ExtractMonth, ExtractYear
+            # 3. Yearly Sales (aylık satış özet tablosundan)
             one_year_ago = today - timedelta(days=365)
             
-            yearly_data_qs = ProductAssignment.objects.filter(
-                assigned_at__date__gte=one_year_ago
-            ).annotate(
-                month=ExtractMonth('assigned_at'),
-                year=ExtractYear('assigned_at')
-            ).values('year', 'month').annotate(
+            # Son 12 ay: 365 gün önceki kısmi ay dahil edilmez
+            yearly_data_qs = SalesMonthlyAggregate.objects.filter(
+                month__gt=one_year_ago.replace(day=1)
+            ).values('month').annotate(
                 total_sales=Sum('quantity'),
-                total_revenue=Sum(F('product__price') * F('quantity'))
-            ).order_by('year', 'month')
+                total_revenue=Sum('revenue')
+            ).order_by('month')
             
             yearly_stats = []
-            yearly_map = {(item['year'], item['month']): item for item in yearly_data_qs}
+            yearly_map = {(item['month'].year, item['month'].month): item for item in yearly_data_qs}
             
             current_date = date(today.year, today.month, 1)
             for i in range(11, -1, -1):
@@ -550,11 +574,8 @@ class MarketingAutomationView(views.APIView):
                     target_year -= 1
                 
                 stats = yearly_map.get((target_year, target_month), {'total_sales': 0, 'total_revenue': 0})
-                month_name = date(target_year, target_month, 1).strftime("%B")
-                tr_months = {"January": "Ocak", "February": "Şubat", "March": "Mart", "April": "Nisan", "May": "Mayıs", "June": "Haziran", "July": "Temmuz", "August": "Ağustos", "September": "Eylül", "October": "Ekim", "November": "Kasım", "December": "Aralık"}
-                
                 yearly_stats.append({
-                    "label": tr_months.get(month_name, month_name),
+                    "label": MONTH_NAMES_TR[target_month],
                     "sales": stats['total_sales'] or 0,
                     "revenue": float(stats['total_revenue'] or 0)
                 })
@@ -587,11 +608,8 @@ class MarketingAutomationView(views.APIView):
                     }
                 },
                 "summary": {
-                    "total_customers": CustomUser.objects.filter(role='customer').count(),
-                    "active_last_30_days": CustomUser.objects.filter(
-                        role='customer',
-                        last_login__gte=thirty_days_ago
-                    ).count(),
+                    "total_customers": customer_campaigns['total'],
+                    "active_last_30_days": customer_campaigns['active'],
                     "total_campaigns": 6
                 },
                 "sales_chart": {
@@ -618,7 +636,8 @@ class MarketingAutomationView(views.APIView):
         campaign = request.data.get('campaign')
         dry_run = request.data.get('dry_run', True)
         
-        today = timezone.now().date()
+        now = timezone.now()
+        today = timezone.localdate(now)
         target_customers = []
         
         if campaign == 'anniversary':
@@ -629,14 +648,14 @@ class MarketingAutomationView(views.APIView):
             ).values_list('email', 'first_name'))
             
         elif campaign == 'churn_prevention':
-            ninety_days_ago = timezone.now() - timedelta(days=90)
+            ninety_days_ago = now - timedelta(days=90)
             target_customers = list(CustomUser.objects.filter(
                 role='customer',
                 last_login__lt=ninety_days_ago
             ).values_list('email', 'first_name'))
             
         elif campaign == 'review_request':
-            thirty_days_ago = timezone.now() - timedelta(days=30)
+            thirty_days_ago = now - timedelta(days=30)
             customer_ids = ProductAssignment.objects.filter(
                 assigned_at__gte=thirty_days_ago
             ).values_list('customer_id', flat=True).distinct()
@@ -645,7 +664,7 @@ class MarketingAutomationView(views.APIView):
             ).values_list('email', 'first_name'))
 
         elif campaign == 'welcome':
-            seven_days_ago = timezone.now() - timedelta(days=7)
+            seven_days_ago = now - timedelta(days=7)
             target_customers = list(CustomUser.objects.filter(
                 role='customer',
                 date_joined__gte=seven_days_ago
@@ -662,7 +681,7 @@ class MarketingAutomationView(views.APIView):
             ).values_list('email', 'first_name'))
             
         elif campaign == 'delivery_feedback':
-            thirty_days_ago = timezone.now() - timedelta(days=30)
+            thirty_days_ago = now - timedelta(days=30)
             customer_ids = Delivery.objects.filter(
                 status='DELIVERED',
                 delivered_at__gte=thirty_days_ago
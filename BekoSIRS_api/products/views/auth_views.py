@@ -17,6 +17,13 @@ class CustomTokenObtainPairSerializer(TokenObtainPairSerializer):
     - MOBILE: Only customers can login
     - WEB: Only admin/seller can login
     """
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        # Role claim lets clients read the role without an extra /profile call
+        token["role"] = user.role
+        return token
+
     def validate(self, attrs):
         data = super().validate(attrs)
 
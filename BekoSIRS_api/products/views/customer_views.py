@@ -9,7 +9,7 @@ from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from django.conf import settings
 from django.utils import timezone
-from django.db.models import Avg, F
+from django.db.models import Avg, Count, F, Q
 
 from products.models import (
     Product, ProductOwnership, Wishlist, WishlistItem,
@@ -268,37 +268,21 @@ class NotificationViewSet(viewsets.ModelViewSet):
         if not title or not message:
             return Response({'error': 'Başlık ve mesaj zorunludur'}, status=status.HTTP_400_BAD_REQUEST)
         
-        # Determine target users via notification preferences
-        from products.models import UserNotificationPreference
+        # Determine target users via notification preferences.
+        # Users without a preferences row get the defaults (notify_general=True).
+        target_users = CustomUser.objects.exclude(notification_preferences__notify_general=False)
         if target == 'customers':
-            target_users = CustomUser.objects.filter(
-                role='customer',
-                notification_preferences__notify_general=True
-            )
-        else:  # all
-            target_users = CustomUser.objects.filter(
-                notification_preferences__notify_general=True
-            )
-        # Also include users who don't have preferences yet (defaults are True)
-        if target == 'customers':
-            users_without_prefs = CustomUser.objects.filter(
-                role='customer'
-            ).exclude(notification_preferences__isnull=False)
-        else:
-            users_without_prefs = CustomUser.objects.exclude(
-                notification_preferences__isnull=False
-            )
-        target_users = target_users | users_without_prefs
+            target_users = target_users.filter(role='customer')
         
-        # Create notifications in bulk
+        # Create notifications in bulk (same text for every recipient, only ids are loaded)
         notifications = [
             Notification(
-                user=target_user,
+                user_id=target_user_id,
                 notification_type=notification_type,
                 title=title,
                 message=message
             )
-            for target_user in target_users
+            for target_user_id in target_users.values_list('id', flat=True)
         ]
         
         created = Notification.objects.bulk_create(notifications)
@@ -315,19 +299,24 @@ class NotificationViewSet(viewsets.ModelViewSet):
         if user.role not in ['admin', 'seller']:
             return Response({'error': 'Yetkisiz erişim'}, status=status.HTTP_403_FORBIDDEN)
         
-        total = Notification.objects.count()
-        read = Notification.objects.filter(is_read=True).count()
-        unread = Notification.objects.filter(is_read=False).count()
-        
-        by_type = {}
-        for notif_type in ['general', 'price_drop', 'restock', 'service_update', 'recommendation', 'warranty_expiry']:
-            by_type[notif_type] = Notification.objects.filter(notification_type=notif_type).count()
-        
+        notif_types = ['general', 'price_drop', 'restock', 'service_update', 'recommendation', 'warranty_expiry']
+
+        # All counters in one conditional-aggregate scan instead of one COUNT query each
+        counts = Notification.objects.aggregate(
+            total=Count('id'),
+            read=Count('id', filter=Q(is_read=True)),
+            unread=Count('id', filter=Q(is_read=False)),
+            **{
+                f'type_{notif_type}': Count('id', filter=Q(notification_type=notif_type))
+                for notif_type in notif_types
+            },
+        )
+
         return Response({
-            'total': total,
-            'read': read,
-            'unread': unread,
-            'by_type': by_type
+            'total': counts['total'],
+            'read': counts['read'],
+            'unread': counts['unread'],
+            'by_type': {notif_type: counts[f'type_{notif_type}'] for notif_type in notif_types}
         })
 
     @action(detail=False, methods=['get'], url_path='unread-count')
@@ -339,16 +328,27 @@ class NotificationViewSet(viewsets.ModelViewSet):
     @action(detail=True, methods=['post'], url_path='read')
     def mark_as_read(self, request, pk=None):
         """POST /api/notifications/{id}/read/ - Mark as read."""
-        notification = self.get_object()
-        notification.is_read = True
-        notification.save()
+        # Single UPDATE scoped to the caller's notifications (no SELECT + full-row save)
+        if not self.get_queryset().filter(pk=pk).update(is_read=True):
+            raise exceptions.NotFound()
         return Response({'success': True})
 
     @action(detail=False, methods=['post'], url_path='read-all')
     def mark_all_read(self, request):
-        """POST /api/notifications/read-all/ - Mark all as read."""
-        Notification.objects.filter(user=request.user, is_read=False).update(is_read=True)
-        return Response({'success': True})
+        """
+        POST /api/notifications/read-all/ - Mark all as read.
+        Optional body: {ids: [1, 2, ...]} marks only those (one UPDATE per batch).
+        """
+        notifications = Notification.objects.filter(user=request.user, is_read=False)
+        ids = request.data.get('ids')
+        if ids is not None:
+            try:
+                ids = [int(notification_id) for notification_id in ids]
+            except (TypeError, ValueError):
+                return Response({'error': 'ids bir tamsayı listesi olmalıdır'}, status=status.HTTP_400_BAD_REQUEST)
+            notifications = notifications.filter(id__in=ids)
+        updated = notifications.update(is_read=True)
+        return Response({'success': True, 'updated': updated})
 
     @action(detail=True, methods=['delete'], url_path='delete')
     def delete_notification(self, request, pk=None):
@@ -373,7 +373,7 @@ class RecommendationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        return Recommendation.objects.filter(customer=self.request.user).select_related('product')
+        return Recommendation.objects.filter(customer=self.request.user).select_related('product__category')
 
     def list(self, request):
         """GET /api/recommendations/ — ALWAYS instant. Refresh triggers background ML."""
@@ -386,14 +386,14 @@ class RecommendationViewSet(viewsets.ModelViewSet):
 
         recommendations = Recommendation.objects.filter(
             customer=user, dismissed=False
-        ).select_related('product').order_by('-score')[:10]
+        ).select_related('product__category').order_by('-score')[:10]
 
         # If user has zero recs, save popular products as instant fallback
         if not recommendations.exists():
             self._save_popular_fallback(user)
             recommendations = Recommendation.objects.filter(
                 customer=user, dismissed=False
-            ).select_related('product').order_by('-score')[:10]
+            ).select_related('product__category').order_by('-score')[:10]
 
         # Supplement if fewer than 10 (e.g. after dismissals)
         rec_list = list(recommendations)
@@ -407,7 +407,7 @@ class RecommendationViewSet(viewsets.ModelViewSet):
             needed = 10 - len(rec_list)
             fallback_products = Product.objects.exclude(
                 id__in=exclude_ids
-            ).order_by('-id')[:needed]
+            ).select_related('category').order_by('-id')[:needed]
             for i, p in enumerate(fallback_products):
                 rec = Recommendation.objects.create(
                     customer=user,
@@ -538,13 +538,15 @@ class RecommendationViewSet(viewsets.ModelViewSet):
                 recs = [r for r in recs if r['product_id'] not in dismissed_ids][:10]
 
                 Recommendation.objects.filter(customer=bg_user, dismissed=False).delete()
-                for rec in recs:
-                    Recommendation.objects.create(
+                Recommendation.objects.bulk_create([
+                    Recommendation(
                         customer=bg_user,
                         product_id=rec['product_id'],
                         score=rec.get('score', 0),
                         reason=rec.get('reason', 'AI önerisi')
                     )
+                    for rec in recs
+                ])
                 import logging
                 logging.getLogger(__name__).info(
                     "🔄 Background refresh complete for user %s", user_id
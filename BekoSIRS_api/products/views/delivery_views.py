@@ -17,6 +17,8 @@ from ..permissions import IsAdminOrReadOnly, IsDeliveryPerson
 from ..services.routing_provider import get_route_matrix
 from ..services.auto_planner import haversine_km, AVG_SPEED_KMH, delivery_install_min
 
+# Valid Delivery.status codes, built once instead of a dict(STATUS_CHOICES) per request
+DELIVERY_STATUS_CODES = frozenset(code for code, _ in Delivery.STATUS_CHOICES)
 
 def _assignment_status_filter(status_value):
     """Return a tolerant status filter while old data is being normalized."""
@@ -151,7 +153,7 @@ class ProductAssignmentViewSet(viewsets.ModelViewSet):
         qs = super().get_queryset()
         user = self.request.user
         # Customers only see their own assignments
-        if hasattr(user, 'role') and user.role == 'customer':
+        if getattr(user, 'role', None) == 'customer':
             qs = qs.filter(customer=user)
         # Filter by customer id for admin/seller usage (e.g. ?customer=5)
         customer_id = self.request.query_params.get('customer')
@@ -929,7 +931,7 @@ class DeliveryPersonViewSet(viewsets.GenericViewSet):
         new_status = request.data.get('status')
         if new_status == 'ISSUE':
             new_status = 'FAILED'
-        if new_status not in dict(Delivery.STATUS_CHOICES):
+        if new_status not in DELIVERY_STATUS_CODES:
             return Response({"error": "Geçersiz durum."}, status=status.HTTP_400_BAD_REQUEST)
 
         delivery.status = new_status
@@ -1,4 +1,9 @@
+from datetime import timedelta
+from decimal import Decimal
+
 from rest_framework import viewsets, permissions, status, decorators, response
+from django.db.models import DecimalField, Exists, OuterRef, Q, Sum, Value
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 from products.models import InstallmentPlan, Installment, Notification
 from products.serializers import (
@@ -10,6 +15,17 @@ from products.serializers import (
 from products.push_notifications import send_push_to_user
 
 
+def _with_paid_total(queryset):
+    """Ödenmiş taksit toplamını SQL'de hesaplar (serializer satır başına sorgu atmaz)."""
+    return queryset.annotate(
+        paid_installments_total=Coalesce(
+            Sum('installments__amount', filter=Q(installments__status='paid')),
+            Value(Decimal('0')),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        )
+    )
+
+
 def _mark_overdue_installments():
     """Vade tarihi geçmiş 'pending' taksitleri otomatik olarak 'overdue' yapar ve bildirim gönderir."""
     today = timezone.now().date()
@@ -22,17 +38,31 @@ def _mark_overdue_installments():
 
     if newly_overdue:
         Installment.objects.filter(
-            status='pending',
-            due_date__lt=today
+            pk__in=[inst.pk for inst in newly_overdue]
         ).update(status='overdue')
 
-        notifications = []
+        # Son 7 günde gecikme bildirimi almış (müşteri, ürün) çiftleri tek sorguda;
+        # check_overdue_installments ile aynı kural: ürün başına haftada bir bildirim
+        notified = set(
+            Notification.objects.filter(
+                notification_type='general',
+                title__startswith='Gecikmiş Taksit',
+                created_at__gte=timezone.now() - timedelta(days=7),
+            ).values_list('user_id', 'related_product_id')
+        )
+        to_notify = []
         for inst in newly_overdue:
-            customer = inst.plan.customer
+            key = (inst.plan.customer_id, inst.plan.product_id)
+            if key not in notified:
+                notified.add(key)
+                to_notify.append(inst)
+
+        notifications = []
+        for inst in to_notify:
             product = inst.plan.product
             days_late = (today - inst.due_date).days
             notifications.append(Notification(
-                user=customer,
+                user_id=inst.plan.customer_id,
                 notification_type='general',
                 title='Gecikmiş Taksit',
                 message=(
@@ -40,12 +70,12 @@ def _mark_overdue_installments():
                     f"{inst.installment_number}. taksidiniz {days_late} gün gecikmiş. "
                     f"Lütfen ödemenizi gerçekleştiriniz."
                 ),
-                related_product=product,
+                related_product_id=inst.plan.product_id,
             ))
         Notification.objects.bulk_create(notifications, ignore_conflicts=True)
 
         # Push notification gönder
-        for inst in newly_overdue:
+        for inst in to_notify:
             customer = inst.plan.customer
             product = inst.plan.product
             days_late = (today - inst.due_date).days
@@ -59,6 +89,12 @@ def _mark_overdue_installments():
 class InstallmentPlanViewSet(viewsets.ModelViewSet):
     queryset = InstallmentPlan.objects.all()
     permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action in ('list', 'retrieve'):
+            queryset = _with_paid_total(queryset.select_related('customer', 'product'))
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'create':
@@ -119,7 +155,9 @@ class InstallmentPlanViewSet(viewsets.ModelViewSet):
     def my_plans(self, request):
         """GET /api/v1/installment-plans/my-plans/ - Customer's own installment plans."""
         _mark_overdue_installments()
-        plans = InstallmentPlan.objects.filter(customer=request.user).prefetch_related('installments')
+        plans = _with_paid_total(
+            InstallmentPlan.objects.filter(customer=request.user).select_related('customer', 'product')
+        ).prefetch_related('installments')
         serializer = InstallmentPlanSerializer(plans, many=True)
         return response.Response(serializer.data)
 
@@ -144,11 +182,16 @@ class InstallmentViewSet(viewsets.ModelViewSet):
             installment.admin_confirmed_at = timezone.now()
             installment.save()
             
-            # Check if all paid, mark plan completed
+            # Tüm taksitler ödendiyse planı kapat: ödenmemiş taksit kontrolü tek EXISTS
+            # sorgusu; kayıt save() ile yazılır ki post_save (denetim kaydı, dashboard
+            # önbelleği) sinyalleri çalışsın
             plan = installment.plan
-            if not plan.installments.exclude(status='paid').exists():
+            all_paid = InstallmentPlan.objects.filter(pk=plan.pk).exclude(
+                Exists(Installment.objects.filter(plan=OuterRef('pk')).exclude(status='paid'))
+            ).exists()
+            if all_paid and plan.status != 'completed':
                 plan.status = 'completed'
-                plan.save()
+                plan.save(update_fields=['status'])
 
             # Push notification to customer
             customer = plan.customer
@@ -42,9 +42,9 @@ def password_reset_request(request):
         # Send email
         try:
             from products.email_service import EmailService
-            EmailService.send_password_reset_email(user, token.token)
-        except Exception as e:
-            logger.error(f"Failed to send password reset email to {user.email}: {e}", exc_info=True)
+            EmailService.send_password_reset_email(user, token)
+        except Exception:
+            logger.exception("Failed to send password reset email to %s", user.email)
             # Still return success to prevent email enumeration
 
         # Build response
@@ -32,6 +32,7 @@ class ProductViewSet(viewsets.ModelViewSet):
         Filter products by search query and category.
         Search looks in: name, brand, description, category name, model code
         """
+        from datetime import timedelta
         from django.db.models import Q
         from django.utils import timezone
         
@@ -54,15 +55,17 @@ class ProductViewSet(viewsets.ModelViewSet):
             
             # Record search history for logged-in customers
             user = self.request.user
-            if user.is_authenticated and hasattr(user, 'role') and user.role == 'customer':
+            if user.is_authenticated and user.role == 'customer':
                 try:
                     # Avoid duplicate logging if recent search exists (e.g. 5 minutes)
-                    last_search = SearchHistory.objects.filter(
-                        customer=user, 
-                        query__iexact=search_query
-                    ).order_by('-created_at').first()
+                    # Single EXISTS on the time window instead of loading the latest row
+                    recent_search = SearchHistory.objects.filter(
+                        customer=user,
+                        query__iexact=search_query,
+                        created_at__gte=timezone.now() - timedelta(seconds=300),
+                    ).exists()
                     
-                    if not last_search or (timezone.now() - last_search.created_at).seconds > 300:
+                    if not recent_search:
                         SearchHistory.objects.create(customer=user, query=search_query)
                 except Exception as e:
                     print(f"Search history error: {e}")
@@ -200,24 +203,27 @@ class ProductViewSet(viewsets.ModelViewSet):
         """Send price drop notifications to wishlist users."""
         discount_percent = round((float(old_price) - float(new_price)) / float(old_price) * 100, 1)
         
-        wishlist_items = WishlistItem.objects.filter(
-            product=product,
-            notify_on_price_drop=True
-        ).select_related('wishlist__customer')
-
-        notifications = []
-        for item in wishlist_items:
-            user = item.wishlist.customer
-            if user.notify_price_drops:
-                notifications.append(
-                    Notification(
-                        user=user,
-                        notification_type='price_drop',
-                        title=f'Fiyat Düştü! %{discount_percent} İndirim',
-                        message=f'{product.name} ürününün fiyatı {old_price}₺ yerine {new_price}₺ oldu!',
-                        related_product=product
-                    )
-                )
+        # Tercihi kapalı olanlar SQL'de elenir (tercih kaydı olmayanlar varsayılan olarak açık)
+        customer_ids = (
+            WishlistItem.objects.filter(product=product, notify_on_price_drop=True)
+            .exclude(wishlist__customer__notification_preferences__notify_price_drops=False)
+            .values_list('wishlist__customer_id', flat=True)
+            .distinct()
+        )
+
+        # Tüm alıcılar için aynı metin; bir kez oluşturulur
+        title = f'Fiyat Düştü! %{discount_percent} İndirim'
+        message = f'{product.name} ürününün fiyatı {old_price}₺ yerine {new_price}₺ oldu!'
+        notifications = [
+            Notification(
+                user_id=customer_id,
+                notification_type='price_drop',
+                title=title,
+                message=message,
+                related_product=product
+            )
+            for customer_id in customer_ids
+        ]
 
         if notifications:
             Notification.objects.bulk_create(notifications)
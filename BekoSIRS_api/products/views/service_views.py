@@ -8,8 +8,9 @@ from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from django.core.cache import cache
 from django.utils import timezone
-from django.db.models import Count, Sum, Avg, Prefetch
+from django.db.models import Count, Sum, Avg, Max, Prefetch, Q
 
 from products.models import (
     CustomUser, Product, Category, ProductOwnership,
@@ -20,6 +21,12 @@ from products.serializers import (
     ServiceRequestSerializer, ServiceRequestCreateSerializer,
     ServiceQueueSerializer
 )
+from products.services.service_counters import status_counts
+from products.signals import DASHBOARD_SUMMARY_CACHE_KEY
+
+# Özet kartları tüm admin/satıcılar için aynıdır; kısa süre önbellekte tutulur ve
+# ilgili kayıtlar değiştiğinde products.signals tarafından silinir.
+DASHBOARD_SUMMARY_CACHE_TTL = 60
 
 
 class ProductOwnershipViewSet(viewsets.ModelViewSet):
@@ -117,8 +124,8 @@ class ServiceRequestViewSet(viewsets.ModelViewSet):
             raise exceptions.PermissionDenied("Bu ürün için servis talebi oluşturamazsınız.")
 
         service_request = serializer.save(customer=self.request.user)
-        last_queue = ServiceQueue.objects.order_by('-queue_number').first()
-        queue_number = (last_queue.queue_number + 1) if last_queue else 1
+        last_number = ServiceQueue.objects.aggregate(last=Max('queue_number'))['last']
+        queue_number = (last_number or 0) + 1
 
         ServiceQueue.objects.create(
             service_request=service_request,
@@ -292,22 +299,38 @@ class DashboardSummaryView(APIView):
         if user.role not in ['admin', 'seller']:
             return Response({'error': 'Yetkisiz'}, status=status.HTTP_403_FORBIDDEN)
 
-        total_products = Product.objects.count()
+        data = cache.get_or_set(DASHBOARD_SUMMARY_CACHE_KEY, self.build_summary, DASHBOARD_SUMMARY_CACHE_TTL)
+        return Response(data)
+
+    @staticmethod
+    def build_summary():
+        """Özet verisini hesaplar (önbelleği ısıtan refresh_dashboard_cache komutu da kullanır)."""
+        # Tablo başına tek sorgu: sayımlar koşullu aggregate (filter=Q) ile birleştirildi.
+        product_stats = Product.objects.aggregate(
+            total=Count('id'),
+            low_stock=Count('id', filter=Q(stock__lt=10)),
+            out_of_stock=Count('id', filter=Q(stock=0)),
+        )
         total_categories = Category.objects.count()
         total_customers = CustomUser.objects.filter(role='customer').count()
         total_orders = ProductOwnership.objects.count()
 
-        pending_requests = ServiceRequest.objects.filter(status='pending').count()
-        in_progress_requests = ServiceRequest.objects.filter(status='in_progress').count()
-        completed_requests = ServiceRequest.objects.filter(status='completed').count()
-
-        pending_reviews = Review.objects.filter(is_approved=False).count()
-        avg_rating = Review.objects.filter(is_approved=True).aggregate(avg=Avg('rating'))['avg'] or 0
+        service_stats = status_counts()
+        review_stats = Review.objects.aggregate(
+            pending=Count('id', filter=Q(is_approved=False)),
+            avg=Avg('rating', filter=Q(is_approved=True)),
+        )
 
-        low_stock = Product.objects.filter(stock__lt=10).count()
-        out_of_stock = Product.objects.filter(stock=0).count()
+        total_products = product_stats['total']
+        low_stock = product_stats['low_stock']
+        out_of_stock = product_stats['out_of_stock']
+        pending_requests = service_stats['pending']
+        in_progress_requests = service_stats['in_progress']
+        completed_requests = service_stats['completed']
+        pending_reviews = review_stats['pending']
+        avg_rating = review_stats['avg'] or 0
 
-        return Response({
+        return {
             'products': {
                 'total': total_products,
                 'low_stock': low_stock,
@@ -325,4 +348,4 @@ class DashboardSummaryView(APIView):
                 'pending_approval': pending_reviews,
                 'average_rating': round(avg_rating, 1),
             }
-        })
+        }
@@ -1,3 +1,5 @@
+import heapq
+
 from rest_framework import views, response, permissions
 from products.models import Product, ProductAssignment
 from django.utils import timezone
@@ -30,30 +32,33 @@ class StockIntelligenceDashboardView(views.APIView):
         now = timezone.now()
         thirty_days_ago = now - timedelta(days=30)
 
-        products = Product.objects.select_related('category').all()
-        total_products = products.count()
+        # Ürünler aşağıda zaten tamamen dolaşılıyor; toplam ayrı bir COUNT yerine listeden alınır
+        products = list(Product.objects.select_related('category'))
+        total_products = len(products)
 
         critical_alerts = []
         warning_alerts = []
         opportunities = []
 
         # Son 30 günlük gerçek satış (velocity için)
+        # Sonuç satırları queryset önbelleğinde tutulmadan doğrudan sözlüğe akıtılır
         recent_sales_query = ProductAssignment.objects.filter(
             assigned_at__gte=thirty_days_ago
-        ).values('product_id').annotate(total_sales=Sum('quantity'))
-        sales_dict = {item['product_id']: item['total_sales'] for item in recent_sales_query}
+        ).values_list('product_id').annotate(total_sales=Sum('quantity')).order_by()
+        sales_dict = dict(recent_sales_query.iterator(chunk_size=1000))
 
         # Son 12 ayın aylık satışları (satış tahmin modeline lag girdisi için) — tek sorgu
         twelve_months_ago = now - timedelta(days=400)
         monthly_rows = (
             ProductAssignment.objects.filter(assigned_at__gte=twelve_months_ago)
             .annotate(yr=ExtractYear('assigned_at'), mo=ExtractMonth('assigned_at'))
-            .values('product_id', 'yr', 'mo')
+            .values_list('product_id', 'yr', 'mo')
             .annotate(q=Sum('quantity'))
+            .order_by()
         )
         sales_by_ym = {
-            (r['product_id'], r['yr'] * 100 + r['mo']): float(r['q'] or 0)
-            for r in monthly_rows
+            (product_id, yr * 100 + mo): float(q or 0)
+            for product_id, yr, mo, q in monthly_rows.iterator(chunk_size=1000)
         }
 
         # Eğitilmiş satış tahmin modeli (yoksa graceful fallback'e düşeriz)
@@ -187,17 +192,16 @@ class StockIntelligenceDashboardView(views.APIView):
         )
 
         # Gerçek düşük performanslılar (en az satan 10 ürün)
-        product_sales_list = []
-        for p in products:
-            sales = sales_dict.get(p.id, 0)
-            product_sales_list.append({
+        # Tüm ürün listesi kurulup sıralanmaz; sınırlı bir heap ile yalnızca 10 ürün tutulur
+        low_performers = [
+            {
                 "name": p.name,
                 "brand": p.brand,
                 "stock": p.stock,
-                "sales_count": sales,
-            })
-        product_sales_list.sort(key=lambda x: (x["sales_count"], -x["stock"]))
-        low_performers = product_sales_list[:10]
+                "sales_count": sales_dict.get(p.id, 0),
+            }
+            for p in heapq.nsmallest(10, products, key=lambda p: (sales_dict.get(p.id, 0), -p.stock))
+        ]
 
         data = {
             "summary": {
@@ -3,11 +3,11 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'bekosirs_backend.settings')
 django.setup()
 from products.models import CustomUser
 
+# save() fires post_save, which drops the cached authenticated user
 user = CustomUser.objects.filter(username='testt').first()
-if user:
+if user is not None:
     user.set_password('test')
-    user.save()
-    print(f"Password for '{user.username}' has been reset.")
-    print(f"Check match for 'test': {user.check_password('test')}")
+    user.save(update_fields=['password'])
+    print("Password for 'testt' has been reset.")
 else:
     print("User 'testt' not found")